@@ -398,12 +398,14 @@ export interface CancelResponse {
   success: boolean;
   message: string;
   task_id: string | null;
+  status: WorkerStatus;
 }
 
 export interface InterruptResponse {
   success: boolean;
   message: string;
   worker_id: string;
+  status: WorkerStatus;
 }
 
 export async function cancelWorkerTask(id: string): Promise<CancelResponse> {
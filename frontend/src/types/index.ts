@@ -474,6 +474,7 @@ export interface LogsResponse {
   total: number;
   offset: number;
   limit: number;
+  next_cursor: string | null;
 }
 
 export interface LogStats {
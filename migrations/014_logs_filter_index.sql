@@ -0,0 +1,26 @@
+-- Migration 014: Log indexes that serve GET /api/logs without a sort
+-- GET /api/logs can filter by component and level together and orders by
+-- timestamp DESC, id DESC. idx_logs_component and idx_logs_level each cover
+-- one column, so the other filter and the sort ran over every matching row.
+-- idx_logs_component is kept: component-only queries still need it to avoid
+-- a sort, since level sits between component and timestamp here.
+--
+-- SQLite appends the rowid (id) ascending to every index entry, so the
+-- timestamp DESC indexes from 004_logs hold (timestamp DESC, id ASC) and the
+-- id tiebreak still needed a temp B-tree. Declaring timestamp ascending lets a
+-- backward scan yield (timestamp DESC, id DESC) directly.
+
+DROP INDEX IF EXISTS idx_logs_timestamp;
+CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp);
+
+DROP INDEX IF EXISTS idx_logs_component;
+CREATE INDEX IF NOT EXISTS idx_logs_component ON logs(component, timestamp);
+
+DROP INDEX IF EXISTS idx_logs_level;
+CREATE INDEX IF NOT EXISTS idx_logs_level ON logs(level, timestamp);
+
+CREATE INDEX IF NOT EXISTS idx_logs_component_level
+ON logs(component, level, timestamp);
+
+-- Record migration
+INSERT OR IGNORE INTO _migrations (version, name) VALUES (14, '014_logs_filter_index');
@@ -0,0 +1,18 @@
+-- Migration 015: Order per-task and per-worker log lookups by index
+-- /api/logs/for-task and /api/logs/for-worker filter on one ID and return the
+-- newest entries first. The partial indexes from 004_logs only cover the ID,
+-- so every matching row was sorted in a temp B-tree before the LIMIT applied.
+-- Extending them with timestamp lets the lookup stop after LIMIT rows.
+-- timestamp is ascending on purpose: SQLite appends the rowid ascending, so a
+-- backward scan yields timestamp DESC, id DESC, which GET /api/logs also needs.
+
+DROP INDEX IF EXISTS idx_logs_task;
+CREATE INDEX IF NOT EXISTS idx_logs_task ON logs(task_id, timestamp)
+WHERE task_id IS NOT NULL;
+
+DROP INDEX IF EXISTS idx_logs_worker;
+CREATE INDEX IF NOT EXISTS idx_logs_worker ON logs(worker_id, timestamp)
+WHERE worker_id IS NOT NULL;
+
+-- Record migration
+INSERT OR IGNORE INTO _migrations (version, name) VALUES (15, '015_logs_owner_timestamp_index');
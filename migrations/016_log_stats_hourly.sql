@@ -0,0 +1,48 @@
+-- Migration 016: Hourly log counts for /api/logs/stats
+-- The stats endpoint grouped every log in the window on each request.
+-- This keeps per-hour counts by (level, component), maintained by triggers
+-- in the same way logs_fts is, so the window is summed from at most one
+-- row per hour and dimension. Only the partial first hour reads logs.
+
+CREATE TABLE IF NOT EXISTS log_stats_hourly (
+    hour TEXT NOT NULL,  -- timestamp truncated to the hour, e.g. 2026-01-31T13
+    level TEXT NOT NULL,
+    component TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (hour, level, component)
+) WITHOUT ROWID;
+
+-- Backfill from existing logs
+INSERT OR IGNORE INTO log_stats_hourly (hour, level, component, count)
+SELECT substr(timestamp, 1, 13), level, component, COUNT(*)
+FROM logs
+GROUP BY substr(timestamp, 1, 13), level, component;
+
+-- Triggers to keep the counts in sync
+CREATE TRIGGER IF NOT EXISTS logs_stats_ai AFTER INSERT ON logs BEGIN
+    INSERT INTO log_stats_hourly (hour, level, component, count)
+    VALUES (substr(new.timestamp, 1, 13), new.level, new.component, 1)
+    ON CONFLICT (hour, level, component) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS logs_stats_ad AFTER DELETE ON logs BEGIN
+    UPDATE log_stats_hourly SET count = count - 1
+    WHERE hour = substr(old.timestamp, 1, 13) AND level = old.level AND component = old.component;
+    DELETE FROM log_stats_hourly
+    WHERE hour = substr(old.timestamp, 1, 13) AND level = old.level AND component = old.component
+    AND count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS logs_stats_au AFTER UPDATE OF timestamp, level, component ON logs BEGIN
+    UPDATE log_stats_hourly SET count = count - 1
+    WHERE hour = substr(old.timestamp, 1, 13) AND level = old.level AND component = old.component;
+    DELETE FROM log_stats_hourly
+    WHERE hour = substr(old.timestamp, 1, 13) AND level = old.level AND component = old.component
+    AND count <= 0;
+    INSERT INTO log_stats_hourly (hour, level, component, count)
+    VALUES (substr(new.timestamp, 1, 13), new.level, new.component, 1)
+    ON CONFLICT (hour, level, component) DO UPDATE SET count = count + 1;
+END;
+
+-- Record migration
+INSERT OR IGNORE INTO _migrations (version, name) VALUES (16, '016_log_stats_hourly');
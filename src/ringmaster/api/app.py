@@ -7,6 +7,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from ringmaster.api.middleware import UploadSizeLimitMiddleware
 from ringmaster.api.routes import (
     chat,
     decisions,
@@ -55,6 +56,15 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Reject oversized uploads from Content-Length before the body is parsed.
+    # Added before CORS, which Starlette makes the outer layer, so 413s get CORS headers.
+    app.add_middleware(
+        UploadSizeLimitMiddleware,
+        max_body_size=chat.MAX_UPLOAD_SIZE + chat.MAX_UPLOAD_OVERHEAD,
+        detail=chat.UPLOAD_TOO_LARGE_DETAIL,
+        path_pattern=r"/api/chat/projects/[^/]+/upload",
+    )
+
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -3,8 +3,14 @@
 from fastapi import Request
 
 from ringmaster.db import Database
+from ringmaster.worker.output_buffer import WorkerOutputBuffer, output_buffer
 
 
 async def get_db(request: Request) -> Database:
     """Get the database instance from app state."""
     return request.app.state.db
+
+
+async def get_output_buffer() -> WorkerOutputBuffer:
+    """Get the worker output buffer shared with the executor."""
+    return output_buffer
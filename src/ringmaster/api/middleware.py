@@ -0,0 +1,48 @@
+"""ASGI middleware for the Ringmaster API."""
+
+import re
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class UploadSizeLimitMiddleware:
+    """Reject uploads whose declared Content-Length exceeds a limit.
+
+    FastAPI parses multipart bodies before the route handler runs, so the
+    handler's own size check only fires after the whole file has been
+    received. This checks the header first and answers 413 without reading
+    the body. Requests without a Content-Length still fall through to the
+    handler's check.
+
+    Only POSTs whose path fully matches ``path_pattern`` are checked. Register
+    this before CORSMiddleware so the 413 response still gets CORS headers.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_body_size: int,
+        detail: str,
+        path_pattern: str,
+    ) -> None:
+        self.app = app
+        self.max_body_size = max_body_size
+        self.detail = detail
+        self.path_pattern = re.compile(path_pattern)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "POST"
+            and self.path_pattern.fullmatch(scope["path"])
+        ):
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body_size:
+                        response = JSONResponse({"detail": self.detail}, status_code=413)
+                        await response(scope, receive, send)
+                        return
+                    break
+
+        await self.app(scope, receive, send)
@@ -25,6 +25,9 @@ router = APIRouter()
 # File upload configuration
 UPLOAD_DIR = Path("uploads")
 MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10MB
+# Request bodies may exceed MAX_UPLOAD_SIZE by this much for the multipart envelope
+MAX_UPLOAD_OVERHEAD = 64 * 1024
+UPLOAD_TOO_LARGE_DETAIL = f"File too large. Maximum size is {MAX_UPLOAD_SIZE // (1024 * 1024)}MB."
 ALLOWED_MIME_TYPES = {
     # Images
     "image/jpeg", "image/png", "image/gif", "image/webp", "image/svg+xml",
@@ -281,10 +284,7 @@ async def upload_file(
     size = len(contents)
 
     if size > MAX_UPLOAD_SIZE:
-        raise HTTPException(
-            status_code=413,
-            detail=f"File too large. Maximum size is {MAX_UPLOAD_SIZE // (1024 * 1024)}MB.",
-        )
+        raise HTTPException(status_code=413, detail=UPLOAD_TOO_LARGE_DETAIL)
 
     if size == 0:
         raise HTTPException(status_code=400, detail="Empty file")
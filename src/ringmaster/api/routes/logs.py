@@ -6,23 +6,42 @@ Based on docs/09-remaining-decisions.md section 20:
 - Get logs relevant to a specific bead/task for debugging
 """
 
+import base64
+import binascii
 import json
 import logging
+import sqlite3
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from pydantic import BaseModel, TypeAdapter
 
 from ringmaster.api.deps import get_db
 from ringmaster.db import Database
 from ringmaster.domain.enums import LogComponent, LogLevel
 from ringmaster.events import event_bus
-from ringmaster.events.types import EventType
+from ringmaster.events.types import Event, EventType
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Maximum rows removed per transaction when clearing old logs
+CLEAR_LOGS_BATCH_SIZE = 5000
+
+# Maximum entries per bulk create; the batch is re-fetched and published at once
+MAX_BULK_LOGS = 1000
+
+# Kept as one constant so every insert reuses the same prepared statement
+_INSERT_LOG_SQL = """
+    INSERT INTO logs (timestamp, level, component, message, task_id, worker_id, project_id, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Fixed by the enums, so built once rather than per request
+_LOG_COMPONENTS = tuple(component.value for component in LogComponent)
+_LOG_LEVELS = tuple(level.value for level in LogLevel)
+
 
 class LogEntryResponse(BaseModel):
     """Log entry response model."""
@@ -57,48 +76,58 @@ class LogsResponse(BaseModel):
     total: int
     offset: int
     limit: int
+    next_cursor: str | None = None
 
 
-def _row_to_log_entry(row) -> LogEntryResponse:
-    """Convert database row to LogEntryResponse."""
-    data = None
-    if row["data"]:
+_LOG_LIST_ADAPTER = TypeAdapter(list[LogEntryResponse])
+
+
+class LogStatsResponse(BaseModel):
+    """Response model for log statistics."""
+
+    period_hours: int
+    total: int
+    errors: int
+    by_level: dict[str, int]
+    by_component: dict[str, int]
+
+
+class ClearLogsResponse(BaseModel):
+    """Response model for clearing old logs."""
+
+    deleted: int
+    cutoff: str
+
+
+def _log_fields(row) -> dict:
+    """Convert a database row to LogEntryResponse fields."""
+    fields = dict(row)
+    if fields["data"]:
         try:
-            data = json.loads(row["data"])
+            fields["data"] = json.loads(fields["data"])
         except json.JSONDecodeError:
-            data = {"raw": row["data"]}
-
-    return LogEntryResponse(
-        id=row["id"],
-        timestamp=row["timestamp"],
-        level=row["level"],
-        component=row["component"],
-        message=row["message"],
-        task_id=row["task_id"],
-        worker_id=row["worker_id"],
-        project_id=row["project_id"],
-        data=data,
-    )
+            fields["data"] = {"raw": fields["data"]}
+    else:
+        fields["data"] = None
+    return fields
 
 
-@router.post("", status_code=201)
-async def create_log(
-    log_entry: LogEntryCreate,
-    db: Annotated[Database, Depends(get_db)],
-) -> LogEntryResponse:
-    """Create a new log entry.
+def _row_to_log_entry(row) -> LogEntryResponse:
+    """Convert database row to LogEntryResponse."""
+    return LogEntryResponse.model_validate(_log_fields(row))
 
-    Used by system components to write structured logs.
-    """
-    logger.info(f"Creating log entry: level={log_entry.level.value}, component={log_entry.component.value}, task_id={log_entry.task_id}, worker_id={log_entry.worker_id}")
-    timestamp = datetime.now(UTC).isoformat()
+
+def _rows_to_log_entries(rows) -> list[LogEntryResponse]:
+    """Convert database rows to LogEntryResponses with one validation call."""
+    return _LOG_LIST_ADAPTER.validate_python([_log_fields(row) for row in rows])
+
+
+async def _insert_log(db: Database, log_entry: LogEntryCreate, timestamp: str) -> int:
+    """Insert a log entry without committing and return its row ID."""
     data_json = json.dumps(log_entry.data) if log_entry.data else None
 
     cursor = await db.execute(
-        """
-        INSERT INTO logs (timestamp, level, component, message, task_id, worker_id, project_id, data)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+        _INSERT_LOG_SQL,
         (
             timestamp,
             log_entry.level.value,
@@ -110,17 +139,13 @@ async def create_log(
             data_json,
         ),
     )
-    await db.commit()
-
-    row = await db.fetchone("SELECT * FROM logs WHERE id = ?", (cursor.lastrowid,))
-    if not row:
-        raise HTTPException(status_code=500, detail="Failed to create log entry")
+    return cursor.lastrowid
 
-    log_response = _row_to_log_entry(row)
 
-    # Emit event for WebSocket streaming
-    await event_bus.emit(
-        EventType.LOG_CREATED,
+def _log_created_event(log_response: LogEntryResponse) -> Event:
+    """Build the LOG_CREATED event used for WebSocket streaming."""
+    return Event(
+        type=EventType.LOG_CREATED,
         data={
             "id": log_response.id,
             "timestamp": log_response.timestamp,
@@ -134,10 +159,95 @@ async def create_log(
         project_id=log_response.project_id,
     )
 
+
+def _encode_cursor(timestamp: str, log_id: int) -> str:
+    """Encode a keyset pagination position as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps([timestamp, log_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        timestamp, log_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+    if not isinstance(timestamp, str) or not isinstance(log_id, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return timestamp, log_id
+
+
+@router.post("", status_code=201)
+async def create_log(
+    log_entry: LogEntryCreate,
+    db: Annotated[Database, Depends(get_db)],
+) -> LogEntryResponse:
+    """Create a new log entry.
+
+    Used by system components to write structured logs.
+    """
+    logger.info(f"Creating log entry: level={log_entry.level.value}, component={log_entry.component.value}, task_id={log_entry.task_id}, worker_id={log_entry.worker_id}")
+    timestamp = datetime.now(UTC).isoformat()
+
+    log_id = await _insert_log(db, log_entry, timestamp)
+    await db.commit()
+
+    row = await db.fetchone("SELECT * FROM logs WHERE id = ?", (log_id,))
+    if not row:
+        raise HTTPException(status_code=500, detail="Failed to create log entry")
+
+    log_response = _row_to_log_entry(row)
+    await event_bus.publish(_log_created_event(log_response))
+
     logger.info(f"Log entry created with ID {log_response.id}")
     return log_response
 
 
+@router.post("/bulk", status_code=201)
+async def create_logs_bulk(
+    log_entries: Annotated[list[LogEntryCreate], Body(max_length=MAX_BULK_LOGS)],
+    db: Annotated[Database, Depends(get_db)],
+) -> list[LogEntryResponse]:
+    """Create several log entries in a single transaction.
+
+    Either every entry is stored or none is. Entries are returned in request
+    order.
+    """
+    logger.info(f"Creating {len(log_entries)} log entries in bulk")
+    if not log_entries:
+        return []
+
+    timestamp = datetime.now(UTC).isoformat()
+    # The connection is shared, so undo a partial batch before anything else commits it
+    await db.execute("SAVEPOINT bulk_logs")
+    try:
+        log_ids = [await _insert_log(db, log_entry, timestamp) for log_entry in log_entries]
+    except BaseException as e:
+        await db.execute("ROLLBACK TO SAVEPOINT bulk_logs")
+        await db.execute("RELEASE SAVEPOINT bulk_logs")
+        if isinstance(e, sqlite3.IntegrityError):
+            logger.warning(f"Rejected bulk log batch: {e}")
+            raise HTTPException(
+                status_code=400, detail="Log entry references an unknown task, worker or project"
+            ) from e
+        raise
+    await db.execute("RELEASE SAVEPOINT bulk_logs")
+    await db.commit()
+
+    placeholders = ", ".join("?" for _ in log_ids)
+    rows = await db.fetchall(
+        f"SELECT * FROM logs WHERE id IN ({placeholders}) ORDER BY id",
+        tuple(log_ids),
+    )
+    if len(rows) != len(log_ids):
+        raise HTTPException(status_code=500, detail="Failed to create log entries")
+
+    log_responses = _rows_to_log_entries(rows)
+    await event_bus.publish_many([_log_created_event(r) for r in log_responses])
+
+    logger.info(f"Created {len(log_responses)} log entries in bulk")
+    return log_responses
+
+
 @router.get("")
 async def list_logs(
     db: Annotated[Database, Depends(get_db)],
@@ -148,6 +258,7 @@ async def list_logs(
     project_id: str | None = Query(default=None, description="Filter by project ID"),
     since: str | None = Query(default=None, description="ISO timestamp - show logs after this time"),
     search: str | None = Query(default=None, description="Full-text search in messages"),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page"),
     offset: int = Query(default=0, ge=0, description="Number of records to skip"),
     limit: int = Query(default=100, ge=1, le=1000, description="Max records to return"),
 ) -> LogsResponse:
@@ -155,8 +266,12 @@ async def list_logs(
 
     Supports filtering by component, level, task, worker, project, and time range.
     Full-text search is supported via the 'search' parameter.
+
+    Pages can be fetched by offset or, for deep paging, by passing the previous
+    page's next_cursor, which seeks straight to the next row instead of
+    skipping over every earlier one.
     """
-    logger.info(f"Listing logs with filters - component={component}, level={level}, task_id={task_id}, worker_id={worker_id}, project_id={project_id}, since={since}, search={search}, offset={offset}, limit={limit}")
+    logger.info(f"Listing logs with filters - component={component}, level={level}, task_id={task_id}, worker_id={worker_id}, project_id={project_id}, since={since}, search={search}, cursor={cursor}, offset={offset}, limit={limit}")
     query = "SELECT * FROM logs"
     count_query = "SELECT COUNT(*) as total FROM logs"
     conditions: list[str] = []
@@ -200,15 +315,27 @@ async def list_logs(
     count_row = await db.fetchone(count_query, tuple(params))
     total = count_row["total"] if count_row else 0
 
-    # Add ordering and pagination
-    query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-    params.extend([limit, offset])
+    # Seek past the cursor position; the total still covers every match
+    if cursor:
+        query += " AND " if conditions else " WHERE "
+        query += "(timestamp, id) < (?, ?)"
+        params.extend(_decode_cursor(cursor))
+
+    # Add ordering and pagination, fetching one extra row to detect a next page
+    query += " ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+    params.extend([limit + 1, offset])
 
     rows = await db.fetchall(query, tuple(params))
-    logs = [_row_to_log_entry(row) for row in rows]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1]["timestamp"], rows[-1]["id"])
+    logs = _rows_to_log_entries(rows)
 
     logger.info(f"Retrieved {len(logs)} logs out of {total} total matching filters")
-    return LogsResponse(logs=logs, total=total, offset=offset, limit=limit)
+    return LogsResponse(
+        logs=logs, total=total, offset=offset, limit=limit, next_cursor=next_cursor
+    )
 
 
 @router.get("/recent")
@@ -236,7 +363,7 @@ async def get_recent_logs(
     )
 
     logger.info(f"Retrieved {len(rows)} recent logs since {cutoff_str}")
-    return [_row_to_log_entry(row) for row in rows]
+    return _rows_to_log_entries(rows)
 
 
 @router.get("/for-task/{task_id}")
@@ -267,7 +394,7 @@ async def get_logs_for_task(
     )
 
     logger.info(f"Retrieved {len(rows)} logs for task {task_id}")
-    return [_row_to_log_entry(row) for row in rows]
+    return _rows_to_log_entries(rows)
 
 
 @router.get("/for-worker/{worker_id}")
@@ -297,32 +424,28 @@ async def get_logs_for_worker(
     )
 
     logger.info(f"Retrieved {len(rows)} logs for worker {worker_id}")
-    return [_row_to_log_entry(row) for row in rows]
+    return _rows_to_log_entries(rows)
 
 
 @router.get("/components")
 async def get_log_components() -> list[str]:
     """Get list of available log components."""
-    logger.info("Getting list of available log components")
-    components = [c.value for c in LogComponent]
-    logger.info(f"Returning {len(components)} log components")
-    return components
+    logger.info(f"Returning {len(_LOG_COMPONENTS)} log components")
+    return list(_LOG_COMPONENTS)
 
 
 @router.get("/levels")
 async def get_log_levels() -> list[str]:
     """Get list of available log levels."""
-    logger.info("Getting list of available log levels")
-    levels = [level.value for level in LogLevel]
-    logger.info(f"Returning {len(levels)} log levels")
-    return levels
+    logger.info(f"Returning {len(_LOG_LEVELS)} log levels")
+    return list(_LOG_LEVELS)
 
 
 @router.get("/stats")
 async def get_log_stats(
     db: Annotated[Database, Depends(get_db)],
     hours: int = Query(default=24, ge=1, le=720, description="Hours to look back"),
-) -> dict:
+) -> LogStatsResponse:
     """Get log statistics for the specified time period.
 
     Returns counts grouped by level and component.
@@ -330,55 +453,43 @@ async def get_log_stats(
     logger.info(f"Getting log statistics for the last {hours} hours")
     cutoff = datetime.now(UTC) - timedelta(hours=hours)
     cutoff_str = cutoff.isoformat()
+    # Whole hours after the cutoff come from the hourly rollup; only the
+    # partial hour containing the cutoff is counted from the logs table
+    cutoff_hour = cutoff_str[:13]
+    next_hour = cutoff.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
 
-    # Count by level
-    level_rows = await db.fetchall(
-        """
-        SELECT level, COUNT(*) as count
-        FROM logs
-        WHERE timestamp >= ?
-        GROUP BY level
-        """,
-        (cutoff_str,),
-    )
-    by_level = {row["level"]: row["count"] for row in level_rows}
-
-    # Count by component
-    component_rows = await db.fetchall(
+    rows = await db.fetchall(
         """
-        SELECT component, COUNT(*) as count
-        FROM logs
-        WHERE timestamp >= ?
-        GROUP BY component
+        SELECT level, component, SUM(count) as count FROM (
+            SELECT level, component, count
+            FROM log_stats_hourly
+            WHERE hour > ?
+            UNION ALL
+            SELECT level, component, COUNT(*)
+            FROM logs
+            WHERE timestamp >= ? AND timestamp < ?
+            GROUP BY level, component
+        )
+        GROUP BY level, component
         """,
-        (cutoff_str,),
+        (cutoff_hour, cutoff_str, next_hour.isoformat()),
     )
-    by_component = {row["component"]: row["count"] for row in component_rows}
 
-    # Total count
-    total_row = await db.fetchone(
-        "SELECT COUNT(*) as count FROM logs WHERE timestamp >= ?",
-        (cutoff_str,),
+    by_level: dict[str, int] = {}
+    by_component: dict[str, int] = {}
+    for row in rows:
+        by_level[row["level"]] = by_level.get(row["level"], 0) + row["count"]
+        by_component[row["component"]] = by_component.get(row["component"], 0) + row["count"]
+    total = sum(by_level.values())
+    errors = by_level.get("error", 0) + by_level.get("critical", 0)
+
+    stats = LogStatsResponse(
+        period_hours=hours,
+        total=total,
+        errors=errors,
+        by_level=by_level,
+        by_component=by_component,
     )
-    total = total_row["count"] if total_row else 0
-
-    # Error count
-    error_row = await db.fetchone(
-        """
-        SELECT COUNT(*) as count FROM logs
-        WHERE timestamp >= ? AND level IN ('error', 'critical')
-        """,
-        (cutoff_str,),
-    )
-    errors = error_row["count"] if error_row else 0
-
-    stats = {
-        "period_hours": hours,
-        "total": total,
-        "errors": errors,
-        "by_level": by_level,
-        "by_component": by_component,
-    }
     logger.info(f"Log statistics calculated: {total} total logs, {errors} errors in last {hours} hours")
     return stats
 
@@ -387,7 +498,7 @@ async def get_log_stats(
 async def clear_old_logs(
     db: Annotated[Database, Depends(get_db)],
     days: int = Query(default=7, ge=1, le=365, description="Delete logs older than N days"),
-) -> dict:
+) -> ClearLogsResponse:
     """Delete logs older than the specified number of days.
 
     Returns the number of logs deleted.
@@ -396,17 +507,23 @@ async def clear_old_logs(
     cutoff = datetime.now(UTC) - timedelta(days=days)
     cutoff_str = cutoff.isoformat()
 
-    # Get count before deletion
-    count_row = await db.fetchone(
-        "SELECT COUNT(*) as count FROM logs WHERE timestamp < ?",
-        (cutoff_str,),
-    )
-    count = count_row["count"] if count_row else 0
-
-    # Delete old logs
-    await db.execute("DELETE FROM logs WHERE timestamp < ?", (cutoff_str,))
-    await db.commit()
-
-    result = {"deleted": count, "cutoff": cutoff_str}
+    # Delete in batches, committing between them, so a large backlog never
+    # holds the write lock or grows the journal in one long transaction
+    count = 0
+    while True:
+        cursor = await db.execute(
+            """
+            DELETE FROM logs WHERE id IN (
+                SELECT id FROM logs WHERE timestamp < ? LIMIT ?
+            )
+            """,
+            (cutoff_str, CLEAR_LOGS_BATCH_SIZE),
+        )
+        await db.commit()
+        count += cursor.rowcount
+        if cursor.rowcount < CLEAR_LOGS_BATCH_SIZE:
+            break
+
+    result = ClearLogsResponse(deleted=count, cutoff=cutoff_str)
     logger.info(f"Deleted {count} logs older than {cutoff_str}")
     return result
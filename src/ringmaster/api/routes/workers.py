@@ -7,10 +7,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from ringmaster.api.deps import get_db
+from ringmaster.api.deps import get_db, get_output_buffer
 from ringmaster.db import Database, WorkerRepository
 from ringmaster.domain import TaskStatus, Worker, WorkerStatus
-from ringmaster.worker.output_buffer import output_buffer
+from ringmaster.worker.output_buffer import WorkerOutputBuffer
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -421,6 +421,7 @@ class OutputResponse(BaseModel):
 @router.get("/{worker_id}/output")
 async def get_worker_output(
     db: Annotated[Database, Depends(get_db)],
+    output_buffer: Annotated[WorkerOutputBuffer, Depends(get_output_buffer)],
     worker_id: str,
     limit: int = Query(default=100, ge=1, le=1000),
     since_line: int = Query(default=0, ge=0),
@@ -466,6 +467,7 @@ async def get_worker_output(
 @router.get("/{worker_id}/output/stream")
 async def stream_worker_output(
     db: Annotated[Database, Depends(get_db)],
+    output_buffer: Annotated[WorkerOutputBuffer, Depends(get_output_buffer)],
     worker_id: str,
 ) -> StreamingResponse:
     """Stream output for a worker using Server-Sent Events (SSE).
@@ -526,7 +528,9 @@ async def stream_worker_output(
 
 
 @router.get("/output/stats")
-async def get_output_stats() -> dict:
+async def get_output_stats(
+    output_buffer: Annotated[WorkerOutputBuffer, Depends(get_output_buffer)],
+) -> dict:
     """Get output buffer statistics for all workers.
 
     Returns:
@@ -548,6 +552,7 @@ class CancelResponse(BaseModel):
     success: bool
     message: str
     task_id: str | None = None
+    status: WorkerStatus
 
 
 class InterruptResponse(BaseModel):
@@ -556,6 +561,7 @@ class InterruptResponse(BaseModel):
     success: bool
     message: str
     worker_id: str
+    status: WorkerStatus
 
 
 @router.post("/{worker_id}/cancel")
@@ -625,6 +631,7 @@ async def cancel_worker_task(
         success=True,
         message=f"Cancelled task {task_id} on worker {worker_id}",
         task_id=task_id,
+        status=worker.status,
     )
 
     logger.info(f"Worker task cancelled successfully: worker_id={worker_id}, task_id={task_id}")
@@ -685,6 +692,7 @@ async def pause_worker(
         success=True,
         message=f"Worker {worker_id} paused. Current task will complete.",
         worker_id=worker_id,
+        status=worker.status,
     )
 
     logger.info(f"Worker paused successfully: worker_id={worker_id}, previous_status={previous_status.value}, current_task_id={worker.current_task_id}")
@@ -943,6 +951,7 @@ async def kill_worker(
         success=True,
         message=f"Worker {worker_id} killed",
         worker_id=worker_id,
+        status=worker.status,
     )
 
     logger.info(f"Worker killed successfully: worker_id={worker_id}, tmux_session_killed={success}")
@@ -1065,6 +1074,7 @@ class WorkerHealthResponse(BaseModel):
 @router.get("/{worker_id}/health")
 async def get_worker_health(
     db: Annotated[Database, Depends(get_db)],
+    output_buffer: Annotated[WorkerOutputBuffer, Depends(get_output_buffer)],
     worker_id: str,
 ) -> WorkerHealthResponse:
     """Get health status for a worker based on output monitoring.
@@ -11,27 +11,46 @@ logger = logging.getLogger(__name__)
 # Global database instance
 _database: "Database | None" = None
 
+# Prepared statements kept per connection. sqlite3 defaults to 128, which the
+# repositories and routes together exceed, evicting hot statements such as the
+# log insert before they are reused.
+STATEMENT_CACHE_SIZE = 512
+
 
 class Database:
     """SQLite database wrapper with async support."""
 
-    def __init__(self, db_path: str | Path):
+    def __init__(
+        self,
+        db_path: str | Path,
+        durable: bool = True,
+        template: str | Path | None = None,
+    ):
         self.db_path = Path(db_path)
+        # Non-durable databases (e.g. in tests) skip fsyncs and on-disk journals
+        self.durable = durable
+        # Already-migrated database copied in on connect, so only newer
+        # migrations run (e.g. tests sharing one migrated schema)
+        self.template = Path(template) if template is not None else None
         self._connection: aiosqlite.Connection | None = None
 
     async def connect(self) -> None:
         """Open database connection and run migrations."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._connection = await aiosqlite.connect(self.db_path)
+        self._connection = await aiosqlite.connect(
+            self.db_path, cached_statements=STATEMENT_CACHE_SIZE
+        )
         self._connection.row_factory = aiosqlite.Row
 
-        # Enable WAL mode and other pragmas
-        await self._connection.execute("PRAGMA journal_mode = WAL")
-        await self._connection.execute("PRAGMA synchronous = NORMAL")
-        await self._connection.execute("PRAGMA foreign_keys = ON")
-        await self._connection.execute("PRAGMA busy_timeout = 5000")
+        if self.template is not None:
+            async with aiosqlite.connect(self.template) as source:
+                await source.backup(self._connection)
 
+        await self._apply_pragmas()
         await self._run_migrations()
+        if not self.durable:
+            # The initial migration switches to WAL, so re-apply the throwaway settings
+            await self._apply_pragmas()
         logger.info(f"Connected to database: {self.db_path}")
 
     async def disconnect(self) -> None:
@@ -80,6 +99,21 @@ class Database:
         """Commit the current transaction."""
         await self.connection.commit()
 
+    async def _apply_pragmas(self) -> None:
+        """Configure journaling, durability, and connection behaviour."""
+        if self.durable:
+            # Enable WAL mode and other pragmas
+            await self.connection.execute("PRAGMA journal_mode = WAL")
+            await self.connection.execute("PRAGMA synchronous = NORMAL")
+        else:
+            # Throwaway database: keep the journal in memory and never fsync
+            await self.connection.execute("PRAGMA journal_mode = MEMORY")
+            await self.connection.execute("PRAGMA synchronous = OFF")
+            await self.connection.execute("PRAGMA temp_store = MEMORY")
+            await self.connection.execute("PRAGMA locking_mode = EXCLUSIVE")
+        await self.connection.execute("PRAGMA foreign_keys = ON")
+        await self.connection.execute("PRAGMA busy_timeout = 5000")
+
     async def _run_migrations(self) -> None:
         """Run pending SQL migrations."""
         migrations_dir = Path(__file__).parent.parent.parent.parent / "migrations"
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from ringmaster.events.types import Event, EventType
@@ -21,6 +21,10 @@ class EventBus:
     def __init__(self) -> None:
         self._subscribers: dict[str, asyncio.Queue[Event]] = {}
         self._callbacks: list[Callable[[Event], Any]] = []
+        self._typed_callbacks: dict[EventType, list[Callable[[Event], Any]]] = {}
+        # Strong references to running async callbacks so they are not
+        # garbage collected before they finish
+        self._pending: set[asyncio.Task[Any]] = set()
         self._lock = asyncio.Lock()
 
     async def subscribe(self, subscriber_id: str, project_id: str | None = None) -> asyncio.Queue[Event]:
@@ -47,35 +51,81 @@ class EventBus:
                 del self._subscribers[subscriber_id]
                 logger.debug(f"Subscriber {subscriber_id} disconnected")
 
-    def add_callback(self, callback: Callable[[Event], Any]) -> None:
-        """Add a callback to be called for every event."""
-        self._callbacks.append(callback)
+    def add_callback(
+        self,
+        callback: Callable[[Event], Any],
+        event_types: Iterable[EventType] | None = None,
+    ) -> None:
+        """Add a callback for all events, or only the given event types.
+
+        Args:
+            callback: Called with each matching event
+            event_types: Only call for these event types (None = all events)
+        """
+        if event_types is None:
+            self._callbacks.append(callback)
+            return
+        for event_type in event_types:
+            self._typed_callbacks.setdefault(event_type, []).append(callback)
 
     def remove_callback(self, callback: Callable[[Event], Any]) -> None:
         """Remove a callback."""
         if callback in self._callbacks:
             self._callbacks.remove(callback)
+        for event_type, callbacks in list(self._typed_callbacks.items()):
+            if callback in callbacks:
+                callbacks.remove(callback)
+                if not callbacks:
+                    del self._typed_callbacks[event_type]
 
     async def publish(self, event: Event) -> None:
         """Publish an event to all subscribers."""
-        logger.debug(f"Publishing event: {event.type.value}")
+        await self.publish_many([event])
 
-        # Notify all subscribers
+    async def publish_many(self, events: list[Event]) -> None:
+        """Publish several events in order.
+
+        The subscriber lock is taken once for the whole batch rather than
+        once per event.
+        """
+        for event in events:
+            logger.debug(f"Publishing event: {event.type.value}")
+
+        # Notify all subscribers; their queues are unbounded, so delivery
+        # never waits on a slow WebSocket consumer
         async with self._lock:
             for subscriber_id, queue in list(self._subscribers.items()):
+                for event in events:
+                    try:
+                        queue.put_nowait(event)
+                    except Exception as e:
+                        logger.error(f"Failed to send event to {subscriber_id}: {e}")
+
+        # Call all callbacks, plus those registered for this event type.
+        # Async callbacks run as tasks so a slow handler never holds up
+        # the publisher; see flush() to wait for them.
+        for event in events:
+            for callback in [*self._callbacks, *self._typed_callbacks.get(event.type, ())]:
                 try:
-                    await queue.put(event)
+                    result = callback(event)
                 except Exception as e:
-                    logger.error(f"Failed to send event to {subscriber_id}: {e}")
-
-        # Call all callbacks
-        for callback in self._callbacks:
-            try:
-                result = callback(event)
+                    logger.error(f"Callback error: {e}")
+                    continue
                 if asyncio.iscoroutine(result):
-                    await result
-            except Exception as e:
-                logger.error(f"Callback error: {e}")
+                    task = asyncio.create_task(result)
+                    self._pending.add(task)
+                    task.add_done_callback(self._callback_done)
+
+    def _callback_done(self, task: asyncio.Task[Any]) -> None:
+        """Drop a finished async callback and log any error it raised."""
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Callback error: {task.exception()}")
+
+    async def flush(self) -> None:
+        """Wait for all async callbacks scheduled so far to finish."""
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
 
     async def emit(
         self,
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
@@ -45,6 +46,18 @@ class WorkerOutputBuffer:
             worker_id: The worker ID.
             line: The output line.
         """
+        await self.write_many(worker_id, [line])
+
+    async def write_many(self, worker_id: str, lines: Iterable[str]) -> None:
+        """Write several lines of output for a worker in order.
+
+        Takes the lock once for the whole batch, so callers holding a
+        multi-line chunk avoid one lock round trip per line.
+
+        Args:
+            worker_id: The worker ID.
+            lines: The output lines.
+        """
         async with self._lock:
             # Initialize buffer if needed
             if worker_id not in self._buffers:
@@ -52,36 +65,45 @@ class WorkerOutputBuffer:
                 self._line_counters[worker_id] = 0
                 self._overflow_warnings[worker_id] = False
 
-            # Create output line
-            self._line_counters[worker_id] += 1
-            output_line = OutputLine(
-                line=line,
-                line_number=self._line_counters[worker_id],
-            )
-
-            # Add to buffer
-            self._buffers[worker_id].append(output_line)
-
-            # Notify subscribers
-            if worker_id in self._subscribers:
-                for queue in self._subscribers[worker_id].values():
-                    try:
-                        queue.put_nowait(output_line)
-                        # Reset overflow warning flag on successful put
-                        if self._overflow_warnings.get(worker_id, False):
-                            self._overflow_warnings[worker_id] = False
-                    except asyncio.QueueFull:
-                        # Log warning only once when overflow starts
-                        if not self._overflow_warnings.get(worker_id, False):
-                            logger.warning(f"Output buffer queue full for worker {worker_id}, dropping oldest line")
-                            self._overflow_warnings[worker_id] = True
-
-                        # Drop oldest if queue is full
-                        try:
-                            queue.get_nowait()
-                            queue.put_nowait(output_line)
-                        except asyncio.QueueEmpty:
-                            pass
+            buffer = self._buffers[worker_id]
+            subscribers = self._subscribers.get(worker_id)
+            for line in lines:
+                # Create output line
+                self._line_counters[worker_id] += 1
+                output_line = OutputLine(
+                    line=line,
+                    line_number=self._line_counters[worker_id],
+                )
+
+                # Add to buffer
+                buffer.append(output_line)
+
+                # Notify subscribers
+                if subscribers:
+                    self._notify(worker_id, subscribers, output_line)
+
+    def _notify(
+        self, worker_id: str, subscribers: dict[str, asyncio.Queue], output_line: OutputLine
+    ) -> None:
+        """Put a line on each subscriber queue, dropping the oldest if one is full."""
+        for queue in subscribers.values():
+            try:
+                queue.put_nowait(output_line)
+                # Reset overflow warning flag on successful put
+                if self._overflow_warnings.get(worker_id, False):
+                    self._overflow_warnings[worker_id] = False
+            except asyncio.QueueFull:
+                # Log warning only once when overflow starts
+                if not self._overflow_warnings.get(worker_id, False):
+                    logger.warning(f"Output buffer queue full for worker {worker_id}, dropping oldest line")
+                    self._overflow_warnings[worker_id] = True
+
+                # Drop oldest if queue is full
+                try:
+                    queue.get_nowait()
+                    queue.put_nowait(output_line)
+                except asyncio.QueueEmpty:
+                    pass
 
     async def get_recent(
         self, worker_id: str, limit: int = 100, since_line: int = 0
@@ -1,6 +1,19 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
+from pathlib import Path
+
 import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from ringmaster.api.app import create_app
+from ringmaster.db import Database
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 
 @pytest.fixture(scope="session")
@@ -9,6 +22,66 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(scope="session")
+def schema_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Migrate a database once per session for test databases to copy.
+
+    Pass it as ``Database(..., template=schema_template)`` to skip re-running
+    every migration for each test.
+    """
+    path = tmp_path_factory.mktemp("schema") / "template.db"
+
+    async def migrate() -> None:
+        database = Database(path)
+        await database.connect()
+        await database.disconnect()
+
+    asyncio.run(migrate())
+    return path
+
+
+@pytest.fixture
+async def db(schema_template: Path):
+    """Create an in-memory database copied from the migrated schema template."""
+    database = Database(":memory:", durable=False, template=schema_template)
+    await database.connect()
+    yield database
+    await database.disconnect()
+
+
+async def warm_up(app: FastAPI) -> None:
+    """Send one unmatched request so the app's lazy setup runs before any test.
+
+    The first request builds the middleware stack, and recent FastAPI versions
+    resolve each ``include_router`` group the first time a request is matched
+    against it, which can take over 100ms for large routers. A path no route
+    matches is checked against every group without running an endpoint, so
+    this keeps that cost out of whichever test happens to go first.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/__warmup__")
+    assert response.status_code == 404
+
+
+@pytest.fixture(scope="session")
+def api_app() -> FastAPI:
+    """Create the FastAPI application once for the whole session.
+
+    Tests attach their own database through ``app.state.db``.
+    """
+    app = create_app()
+    asyncio.run(warm_up(app))
+    return app
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests and fixtures on uvloop."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
 def pytest_addoption(parser):
     """Add custom command line options."""
     parser.addoption(
@@ -1,39 +1,325 @@
 """API integration tests."""
 
-import tempfile
-from collections.abc import AsyncGenerator
+import asyncio
+import functools
+import io
+import uuid
+from collections.abc import AsyncGenerator, Generator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
+import orjson
 import pytest
-from httpx import ASGITransport, AsyncClient
-
-from ringmaster.api.app import create_app
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient, Response
+
+from ringmaster.api.deps import get_output_buffer
+from ringmaster.api.routes import chat as chat_routes
+from ringmaster.api.routes import logs as logs_routes
+from ringmaster.api.routes import workers as workers_routes
 from ringmaster.db.connection import Database
+from ringmaster.db.repositories import (
+    ActionRepository,
+    ChatRepository,
+    ProjectRepository,
+    TaskRepository,
+    WorkerRepository,
+)
+from ringmaster.domain import (
+    Action,
+    ActionType,
+    ChatMessage,
+    EntityType,
+    Priority,
+    Project,
+    Task,
+    TaskStatus,
+    Worker,
+    WorkerStatus,
+)
+from ringmaster.events import event_bus
+from ringmaster.events.types import EventType
+from ringmaster.worker.output_buffer import WorkerOutputBuffer
+
+# All tests share one event loop so the session-scoped client can be reused.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+# Request bodies reused across tests, encoded once at import time
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Worker type/command pairs; tests add a name (and any other fields) on top
+CLAUDE_WORKER = MappingProxyType({"type": "claude-code", "command": "claude"})
+AIDER_WORKER = MappingProxyType({"type": "aider", "command": "aider"})
+CODEX_WORKER = MappingProxyType({"type": "codex", "command": "codex"})
+
+
+def read_json(response: Response) -> Any:
+    """Decode a response body with orjson (faster than httpx's stdlib json)."""
+    return orjson.loads(response.content)
+
+
+def expect_json(response: Response, status_code: int = 200) -> Any:
+    """Assert the response status and decode its body once."""
+    assert response.status_code == status_code, response.text
+    return read_json(response)
+
+
+def assert_json_list(response: Response) -> None:
+    """Assert a 200 response whose body is a JSON array, without decoding it."""
+    assert response.status_code == 200, response.text
+    body = response.content.strip()
+    assert body[:1] == b"[" and body[-1:] == b"]", body[:100]
+
+
+def dump_json(payload: Any) -> bytes:
+    """Encode a request body with orjson; send it with ``headers=JSON_HEADERS``."""
+    return orjson.dumps(payload)
+
+
+@functools.cache
+def multipart_upload(
+    filename: str, content: bytes, content_type: str
+) -> tuple[bytes, dict[str, str]]:
+    """Encode a single-file multipart body once and reuse it for identical uploads."""
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+    return body, {"content-type": f"multipart/form-data; boundary={boundary}"}
+
+
+# Minimal PNG (1x1 transparent pixel)
+PNG_BYTES = bytes([
+    0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
+    0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
+    0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,
+    0x08, 0x06, 0x00, 0x00, 0x00, 0x1F, 0x15, 0xC4,
+    0x89, 0x00, 0x00, 0x00, 0x0A, 0x49, 0x44, 0x41,  # IDAT chunk
+    0x54, 0x78, 0x9C, 0x63, 0x00, 0x01, 0x00, 0x00,
+    0x05, 0x00, 0x01, 0x0D, 0x0A, 0x2D, 0xB4, 0x00,
+    0x00, 0x00, 0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE,  # IEND chunk
+    0x42, 0x60, 0x82,
+])
+
+
+class RepeatedByteStream(io.RawIOBase):
+    """Readable stream of ``size`` repeated bytes that is never held in memory at once.
+
+    With ``sized=False`` the stream cannot seek, so httpx cannot tell its length
+    and sends the body without a Content-Length header.
+    """
+
+    def __init__(self, size: int, byte: bytes = b"x", sized: bool = True) -> None:
+        self._size = size
+        self._pos = 0
+        self._byte = byte
+        self._sized = sized
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._sized
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if not self._sized:
+            raise io.UnsupportedOperation("seek")
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = min(max(base + offset, 0), self._size)
+        return self._pos
+
+    def readinto(self, buffer: Any) -> int:
+        n = min(len(buffer), self._size - self._pos)
+        buffer[:n] = self._byte * n
+        self._pos += n
+        return n
 
 
-@pytest.fixture
-async def app_with_db() -> AsyncGenerator[tuple, None]:
-    """Create an app with a temporary database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        db = Database(db_path)
-        await db.connect()
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client(api_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    """Create a single async client shared by every test.
+
+    ASGITransport keeps no sockets, so no connection state leaks between tests.
+    httpx only applies ``limits`` to the default network transport, so there is
+    no connection pool to tune here.
+    """
+    transport = ASGITransport(app=api_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+class RollbackDatabase(Database):
+    """Database that holds writes in savepoints so tests can roll them back.
+
+    While a savepoint is open, commit() is a no-op; rolling back the
+    savepoint discards everything written since it was opened.
+    """
+
+    def __init__(self, db_path: str | Path, durable: bool = True):
+        super().__init__(db_path, durable=durable)
+        self._savepoints: list[str] = []
+
+    async def savepoint(self, name: str) -> None:
+        """Open a savepoint; writes are no longer committed until it is released."""
+        await self.execute(f"SAVEPOINT {name}")
+        self._savepoints.append(name)
+
+    async def rollback_to(self, name: str) -> None:
+        """Discard everything written since the savepoint was opened and close it."""
+        assert self._savepoints and self._savepoints[-1] == name
+        self._savepoints.pop()
+        await self.execute(f"ROLLBACK TO SAVEPOINT {name}")
+        await self.execute(f"RELEASE SAVEPOINT {name}")
+
+    async def commit(self) -> None:
+        """Commit, unless writes are being held in a savepoint."""
+        if not self._savepoints:
+            await super().commit()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_db() -> AsyncGenerator[RollbackDatabase, None]:
+    """Create and migrate one in-memory database for the whole session.
+
+    The app and the tests share this single connection, so a private
+    :memory: database is enough and nothing ever touches the disk. Each
+    pytest-xdist worker is its own process, so workers never share it.
+    """
+    db = RollbackDatabase(":memory:", durable=False)
+    await db.connect()
+
+    yield db
 
-        app = create_app()
-        app.state.db = db
+    await db.disconnect()
 
-        yield app, db
 
-        await db.disconnect()
+@pytest_asyncio.fixture(loop_scope="session")
+async def app_with_db(
+    api_app: FastAPI, session_db: RollbackDatabase
+) -> AsyncGenerator[tuple, None]:
+    """Attach the session database to the app, rolling back this test's writes."""
+    api_app.state.db = session_db
+    await session_db.savepoint("test_case")
+
+    yield api_app, session_db
+
+    await session_db.rollback_to("test_case")
 
 
 @pytest.fixture
-async def client(app_with_db) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client."""
-    app, _ = app_with_db
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+def client(app_with_db, http_client: AsyncClient) -> AsyncClient:
+    """Return the shared async client, bound to this test's database."""
+    return http_client
+
+
+@pytest.fixture
+def db(app_with_db) -> Database:
+    """Return this test's database."""
+    return app_with_db[1]
+
+
+@pytest.fixture
+def output_buffer(api_app: FastAPI) -> Generator[WorkerOutputBuffer, None, None]:
+    """Give the app a fresh worker output buffer for this test."""
+    buffer = WorkerOutputBuffer()
+    api_app.dependency_overrides[get_output_buffer] = lambda: buffer
+    yield buffer
+    api_app.dependency_overrides.pop(get_output_buffer, None)
+
+
+async def make_project(db: Database, name: str = "Test Project", **kwargs: Any) -> str:
+    """Create a project through the repository layer and return its ID.
+
+    Use for setup rows; keep the HTTP client for the endpoint under test.
+    """
+    project = await ProjectRepository(db).create(Project(name=name, **kwargs))
+    return str(project.id)
+
+
+async def make_task(db: Database, project_id: str, title: str = "Test Task", **kwargs: Any) -> str:
+    """Create a task through the repository layer and return its ID."""
+    task = await TaskRepository(db).create_task(Task(project_id=project_id, title=title, **kwargs))
+    return task.id
+
+
+async def make_project_with_tasks(
+    db: Database, *statuses: TaskStatus, name: str = "Test Project"
+) -> tuple[str, list[str]]:
+    """Create a project with one task per status and return their IDs.
+
+    Builds the whole scenario on the repository layer, so setup needs no
+    create-then-patch round trips through the API.
+    """
+    project_id = await make_project(db, name)
+    task_ids = [
+        await make_task(db, project_id, f"Task {i}", status=status)
+        for i, status in enumerate(statuses, start=1)
+    ]
+    return project_id, task_ids
+
+
+async def make_worker(db: Database, name: str = "Test Worker", **kwargs: Any) -> str:
+    """Create a worker through the repository layer and return its ID.
+
+    Pass ``status`` to start it idle or busy without an activate request.
+    """
+    kwargs.setdefault("type", "test")
+    kwargs.setdefault("command", "echo")
+    worker = await WorkerRepository(db).create(Worker(name=name, **kwargs))
+    return worker.id
+
+
+async def make_message(
+    db: Database, project_id: str, content: str, role: str = "user", **kwargs: Any
+) -> ChatMessage:
+    """Create a chat message through the repository layer."""
+    return await ChatRepository(db).create_message(
+        ChatMessage(project_id=project_id, role=role, content=content, **kwargs)
+    )
+
+
+async def seed_logs(client: AsyncClient, *entries: dict[str, Any]) -> list[dict[str, Any]]:
+    """Create log entries with a single bulk request and return them."""
+    return expect_json(await client.post("/api/logs/bulk", json=list(entries)), 201)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def project_id(db: Database) -> str:
+    """Create a project for tests that only need one to exist."""
+    return await make_project(db)
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def shared_project_id(session_db: RollbackDatabase) -> AsyncGenerator[str, None]:
+    """Create one project for a whole test class.
+
+    Its savepoint wraps the per-test ones, so each test still starts from the
+    same state and the project itself is rolled back once the class is done.
+    """
+    await session_db.savepoint("test_class")
+    yield await make_project(session_db, "Shared Test Project")
+    await session_db.rollback_to("test_class")
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def active_worker(db: Database) -> str:
+    """Create an idle worker that tasks can be assigned to and return its ID."""
+    return await make_worker(db, status=WorkerStatus.IDLE)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def project_id_2(db: Database) -> str:
+    """Create a second project for tests that compare across projects."""
+    return await make_project(db, "Project 2")
 
 
 class TestHealthEndpoint:
@@ -42,21 +328,111 @@ class TestHealthEndpoint:
     async def test_health_check(self, client: AsyncClient):
         """Test health check returns healthy status."""
         response = await client.get("/health")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["status"] == "healthy"
         assert data["version"] == "0.1.0"
 
 
+CRUD_CASES = [
+    pytest.param(
+        "/api/projects",
+        {"name": "Original Name"},
+        {"name": "Updated Name"},
+        id="projects",
+    ),
+    pytest.param(
+        "/api/tasks",
+        {"title": "Original Title"},
+        {"title": "Updated Title", "status": "in_progress"},
+        id="tasks",
+    ),
+    pytest.param(
+        "/api/workers",
+        {**CODEX_WORKER, "name": "Original Worker"},
+        {"name": "Updated Worker"},
+        id="workers",
+    ),
+    pytest.param(
+        "/api/workers",
+        {
+            **CLAUDE_WORKER,
+            "name": "Capable Worker",
+            "args": ["--print"],
+            "capabilities": ["python", "typescript", "security"],
+        },
+        {"capabilities": ["python", "rust", "refactoring"]},
+        id="workers-capabilities",
+    ),
+]
+
+
+class TestCrudLifecycle:
+    """CRUD behaviour shared by projects, tasks and workers."""
+
+    @pytest.mark.parametrize(("endpoint", "payload", "update"), CRUD_CASES)
+    async def test_crud_lifecycle(
+        self,
+        client: AsyncClient,
+        project_id: str,
+        endpoint: str,
+        payload: dict,
+        update: dict,
+    ):
+        """Test creating, getting, updating and deleting a resource."""
+        if endpoint == "/api/tasks":
+            payload = {**payload, "project_id": project_id}
+
+        # Create
+        response = await client.post(endpoint, content=dump_json(payload), headers=JSON_HEADERS)
+        assert response.status_code == 201
+        resource_id = read_json(response)["id"]
+
+        # Get
+        response = await client.get(f"{endpoint}/{resource_id}")
+        data = expect_json(response)
+        for key, value in payload.items():
+            assert data[key] == value
+
+        # Update
+        response = await client.patch(
+            f"{endpoint}/{resource_id}", content=dump_json(update), headers=JSON_HEADERS
+        )
+        data = expect_json(response)
+        for key, value in update.items():
+            assert data[key] == value
+
+        # Delete
+        response = await client.delete(f"{endpoint}/{resource_id}")
+        assert response.status_code == 204
+
+        # Verify deleted
+        response = await client.get(f"{endpoint}/{resource_id}")
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("endpoint", ["/api/projects", "/api/tasks", "/api/workers"])
+    async def test_list_empty(self, client: AsyncClient, endpoint: str):
+        """Test listing resources when none exist."""
+        response = await client.get(endpoint)
+        assert response.status_code == 200
+        assert read_json(response) == []
+
+    @pytest.mark.parametrize(
+        ("endpoint", "missing_id"),
+        [
+            pytest.param("/api/projects", "00000000-0000-0000-0000-000000000000", id="projects"),
+            pytest.param("/api/tasks", "bd-nonexistent", id="tasks"),
+            pytest.param("/api/workers", "nonexistent-worker", id="workers"),
+        ],
+    )
+    async def test_get_not_found(self, client: AsyncClient, endpoint: str, missing_id: str):
+        """Test getting a non-existent resource returns 404."""
+        response = await client.get(f"{endpoint}/{missing_id}")
+        assert response.status_code == 404
+
+
 class TestProjectsAPI:
     """Tests for projects API."""
 
-    async def test_list_projects_empty(self, client: AsyncClient):
-        """Test listing projects when none exist."""
-        response = await client.get("/api/projects")
-        assert response.status_code == 200
-        assert response.json() == []
-
     async def test_create_project(self, client: AsyncClient):
         """Test creating a project."""
         response = await client.post(
@@ -67,80 +443,19 @@ class TestProjectsAPI:
                 "tech_stack": ["python", "fastapi"],
             },
         )
-        assert response.status_code == 201
-        data = response.json()
+        data = expect_json(response, 201)
         assert data["name"] == "Test Project"
         assert data["description"] == "A test project"
         assert data["tech_stack"] == ["python", "fastapi"]
         assert "id" in data
 
-    async def test_get_project(self, client: AsyncClient):
-        """Test getting a project by ID."""
-        # Create first
-        create_response = await client.post(
-            "/api/projects",
-            json={"name": "Get Project Test"},
-        )
-        project_id = create_response.json()["id"]
-
-        # Get
-        response = await client.get(f"/api/projects/{project_id}")
-        assert response.status_code == 200
-        assert response.json()["name"] == "Get Project Test"
-
-    async def test_get_project_not_found(self, client: AsyncClient):
-        """Test getting a non-existent project returns 404."""
-        fake_id = "00000000-0000-0000-0000-000000000000"
-        response = await client.get(f"/api/projects/{fake_id}")
-        assert response.status_code == 404
-
-    async def test_update_project(self, client: AsyncClient):
-        """Test updating a project."""
-        # Create first
-        create_response = await client.post(
-            "/api/projects",
-            json={"name": "Original Name"},
-        )
-        project_id = create_response.json()["id"]
-
-        # Update
-        response = await client.patch(
-            f"/api/projects/{project_id}",
-            json={"name": "Updated Name"},
-        )
-        assert response.status_code == 200
-        assert response.json()["name"] == "Updated Name"
-
-    async def test_delete_project(self, client: AsyncClient):
-        """Test deleting a project."""
-        # Create first
-        create_response = await client.post(
-            "/api/projects",
-            json={"name": "To Delete"},
-        )
-        project_id = create_response.json()["id"]
-
-        # Delete
-        response = await client.delete(f"/api/projects/{project_id}")
-        assert response.status_code == 204
-
-        # Verify deleted
-        response = await client.get(f"/api/projects/{project_id}")
-        assert response.status_code == 404
-
-    async def test_get_project_summary(self, client: AsyncClient):
+    async def test_get_project_summary(self, client: AsyncClient, db: Database):
         """Test getting a project summary."""
-        # Create a project
-        create_response = await client.post(
-            "/api/projects",
-            json={"name": "Summary Test Project"},
-        )
-        project_id = create_response.json()["id"]
+        project_id = await make_project(db, "Summary Test Project")
 
         # Get summary
         response = await client.get(f"/api/projects/{project_id}/summary")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         # Check structure
         assert "project" in data
@@ -157,41 +472,19 @@ class TestProjectsAPI:
         assert data["active_workers"] == 0
         assert data["pending_decisions"] == 0
 
-    async def test_get_project_summary_with_tasks(self, client: AsyncClient):
+    async def test_get_project_summary_with_tasks(self, client: AsyncClient, db: Database):
         """Test getting a project summary with tasks."""
-        # Create a project
-        create_response = await client.post(
-            "/api/projects",
-            json={"name": "Summary With Tasks"},
-        )
-        project_id = create_response.json()["id"]
-
-        # Create some tasks and update their statuses
-        task1_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task 1"},
-        )
-        task1_id = task1_response.json()["id"]
-        await client.patch(f"/api/tasks/{task1_id}", json={"status": "ready"})
-
-        task2_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task 2"},
-        )
-        task2_id = task2_response.json()["id"]
-        await client.patch(f"/api/tasks/{task2_id}", json={"status": "in_progress"})
-
-        task3_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task 3"},
+        project_id, _ = await make_project_with_tasks(
+            db,
+            TaskStatus.READY,
+            TaskStatus.IN_PROGRESS,
+            TaskStatus.DONE,
+            name="Summary With Tasks",
         )
-        task3_id = task3_response.json()["id"]
-        await client.patch(f"/api/tasks/{task3_id}", json={"status": "done"})
 
         # Get summary
         response = await client.get(f"/api/projects/{project_id}/summary")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         # Check task counts
         assert data["total_tasks"] == 3
@@ -199,21 +492,12 @@ class TestProjectsAPI:
         assert data["task_counts"]["in_progress"] == 1
         assert data["task_counts"]["done"] == 1
 
-    async def test_get_project_summary_with_decisions(self, client: AsyncClient):
+    async def test_get_project_summary_with_decisions(self, client: AsyncClient, db: Database):
         """Test getting a project summary with pending decisions."""
-        # Create a project
-        create_response = await client.post(
-            "/api/projects",
-            json={"name": "Summary With Decisions"},
-        )
-        project_id = create_response.json()["id"]
+        project_id = await make_project(db, "Summary With Decisions")
 
         # Create a task
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task With Decision"},
-        )
-        task_id = task_response.json()["id"]
+        task_id = await make_task(db, project_id, "Task With Decision")
 
         # Create a decision blocking the task
         await client.post(
@@ -228,8 +512,7 @@ class TestProjectsAPI:
 
         # Get summary
         response = await client.get(f"/api/projects/{project_id}/summary")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         assert data["pending_decisions"] == 1
 
@@ -239,33 +522,17 @@ class TestProjectsAPI:
         response = await client.get(f"/api/projects/{fake_id}/summary")
         assert response.status_code == 404
 
-    async def test_list_projects_with_summaries(self, client: AsyncClient):
+    async def test_list_projects_with_summaries(self, client: AsyncClient, db: Database):
         """Test listing all projects with summaries."""
         # Create a project with some activity
-        create_response = await client.post(
-            "/api/projects",
-            json={"name": "Project With Activity"},
-        )
-        project_id = create_response.json()["id"]
-
-        # Add a task and update its status
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Some Task"},
-        )
-        task_id = task_response.json()["id"]
-        await client.patch(f"/api/tasks/{task_id}", json={"status": "ready"})
+        await make_project_with_tasks(db, TaskStatus.READY, name="Project With Activity")
 
         # Create another project without activity
-        await client.post(
-            "/api/projects",
-            json={"name": "Empty Project"},
-        )
+        await make_project(db, "Empty Project")
 
         # Get projects with summaries
         response = await client.get("/api/projects/with-summaries")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         assert len(data) == 2
 
@@ -282,14 +549,9 @@ class TestProjectsAPI:
         )
         assert empty_project["total_tasks"] == 0
 
-    async def test_project_summary_latest_message(self, client: AsyncClient):
+    async def test_project_summary_latest_message(self, client: AsyncClient, db: Database):
         """Test that project summary includes latest message preview."""
-        # Create a project
-        create_response = await client.post(
-            "/api/projects",
-            json={"name": "Project With Messages"},
-        )
-        project_id = create_response.json()["id"]
+        project_id = await make_project(db, "Project With Messages")
 
         # Add a chat message
         message_response = await client.post(
@@ -304,8 +566,7 @@ class TestProjectsAPI:
 
         # Get project summary
         response = await client.get(f"/api/projects/{project_id}/summary")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         # Check latest_message is present
         assert data["latest_message"] is not None
@@ -314,21 +575,18 @@ class TestProjectsAPI:
 
         # Also check in the with-summaries list
         list_response = await client.get("/api/projects/with-summaries")
-        summaries = list_response.json()
+        summaries = read_json(list_response)
         project_summary = next(
             s for s in summaries if s["project"]["id"] == project_id
         )
         assert project_summary["latest_message"] is not None
         assert project_summary["latest_message"]["role"] == "user"
 
-    async def test_project_summary_latest_message_truncation(self, client: AsyncClient):
+    async def test_project_summary_latest_message_truncation(
+        self, client: AsyncClient, db: Database
+    ):
         """Test that long messages are truncated in latest_message preview."""
-        # Create a project
-        create_response = await client.post(
-            "/api/projects",
-            json={"name": "Project With Long Message"},
-        )
-        project_id = create_response.json()["id"]
+        project_id = await make_project(db, "Project With Long Message")
 
         # Add a very long chat message (> 100 chars)
         long_content = "A" * 200
@@ -343,55 +601,48 @@ class TestProjectsAPI:
 
         # Get project summary
         response = await client.get(f"/api/projects/{project_id}/summary")
-        data = response.json()
+        data = read_json(response)
 
         # Check message is truncated to ~100 chars with "..."
         assert data["latest_message"] is not None
         assert len(data["latest_message"]["content"]) == 100
         assert data["latest_message"]["content"].endswith("...")
 
-    async def test_pin_project(self, client: AsyncClient):
+    async def test_pin_project(self, client: AsyncClient, db: Database):
         """Test pinning a project."""
         # Create project
         create_response = await client.post(
             "/api/projects",
             json={"name": "Pin Test Project"},
         )
-        project = create_response.json()
+        project = read_json(create_response)
         project_id = project["id"]
         assert project["pinned"] is False
 
         # Pin the project
         response = await client.post(f"/api/projects/{project_id}/pin")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["pinned"] is True
 
         # Verify project is pinned
-        get_response = await client.get(f"/api/projects/{project_id}")
-        assert get_response.json()["pinned"] is True
+        stored = await ProjectRepository(db).get(uuid.UUID(project_id))
+        assert stored.pinned is True
 
-    async def test_unpin_project(self, client: AsyncClient):
+    async def test_unpin_project(self, client: AsyncClient, db: Database):
         """Test unpinning a project."""
-        # Create project
-        create_response = await client.post(
-            "/api/projects",
-            json={"name": "Unpin Test Project"},
-        )
-        project_id = create_response.json()["id"]
+        project_id = await make_project(db, "Unpin Test Project")
 
         # Pin first
         await client.post(f"/api/projects/{project_id}/pin")
 
         # Then unpin
         response = await client.post(f"/api/projects/{project_id}/unpin")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["pinned"] is False
 
         # Verify project is unpinned
-        get_response = await client.get(f"/api/projects/{project_id}")
-        assert get_response.json()["pinned"] is False
+        stored = await ProjectRepository(db).get(uuid.UUID(project_id))
+        assert stored.pinned is False
 
     async def test_pin_project_not_found(self, client: AsyncClient):
         """Test pinning non-existent project."""
@@ -405,30 +656,21 @@ class TestProjectsAPI:
         response = await client.post(f"/api/projects/{fake_id}/unpin")
         assert response.status_code == 404
 
-    async def test_pinned_projects_appear_first(self, client: AsyncClient):
+    async def test_pinned_projects_appear_first(self, client: AsyncClient, db: Database):
         """Test that pinned projects appear before unpinned projects."""
-        import asyncio
-
         # Create unpinned project first
-        await client.post(
-            "/api/projects",
-            json={"name": "Unpinned Project"},
-        )
+        await make_project(db, "Unpinned Project")
 
         # Wait a bit so updated_at is different
         await asyncio.sleep(0.1)
 
         # Create second project and pin it
-        response = await client.post(
-            "/api/projects",
-            json={"name": "Pinned Project"},
-        )
-        pinned_id = response.json()["id"]
+        pinned_id = await make_project(db, "Pinned Project")
         await client.post(f"/api/projects/{pinned_id}/pin")
 
         # List projects - pinned should be first even if it's not the most recent
         list_response = await client.get("/api/projects")
-        projects = list_response.json()
+        projects = read_json(list_response)
 
         # Find positions
         pinned_idx = next(
@@ -441,27 +683,16 @@ class TestProjectsAPI:
         # Pinned project should appear before unpinned
         assert pinned_idx < unpinned_idx
 
-    async def test_project_ranking_by_decisions(self, client: AsyncClient):
+    async def test_project_ranking_by_decisions(self, client: AsyncClient, db: Database):
         """Test that projects with pending decisions rank higher."""
         # Create two projects
-        p1_response = await client.post(
-            "/api/projects", json={"name": "Project Without Decisions"}
-        )
-        p1_id = p1_response.json()["id"]
+        p1_id = await make_project(db, "Project Without Decisions")
 
-        p2_response = await client.post(
-            "/api/projects", json={"name": "Project With Decisions"}
-        )
-        p2_id = p2_response.json()["id"]
+        p2_id = await make_project(db, "Project With Decisions")
 
         # Add a task to each project for activity
-        await client.post(
-            "/api/tasks", json={"project_id": p1_id, "title": "Task 1"}
-        )
-        t2_response = await client.post(
-            "/api/tasks", json={"project_id": p2_id, "title": "Task 2"}
-        )
-        t2_id = t2_response.json()["id"]
+        await make_task(db, p1_id, "Task 1")
+        t2_id = await make_task(db, p2_id, "Task 2")
 
         # Create a decision for project 2
         await client.post(
@@ -475,8 +706,7 @@ class TestProjectsAPI:
 
         # Get ranked projects
         response = await client.get("/api/projects/with-summaries?sort=rank")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         # Find positions
         p1_idx = next(
@@ -489,34 +719,23 @@ class TestProjectsAPI:
         # Project with decision should rank higher (lower index)
         assert p2_idx < p1_idx
 
-    async def test_project_ranking_sort_options(self, client: AsyncClient):
+    async def test_project_ranking_sort_options(self, client: AsyncClient, db: Database):
         """Test different sort options for project listing."""
-        import asyncio
-
         # Create projects with different names
-        p1_response = await client.post(
-            "/api/projects", json={"name": "Zebra Project"}
-        )
-        p1_id = p1_response.json()["id"]
+        p1_id = await make_project(db, "Zebra Project")
 
         await asyncio.sleep(0.1)
 
-        p2_response = await client.post(
-            "/api/projects", json={"name": "Alpha Project"}
-        )
-        p2_id = p2_response.json()["id"]
+        p2_id = await make_project(db, "Alpha Project")
 
         # Add activity to Alpha (making it more recent)
-        await client.post(
-            "/api/tasks", json={"project_id": p2_id, "title": "Recent Task"}
-        )
+        await make_task(db, p2_id, "Recent Task")
 
         # Test alphabetical sort
         alpha_response = await client.get(
             "/api/projects/with-summaries?sort=alphabetical"
         )
-        assert alpha_response.status_code == 200
-        alpha_data = alpha_response.json()
+        alpha_data = expect_json(alpha_response)
 
         alpha_idx = next(
             i for i, s in enumerate(alpha_data) if s["project"]["id"] == p2_id
@@ -531,8 +750,7 @@ class TestProjectsAPI:
         recent_response = await client.get(
             "/api/projects/with-summaries?sort=recent"
         )
-        assert recent_response.status_code == 200
-        recent_data = recent_response.json()
+        recent_data = expect_json(recent_response)
 
         # Alpha has more recent activity, should come first
         alpha_recent_idx = next(
@@ -543,24 +761,15 @@ class TestProjectsAPI:
         )
         assert alpha_recent_idx < zebra_recent_idx
 
-    async def test_project_ranking_pinned_always_first(self, client: AsyncClient):
+    async def test_project_ranking_pinned_always_first(self, client: AsyncClient, db: Database):
         """Test that pinned projects appear first regardless of other factors."""
         # Create projects - one with decisions (high priority), one without
-        p1_response = await client.post(
-            "/api/projects", json={"name": "High Priority Project"}
-        )
-        p1_id = p1_response.json()["id"]
+        p1_id = await make_project(db, "High Priority Project")
 
-        p2_response = await client.post(
-            "/api/projects", json={"name": "Pinned Project"}
-        )
-        p2_id = p2_response.json()["id"]
+        p2_id = await make_project(db, "Pinned Project")
 
         # Add a task to p1 and create a decision (high priority signal)
-        t1_response = await client.post(
-            "/api/tasks", json={"project_id": p1_id, "title": "Task with Decision"}
-        )
-        t1_id = t1_response.json()["id"]
+        t1_id = await make_task(db, p1_id, "Task with Decision")
         await client.post(
             "/api/decisions",
             json={
@@ -575,8 +784,7 @@ class TestProjectsAPI:
 
         # Get ranked projects
         response = await client.get("/api/projects/with-summaries?sort=rank")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         # Pinned project should be first despite having no decisions
         assert data[0]["project"]["id"] == p2_id
@@ -585,21 +793,8 @@ class TestProjectsAPI:
 class TestTasksAPI:
     """Tests for tasks API."""
 
-    async def test_list_tasks_empty(self, client: AsyncClient):
-        """Test listing tasks when none exist."""
-        response = await client.get("/api/tasks")
-        assert response.status_code == 200
-        assert response.json() == []
-
-    async def test_create_task(self, client: AsyncClient):
+    async def test_create_task(self, client: AsyncClient, project_id: str):
         """Test creating a task."""
-        # Create project first
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Task Test Project"},
-        )
-        project_id = project_response.json()["id"]
-
         # Create task
         response = await client.post(
             "/api/tasks",
@@ -610,22 +805,14 @@ class TestTasksAPI:
                 "priority": "P1",
             },
         )
-        assert response.status_code == 201
-        data = response.json()
+        data = expect_json(response, 201)
         assert data["title"] == "Test Task"
         assert data["description"] == "A test task"
         assert data["priority"] == "P1"
         assert data["id"].startswith("bd-")
 
-    async def test_create_epic(self, client: AsyncClient):
+    async def test_create_epic(self, client: AsyncClient, project_id: str):
         """Test creating an epic."""
-        # Create project first
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Epic Test Project"},
-        )
-        project_id = project_response.json()["id"]
-
         # Create epic
         response = await client.post(
             "/api/tasks/epics",
@@ -635,105 +822,18 @@ class TestTasksAPI:
                 "acceptance_criteria": ["Feature complete", "Tests pass"],
             },
         )
-        assert response.status_code == 201
-        data = response.json()
+        data = expect_json(response, 201)
         assert data["title"] == "Test Epic"
         assert data["type"] == "epic"
         assert "Feature complete" in data["acceptance_criteria"]
 
-    async def test_get_task(self, client: AsyncClient):
-        """Test getting a task by ID."""
-        # Create project and task
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Get Task Test Project"},
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Get Task Test"},
-        )
-        task_id = task_response.json()["id"]
-
-        # Get
-        response = await client.get(f"/api/tasks/{task_id}")
-        assert response.status_code == 200
-        assert response.json()["title"] == "Get Task Test"
-
-    async def test_get_task_not_found(self, client: AsyncClient):
-        """Test getting a non-existent task returns 404."""
-        response = await client.get("/api/tasks/bd-nonexistent")
-        assert response.status_code == 404
-
-    async def test_update_task(self, client: AsyncClient):
-        """Test updating a task."""
-        # Create project and task
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Update Task Test Project"},
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Original Title"},
-        )
-        task_id = task_response.json()["id"]
-
-        # Update
-        response = await client.patch(
-            f"/api/tasks/{task_id}",
-            json={"title": "Updated Title", "status": "in_progress"},
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["title"] == "Updated Title"
-        assert data["status"] == "in_progress"
-
-    async def test_delete_task(self, client: AsyncClient):
-        """Test deleting a task."""
-        # Create project and task
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Delete Task Test Project"},
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "To Delete"},
-        )
-        task_id = task_response.json()["id"]
-
-        # Delete
-        response = await client.delete(f"/api/tasks/{task_id}")
-        assert response.status_code == 204
-
-        # Verify deleted
-        response = await client.get(f"/api/tasks/{task_id}")
-        assert response.status_code == 404
-
-    async def test_task_dependencies(self, client: AsyncClient):
+    async def test_task_dependencies(self, client: AsyncClient, project_id: str, db: Database):
         """Test adding and retrieving task dependencies."""
-        # Create project and tasks
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Dependency Test Project"},
-        )
-        project_id = project_response.json()["id"]
-
-        task1_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task 1"},
-        )
-        task1_id = task1_response.json()["id"]
-
-        task2_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task 2"},
+        # Create tasks
+        task1_id, task2_id = await asyncio.gather(
+            make_task(db, project_id, "Task 1"),
+            make_task(db, project_id, "Task 2"),
         )
-        task2_id = task2_response.json()["id"]
 
         # Add dependency: task2 depends on task1
         response = await client.post(
@@ -744,38 +844,24 @@ class TestTasksAPI:
 
         # Check dependencies
         response = await client.get(f"/api/tasks/{task2_id}/dependencies")
-        assert response.status_code == 200
-        deps = response.json()
+        deps = expect_json(response)
         assert len(deps) == 1
         assert deps[0]["parent_id"] == task1_id
 
         # Check dependents
         response = await client.get(f"/api/tasks/{task1_id}/dependents")
-        assert response.status_code == 200
-        dependents = response.json()
+        dependents = expect_json(response)
         assert len(dependents) == 1
         assert dependents[0]["child_id"] == task2_id
 
-    async def test_remove_task_dependency(self, client: AsyncClient):
+    async def test_remove_task_dependency(self, client: AsyncClient, db: Database):
         """Test removing a task dependency."""
         # Create project and tasks
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Remove Dependency Test"},
-        )
-        project_id = project_response.json()["id"]
-
-        task1_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Parent Task"},
-        )
-        task1_id = task1_response.json()["id"]
-
-        task2_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Child Task"},
+        project_id = await make_project(db, "Remove Dependency Test")
+        task1_id, task2_id = await asyncio.gather(
+            make_task(db, project_id, "Parent Task"),
+            make_task(db, project_id, "Child Task"),
         )
-        task2_id = task2_response.json()["id"]
 
         # Add dependency: task2 depends on task1
         await client.post(
@@ -785,33 +871,24 @@ class TestTasksAPI:
 
         # Verify dependency exists
         response = await client.get(f"/api/tasks/{task2_id}/dependencies")
-        assert len(response.json()) == 1
+        assert len(read_json(response)) == 1
 
         # Remove dependency
         response = await client.delete(
             f"/api/tasks/{task2_id}/dependencies/{task1_id}"
         )
         assert response.status_code == 200
-        assert response.json()["removed"] is True
+        assert read_json(response)["removed"] is True
 
         # Verify dependency removed
         response = await client.get(f"/api/tasks/{task2_id}/dependencies")
-        assert len(response.json()) == 0
+        assert len(read_json(response)) == 0
 
-    async def test_remove_nonexistent_dependency(self, client: AsyncClient):
+    async def test_remove_nonexistent_dependency(self, client: AsyncClient, db: Database):
         """Test removing a dependency that doesn't exist returns 404."""
         # Create project and task
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Nonexistent Dependency Test"},
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Orphan Task"},
-        )
-        task_id = task_response.json()["id"]
+        project_id = await make_project(db, "Nonexistent Dependency Test")
+        task_id = await make_task(db, project_id, "Orphan Task")
 
         # Try to remove nonexistent dependency
         response = await client.delete(
@@ -819,174 +896,93 @@ class TestTasksAPI:
         )
         assert response.status_code == 404
 
-    async def test_filter_tasks_by_project(self, client: AsyncClient):
+    async def test_filter_tasks_by_project(
+        self, client: AsyncClient, project_id: str, project_id_2: str, db: Database
+    ):
         """Test filtering tasks by project."""
-        # Create two projects
-        proj1_response = await client.post(
-            "/api/projects", json={"name": "Project 1"}
-        )
-        proj1_id = proj1_response.json()["id"]
-
-        proj2_response = await client.post(
-            "/api/projects", json={"name": "Project 2"}
-        )
-        proj2_id = proj2_response.json()["id"]
-
         # Create tasks in each
-        await client.post(
-            "/api/tasks",
-            json={"project_id": proj1_id, "title": "Task in P1"},
-        )
-        await client.post(
-            "/api/tasks",
-            json={"project_id": proj2_id, "title": "Task in P2"},
+        await asyncio.gather(
+            make_task(db, project_id, "Task in P1"),
+            make_task(db, project_id_2, "Task in P2"),
         )
 
         # Filter by project 1
-        response = await client.get(f"/api/tasks?project_id={proj1_id}")
-        assert response.status_code == 200
-        tasks = response.json()
+        response = await client.get(f"/api/tasks?project_id={project_id}")
+        tasks = expect_json(response)
         assert len(tasks) == 1
         assert tasks[0]["title"] == "Task in P1"
 
-    async def test_filter_tasks_by_status(self, client: AsyncClient):
+    async def test_filter_tasks_by_status(
+        self, client: AsyncClient, project_id: str, db: Database
+    ):
         """Test filtering tasks by status."""
-        # Create project and tasks
-        project_response = await client.post(
-            "/api/projects", json={"name": "Status Filter Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Open Task"},
-        )
-        task_id = task_response.json()["id"]
-
-        # Update one to in_progress
-        await client.patch(
-            f"/api/tasks/{task_id}",
-            json={"status": "in_progress"},
-        )
-
-        # Create another task (will be open)
-        await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Another Open Task"},
+        # Create one in_progress task and one open task
+        await asyncio.gather(
+            make_task(db, project_id, "Open Task", status=TaskStatus.IN_PROGRESS),
+            make_task(db, project_id, "Another Open Task"),
         )
 
         # Filter by status
         response = await client.get("/api/tasks?status=in_progress")
-        tasks = response.json()
+        tasks = read_json(response)
         assert len(tasks) == 1
         assert tasks[0]["title"] == "Open Task"
 
-    async def test_assign_task_to_worker(self, client: AsyncClient):
+    async def test_assign_task_to_worker(
+        self, client: AsyncClient, project_id: str, db: Database, active_worker: str
+    ):
         """Test assigning a task to an idle worker."""
-        # Create project and task
-        project_response = await client.post(
-            "/api/projects", json={"name": "Assign Test Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task to Assign"},
-        )
-        task_id = task_response.json()["id"]
-
-        # Create worker
-        worker_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Test Worker",
-                "type": "test",
-                "command": "echo",
-            },
-        )
-        worker_id = worker_response.json()["id"]
-
-        # Activate worker (make it idle)
-        await client.post(f"/api/workers/{worker_id}/activate")
+        # Create task
+        task_id = await make_task(db, project_id, "Task to Assign")
 
         # Assign task to worker
         response = await client.post(
             f"/api/tasks/{task_id}/assign",
-            json={"worker_id": worker_id},
+            json={"worker_id": active_worker},
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["worker_id"] == worker_id
+        data = expect_json(response)
+        assert data["worker_id"] == active_worker
         assert data["status"] == "assigned"
 
         # Verify worker is now busy
-        worker_response = await client.get(f"/api/workers/{worker_id}")
-        worker = worker_response.json()
-        assert worker["status"] == "busy"
-        assert worker["current_task_id"] == task_id
+        worker = await WorkerRepository(db).get(active_worker)
+        assert worker.status == WorkerStatus.BUSY
+        assert worker.current_task_id == task_id
 
-    async def test_unassign_task_from_worker(self, client: AsyncClient):
+    async def test_unassign_task_from_worker(
+        self, client: AsyncClient, project_id: str, db: Database, active_worker: str
+    ):
         """Test unassigning a task from a worker."""
-        # Create project and task
-        project_response = await client.post(
-            "/api/projects", json={"name": "Unassign Test Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task to Unassign"},
-        )
-        task_id = task_response.json()["id"]
-
-        # Create and activate worker
-        worker_response = await client.post(
-            "/api/workers",
-            json={"name": "Test Worker", "type": "test", "command": "echo"},
-        )
-        worker_id = worker_response.json()["id"]
-        await client.post(f"/api/workers/{worker_id}/activate")
+        # Create task
+        task_id = await make_task(db, project_id, "Task to Unassign")
 
         # Assign then unassign
         await client.post(
             f"/api/tasks/{task_id}/assign",
-            json={"worker_id": worker_id},
+            json={"worker_id": active_worker},
         )
         response = await client.post(
             f"/api/tasks/{task_id}/assign",
             json={"worker_id": None},
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["worker_id"] is None
         assert data["status"] == "ready"
 
         # Verify worker is idle
-        worker_response = await client.get(f"/api/workers/{worker_id}")
-        worker = worker_response.json()
-        assert worker["status"] == "idle"
-        assert worker["current_task_id"] is None
+        worker = await WorkerRepository(db).get(active_worker)
+        assert worker.status == WorkerStatus.IDLE
+        assert worker.current_task_id is None
 
-    async def test_assign_task_to_offline_worker_fails(self, client: AsyncClient):
+    async def test_assign_task_to_offline_worker_fails(
+        self, client: AsyncClient, project_id: str, db: Database
+    ):
         """Test that assigning to an offline worker fails."""
-        # Create project and task
-        project_response = await client.post(
-            "/api/projects", json={"name": "Offline Worker Test"}
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task for Offline"},
-        )
-        task_id = task_response.json()["id"]
+        # Create task
+        task_id = await make_task(db, project_id, "Task for Offline")
 
         # Create worker (offline by default)
-        worker_response = await client.post(
-            "/api/workers",
-            json={"name": "Offline Worker", "type": "test", "command": "echo"},
-        )
-        worker_id = worker_response.json()["id"]
+        worker_id = await make_worker(db, "Offline Worker")
 
         # Try to assign - should fail
         response = await client.post(
@@ -994,126 +990,76 @@ class TestTasksAPI:
             json={"worker_id": worker_id},
         )
         assert response.status_code == 400
-        assert "offline" in response.json()["detail"].lower()
+        assert "offline" in read_json(response)["detail"].lower()
 
-    async def test_assign_task_to_busy_worker_fails(self, client: AsyncClient):
+    async def test_assign_task_to_busy_worker_fails(
+        self, client: AsyncClient, project_id: str, db: Database, active_worker: str
+    ):
         """Test that assigning to a busy worker fails."""
-        # Create project and tasks
-        project_response = await client.post(
-            "/api/projects", json={"name": "Busy Worker Test"}
-        )
-        project_id = project_response.json()["id"]
-
-        task1_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task 1"},
-        )
-        task1_id = task1_response.json()["id"]
-
-        task2_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task 2"},
-        )
-        task2_id = task2_response.json()["id"]
-
-        # Create and activate worker
-        worker_response = await client.post(
-            "/api/workers",
-            json={"name": "Busy Worker", "type": "test", "command": "echo"},
-        )
-        worker_id = worker_response.json()["id"]
-        await client.post(f"/api/workers/{worker_id}/activate")
+        # Create tasks
+        task1_id = await make_task(db, project_id, "Task 1")
+        task2_id = await make_task(db, project_id, "Task 2")
 
         # Assign first task
         await client.post(
             f"/api/tasks/{task1_id}/assign",
-            json={"worker_id": worker_id},
+            json={"worker_id": active_worker},
         )
 
         # Try to assign second task - should fail
         response = await client.post(
             f"/api/tasks/{task2_id}/assign",
-            json={"worker_id": worker_id},
+            json={"worker_id": active_worker},
         )
         assert response.status_code == 400
-        assert "busy" in response.json()["detail"].lower()
+        assert "busy" in read_json(response)["detail"].lower()
 
-    async def test_assign_epic_fails(self, client: AsyncClient):
+    async def test_assign_epic_fails(
+        self, client: AsyncClient, project_id: str, active_worker: str
+    ):
         """Test that epics cannot be assigned to workers."""
-        # Create project and epic
-        project_response = await client.post(
-            "/api/projects", json={"name": "Epic Assign Test"}
-        )
-        project_id = project_response.json()["id"]
-
+        # Create epic
         epic_response = await client.post(
             "/api/tasks/epics",
             json={"project_id": project_id, "title": "Test Epic"},
         )
-        epic_id = epic_response.json()["id"]
-
-        # Create and activate worker
-        worker_response = await client.post(
-            "/api/workers",
-            json={"name": "Epic Worker", "type": "test", "command": "echo"},
-        )
-        worker_id = worker_response.json()["id"]
-        await client.post(f"/api/workers/{worker_id}/activate")
+        epic_id = read_json(epic_response)["id"]
 
         # Try to assign epic - should fail
         response = await client.post(
             f"/api/tasks/{epic_id}/assign",
-            json={"worker_id": worker_id},
+            json={"worker_id": active_worker},
         )
         assert response.status_code == 400
-        assert "epic" in response.json()["detail"].lower()
+        assert "epic" in read_json(response)["detail"].lower()
 
-    async def test_bulk_update_status(self, client: AsyncClient):
+    async def test_bulk_update_status(self, client: AsyncClient, project_id: str, db: Database):
         """Test bulk updating task status."""
-        # Create project and tasks
-        project_response = await client.post(
-            "/api/projects", json={"name": "Bulk Update Test"}
+        # Create tasks concurrently
+        task_ids = await asyncio.gather(
+            *[make_task(db, project_id, f"Bulk Task {i}") for i in range(3)]
         )
-        project_id = project_response.json()["id"]
-
-        task_ids = []
-        for i in range(3):
-            task_response = await client.post(
-                "/api/tasks",
-                json={"project_id": project_id, "title": f"Bulk Task {i}"},
-            )
-            task_ids.append(task_response.json()["id"])
 
         # Bulk update status
         response = await client.post(
             "/api/tasks/bulk-update",
             json={"task_ids": task_ids, "status": "in_progress"},
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["updated"] == 3
         assert data["failed"] == 0
 
         # Verify all tasks updated
+        tasks = TaskRepository(db)
         for task_id in task_ids:
-            task_response = await client.get(f"/api/tasks/{task_id}")
-            assert task_response.json()["status"] == "in_progress"
+            assert (await tasks.get_task(task_id)).status == TaskStatus.IN_PROGRESS
 
-    async def test_bulk_update_priority(self, client: AsyncClient):
+    async def test_bulk_update_priority(self, client: AsyncClient, project_id: str, db: Database):
         """Test bulk updating task priority."""
-        # Create project and tasks
-        project_response = await client.post(
-            "/api/projects", json={"name": "Bulk Priority Test"}
+        # Create tasks concurrently
+        task_ids = await asyncio.gather(
+            *[make_task(db, project_id, f"Priority Task {i}") for i in range(2)]
         )
-        project_id = project_response.json()["id"]
-
-        task_ids = []
-        for i in range(2):
-            task_response = await client.post(
-                "/api/tasks",
-                json={"project_id": project_id, "title": f"Priority Task {i}"},
-            )
-            task_ids.append(task_response.json()["id"])
 
         # Bulk update priority
         response = await client.post(
@@ -1121,65 +1067,47 @@ class TestTasksAPI:
             json={"task_ids": task_ids, "priority": "P0"},
         )
         assert response.status_code == 200
-        assert response.json()["updated"] == 2
+        assert read_json(response)["updated"] == 2
 
         # Verify
+        tasks = TaskRepository(db)
         for task_id in task_ids:
-            task_response = await client.get(f"/api/tasks/{task_id}")
-            assert task_response.json()["priority"] == "P0"
+            assert (await tasks.get_task(task_id)).priority == Priority.P0
 
-    async def test_bulk_delete(self, client: AsyncClient):
+    async def test_bulk_delete(self, client: AsyncClient, project_id: str, db: Database):
         """Test bulk deleting tasks."""
-        # Create project and tasks
-        project_response = await client.post(
-            "/api/projects", json={"name": "Bulk Delete Test"}
+        # Create tasks concurrently
+        task_ids = await asyncio.gather(
+            *[make_task(db, project_id, f"Delete Task {i}") for i in range(3)]
         )
-        project_id = project_response.json()["id"]
-
-        task_ids = []
-        for i in range(3):
-            task_response = await client.post(
-                "/api/tasks",
-                json={"project_id": project_id, "title": f"Delete Task {i}"},
-            )
-            task_ids.append(task_response.json()["id"])
 
         # Bulk delete
         response = await client.post(
             "/api/tasks/bulk-delete",
             json={"task_ids": task_ids},
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["updated"] == 3
         assert data["failed"] == 0
 
         # Verify all deleted
+        tasks = TaskRepository(db)
         for task_id in task_ids:
-            task_response = await client.get(f"/api/tasks/{task_id}")
-            assert task_response.status_code == 404
+            assert await tasks.get_task(task_id) is None
 
-    async def test_bulk_update_with_invalid_task(self, client: AsyncClient):
+    async def test_bulk_update_with_invalid_task(
+        self, client: AsyncClient, project_id: str, db: Database
+    ):
         """Test bulk update handles invalid task IDs gracefully."""
-        # Create project and one valid task
-        project_response = await client.post(
-            "/api/projects", json={"name": "Partial Bulk Test"}
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Valid Task"},
-        )
-        valid_task_id = task_response.json()["id"]
+        # Create one valid task
+        valid_task_id = await make_task(db, project_id, "Valid Task")
 
         # Bulk update with mix of valid and invalid
         response = await client.post(
             "/api/tasks/bulk-update",
             json={"task_ids": [valid_task_id, "invalid-id"], "status": "done"},
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["updated"] == 1
         assert data["failed"] == 1
         assert len(data["errors"]) == 1
@@ -1188,28 +1116,18 @@ class TestTasksAPI:
 class TestRoutingAPI:
     """Tests for model routing API endpoint."""
 
-    async def test_routing_simple_task(self, client: AsyncClient):
+    async def test_routing_simple_task(self, client: AsyncClient, db: Database):
         """Test routing recommendation for a simple task."""
         # Create project and simple task
-        project_response = await client.post(
-            "/api/projects", json={"name": "Routing Test Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Routing Test Project")
 
-        task_response = await client.post(
-            "/api/tasks",
-            json={
-                "project_id": project_id,
-                "title": "Fix typo",
-                "description": "Fix a typo in the README file",
-            },
+        task_id = await make_task(
+            db, project_id, "Fix typo", description="Fix a typo in the README file"
         )
-        task_id = task_response.json()["id"]
 
         # Get routing recommendation
         response = await client.get(f"/api/tasks/{task_id}/routing")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         assert data["task_id"] == task_id
         assert data["complexity"] == "simple"
@@ -1218,57 +1136,40 @@ class TestRoutingAPI:
         assert "signals" in data
         assert data["signals"]["simple_keyword_matches"] >= 1  # "typo"
 
-    async def test_routing_complex_task(self, client: AsyncClient):
+    async def test_routing_complex_task(self, client: AsyncClient, db: Database):
         """Test routing recommendation for a complex task."""
-        project_response = await client.post(
-            "/api/projects", json={"name": "Complex Routing Test"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Complex Routing Test")
 
-        task_response = await client.post(
-            "/api/tasks",
-            json={
-                "project_id": project_id,
-                "title": "Architect new authentication system",
-                "description": "Migrate the auth module to use JWT. Refactor security layer. "
-                "Update database schema for new token storage.",
-                "priority": "P0",
-            },
+        task_id = await make_task(
+            db,
+            project_id,
+            "Architect new authentication system",
+            description="Migrate the auth module to use JWT. Refactor security layer. "
+            "Update database schema for new token storage.",
+            priority=Priority.P0,
         )
-        task_id = task_response.json()["id"]
 
         response = await client.get(f"/api/tasks/{task_id}/routing")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         assert data["complexity"] == "complex"
         assert data["tier"] == "powerful"
         assert data["signals"]["complex_keyword_matches"] >= 3
         assert data["signals"]["is_critical"]
 
-    async def test_routing_with_worker_type(self, client: AsyncClient):
+    async def test_routing_with_worker_type(self, client: AsyncClient, db: Database):
         """Test routing with specific worker type returns appropriate model."""
-        project_response = await client.post(
-            "/api/projects", json={"name": "Worker Type Routing Test"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Worker Type Routing Test")
 
-        task_response = await client.post(
-            "/api/tasks",
-            json={
-                "project_id": project_id,
-                "title": "Moderate complexity task",
-                "description": "Implement a new feature",
-            },
+        task_id = await make_task(
+            db, project_id, "Moderate complexity task", description="Implement a new feature"
         )
-        task_id = task_response.json()["id"]
 
         # Request with specific worker type
         response = await client.get(
             f"/api/tasks/{task_id}/routing", params={"worker_type": "claude-code"}
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         # Should have claude-specific model as first suggestion
         assert len(data["suggested_models"]) > 0
@@ -1279,22 +1180,14 @@ class TestRoutingAPI:
         response = await client.get("/api/tasks/bd-nonexistent/routing")
         assert response.status_code == 404
 
-    async def test_routing_includes_reasoning(self, client: AsyncClient):
+    async def test_routing_includes_reasoning(self, client: AsyncClient, db: Database):
         """Test that routing includes reasoning explanation."""
-        project_response = await client.post(
-            "/api/projects", json={"name": "Reasoning Test"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Reasoning Test")
 
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Test task"},
-        )
-        task_id = task_response.json()["id"]
+        task_id = await make_task(db, project_id, "Test task")
 
         response = await client.get(f"/api/tasks/{task_id}/routing")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         assert "reasoning" in data
         assert "Score" in data["reasoning"]
@@ -1303,201 +1196,61 @@ class TestRoutingAPI:
 class TestWorkersAPI:
     """Tests for workers API - testing routes/workers.py."""
 
-    async def test_list_workers_empty(self, client: AsyncClient):
-        """Test listing workers when none exist."""
-        response = await client.get("/api/workers")
-        assert response.status_code == 200
-        assert response.json() == []
-
-    async def test_create_worker(self, client: AsyncClient):
-        """Test creating a worker."""
-        response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Test Worker",
-                "type": "claude-code",
-                "command": "claude",
-                "args": ["--print"],
-            },
-        )
-        assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == "Test Worker"
-        assert data["type"] == "claude-code"
-        assert data["command"] == "claude"
-
-    async def test_get_worker(self, client: AsyncClient):
-        """Test getting a worker by ID."""
-        # Create first
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Get Worker Test", "type": "aider", "command": "aider"},
-        )
-        worker_id = create_response.json()["id"]
-
-        # Get
-        response = await client.get(f"/api/workers/{worker_id}")
-        assert response.status_code == 200
-        assert response.json()["name"] == "Get Worker Test"
-
-    async def test_update_worker(self, client: AsyncClient):
-        """Test updating a worker."""
-        # Create first
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Original Worker", "type": "codex", "command": "codex"},
-        )
-        worker_id = create_response.json()["id"]
-
-        # Update
-        response = await client.patch(
-            f"/api/workers/{worker_id}",
-            json={"name": "Updated Worker"},
-        )
-        assert response.status_code == 200
-        assert response.json()["name"] == "Updated Worker"
-
-    async def test_delete_worker(self, client: AsyncClient):
-        """Test deleting a worker."""
-        # Create first
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "To Delete", "type": "test", "command": "test"},
-        )
-        worker_id = create_response.json()["id"]
-
-        # Delete
-        response = await client.delete(f"/api/workers/{worker_id}")
-        assert response.status_code == 204
-
-        # Verify deleted
-        response = await client.get(f"/api/workers/{worker_id}")
-        assert response.status_code == 404
-
-    async def test_activate_worker(self, client: AsyncClient):
+    async def test_activate_worker(self, client: AsyncClient, db: Database):
         """Test activating a worker."""
         # Create first
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Activate Test", "type": "test", "command": "test"},
-        )
-        worker_id = create_response.json()["id"]
+        worker_id = await make_worker(db, "Activate Test", command="test")
 
         # Activate
         response = await client.post(f"/api/workers/{worker_id}/activate")
         assert response.status_code == 200
-        assert response.json()["status"] == "idle"
+        assert read_json(response)["status"] == "idle"
 
-    async def test_deactivate_worker(self, client: AsyncClient):
+    async def test_deactivate_worker(self, client: AsyncClient, db: Database):
         """Test deactivating a worker."""
         # Create first
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Deactivate Test", "type": "test", "command": "test"},
+        worker_id = await make_worker(
+            db, "Deactivate Test", command="test", status=WorkerStatus.IDLE
         )
-        worker_id = create_response.json()["id"]
-
-        # Activate first
-        await client.post(f"/api/workers/{worker_id}/activate")
 
         # Deactivate
         response = await client.post(f"/api/workers/{worker_id}/deactivate")
         assert response.status_code == 200
-        assert response.json()["status"] == "offline"
-
-    async def test_create_worker_with_capabilities(self, client: AsyncClient):
-        """Test creating a worker with capabilities."""
-        response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Capable Worker",
-                "type": "claude-code",
-                "command": "claude",
-                "capabilities": ["python", "typescript", "security"],
-            },
-        )
-        assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == "Capable Worker"
-        assert data["capabilities"] == ["python", "typescript", "security"]
-
-    async def test_update_worker_capabilities(self, client: AsyncClient):
-        """Test updating worker capabilities."""
-        # Create worker with initial capabilities
-        create_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Update Caps Worker",
-                "type": "aider",
-                "command": "aider",
-                "capabilities": ["python"],
-            },
-        )
-        worker_id = create_response.json()["id"]
-
-        # Update capabilities
-        response = await client.patch(
-            f"/api/workers/{worker_id}",
-            json={"capabilities": ["python", "rust", "refactoring"]},
-        )
-        assert response.status_code == 200
-        assert response.json()["capabilities"] == ["python", "rust", "refactoring"]
+        assert read_json(response)["status"] == "offline"
 
-    async def test_get_worker_capabilities(self, client: AsyncClient):
+    async def test_get_worker_capabilities(self, client: AsyncClient, db: Database):
         """Test getting worker capabilities."""
         # Create worker with capabilities
-        create_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Get Caps Worker",
-                "type": "codex",
-                "command": "codex",
-                "capabilities": ["go", "kubernetes"],
-            },
+        worker_id = await make_worker(
+            db, "Get Caps Worker", **CODEX_WORKER, capabilities=["go", "kubernetes"]
         )
-        worker_id = create_response.json()["id"]
 
         # Get capabilities
         response = await client.get(f"/api/workers/{worker_id}/capabilities")
         assert response.status_code == 200
-        assert response.json() == ["go", "kubernetes"]
+        assert read_json(response) == ["go", "kubernetes"]
 
-    async def test_add_capability(self, client: AsyncClient):
+    async def test_add_capability(self, client: AsyncClient, db: Database):
         """Test adding a capability to a worker."""
         # Create worker with initial capabilities
-        create_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Add Cap Worker",
-                "type": "claude-code",
-                "command": "claude",
-                "capabilities": ["python"],
-            },
+        worker_id = await make_worker(
+            db, "Add Cap Worker", **CLAUDE_WORKER, capabilities=["python"]
         )
-        worker_id = create_response.json()["id"]
 
         # Add capability
         response = await client.post(
             f"/api/workers/{worker_id}/capabilities",
             json={"capability": "security"},
         )
-        assert response.status_code == 201
-        assert "security" in response.json()["capabilities"]
-        assert "python" in response.json()["capabilities"]
+        capabilities = set(expect_json(response, 201)["capabilities"])
+        assert {"security", "python"} <= capabilities
 
-    async def test_add_duplicate_capability(self, client: AsyncClient):
+    async def test_add_duplicate_capability(self, client: AsyncClient, db: Database):
         """Test adding a duplicate capability doesn't create duplicates."""
         # Create worker with python capability
-        create_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Dup Cap Worker",
-                "type": "claude-code",
-                "command": "claude",
-                "capabilities": ["python"],
-            },
+        worker_id = await make_worker(
+            db, "Dup Cap Worker", **CLAUDE_WORKER, capabilities=["python"]
         )
-        worker_id = create_response.json()["id"]
 
         # Add duplicate capability
         response = await client.post(
@@ -1506,268 +1259,157 @@ class TestWorkersAPI:
         )
         assert response.status_code == 201
         # Should still only have one "python"
-        assert response.json()["capabilities"].count("python") == 1
+        assert read_json(response)["capabilities"].count("python") == 1
 
-    async def test_remove_capability(self, client: AsyncClient):
+    async def test_remove_capability(self, client: AsyncClient, db: Database):
         """Test removing a capability from a worker."""
         # Create worker with multiple capabilities
-        create_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Remove Cap Worker",
-                "type": "aider",
-                "command": "aider",
-                "capabilities": ["python", "typescript", "security"],
-            },
+        worker_id = await make_worker(
+            db,
+            "Remove Cap Worker",
+            **AIDER_WORKER,
+            capabilities=["python", "typescript", "security"],
         )
-        worker_id = create_response.json()["id"]
 
         # Remove capability
         response = await client.delete(f"/api/workers/{worker_id}/capabilities/typescript")
-        assert response.status_code == 200
-        assert "typescript" not in response.json()["capabilities"]
-        assert "python" in response.json()["capabilities"]
-        assert "security" in response.json()["capabilities"]
+        capabilities = set(expect_json(response)["capabilities"])
+        assert "typescript" not in capabilities
+        assert {"python", "security"} <= capabilities
 
-    async def test_remove_nonexistent_capability(self, client: AsyncClient):
+    async def test_remove_nonexistent_capability(self, client: AsyncClient, db: Database):
         """Test removing a capability that doesn't exist returns 404."""
         # Create worker
-        create_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "No Cap Worker",
-                "type": "codex",
-                "command": "codex",
-                "capabilities": ["python"],
-            },
-        )
-        worker_id = create_response.json()["id"]
+        worker_id = await make_worker(db, "No Cap Worker", **CODEX_WORKER, capabilities=["python"])
 
         # Try to remove capability that doesn't exist
         response = await client.delete(f"/api/workers/{worker_id}/capabilities/rust")
         assert response.status_code == 404
 
-    async def test_cancel_worker_task(self, client: AsyncClient):
+    async def test_cancel_worker_task(self, client: AsyncClient, db: Database):
         """Test canceling a busy worker's task."""
-        # Create project and task
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Cancel Test Project"},
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={
-                "project_id": project_id,
-                "title": "Task to cancel",
-            },
-        )
-        task_id = task_response.json()["id"]
-
-        # Create and activate worker (makes it idle)
-        worker_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Busy Worker",
-                "type": "claude-code",
-                "command": "claude",
-            },
-        )
-        worker_id = worker_response.json()["id"]
-
-        # Activate worker to make it idle (assignable)
-        await client.post(f"/api/workers/{worker_id}/activate")
-
-        # Assign task to worker - this makes the worker BUSY
-        assign_resp = await client.post(
-            f"/api/tasks/{task_id}/assign",
-            json={"worker_id": worker_id},
-        )
-        assert assign_resp.status_code == 200
-
-        # Verify worker is busy
-        worker_check = await client.get(f"/api/workers/{worker_id}")
-        assert worker_check.json()["status"] == "busy"
-
-        # Cancel the worker's task
+        # Seed a busy worker and its assigned task directly, as assignment leaves them
+        task_id = str(uuid.uuid4())
+        project_id, worker_id = await asyncio.gather(
+            make_project(db, "Cancel Test Project"),
+            make_worker(
+                db,
+                "Busy Worker",
+                **CLAUDE_WORKER,
+                status=WorkerStatus.BUSY,
+                current_task_id=task_id,
+            ),
+        )
+        await make_task(
+            db,
+            project_id,
+            "Task to cancel",
+            id=task_id,
+            status=TaskStatus.ASSIGNED,
+            worker_id=worker_id,
+        )
+
+        # Cancel the worker's task (only succeeds while the worker is busy)
         response = await client.post(f"/api/workers/{worker_id}/cancel")
-        assert response.status_code == 200
-
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is True
         assert data["task_id"] == task_id
+        assert data["status"] == "idle"
 
         # Verify worker is now idle
-        worker_response = await client.get(f"/api/workers/{worker_id}")
-        assert worker_response.json()["status"] == "idle"
+        worker = await WorkerRepository(db).get(worker_id)
+        assert worker.status == WorkerStatus.IDLE
 
         # Verify task is marked as failed
-        task_response = await client.get(f"/api/tasks/{task_id}")
-        assert task_response.json()["status"] == "failed"
+        task = await TaskRepository(db).get_task(task_id)
+        assert task.status == TaskStatus.FAILED
 
-    async def test_cancel_worker_not_busy_fails(self, client: AsyncClient):
+    async def test_cancel_worker_not_busy_fails(self, client: AsyncClient, db: Database):
         """Test canceling a worker that's not busy returns error."""
         # Create idle worker
-        worker_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Idle Worker",
-                "type": "aider",
-                "command": "aider",
-            },
-        )
-        worker_id = worker_response.json()["id"]
-
-        # Activate worker (sets to idle)
-        await client.post(f"/api/workers/{worker_id}/activate")
+        worker_id = await make_worker(db, "Idle Worker", **AIDER_WORKER, status=WorkerStatus.IDLE)
 
         # Try to cancel
         response = await client.post(f"/api/workers/{worker_id}/cancel")
         assert response.status_code == 400
 
-    async def test_pause_worker(self, client: AsyncClient):
+    async def test_pause_worker(self, client: AsyncClient, db: Database):
         """Test pausing an active worker."""
-        # Create and activate worker
-        worker_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Pause Worker",
-                "type": "claude-code",
-                "command": "claude",
-            },
-        )
-        worker_id = worker_response.json()["id"]
-
-        await client.post(f"/api/workers/{worker_id}/activate")
+        # Create an active worker
+        worker_id = await make_worker(db, "Pause Worker", **CLAUDE_WORKER, status=WorkerStatus.IDLE)
 
         # Pause the worker
         response = await client.post(f"/api/workers/{worker_id}/pause")
-        assert response.status_code == 200
-
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is True
         assert data["worker_id"] == worker_id
+        assert data["status"] == "offline"
 
         # Verify worker is now offline (paused)
-        worker_response = await client.get(f"/api/workers/{worker_id}")
-        assert worker_response.json()["status"] == "offline"
+        worker = await WorkerRepository(db).get(worker_id)
+        assert worker.status == WorkerStatus.OFFLINE
 
-    async def test_pause_offline_worker_fails(self, client: AsyncClient):
+    async def test_pause_offline_worker_fails(self, client: AsyncClient, db: Database):
         """Test pausing an already offline worker returns error."""
         # Create worker (default is offline)
-        worker_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Offline Worker",
-                "type": "goose",
-                "command": "goose",
-            },
-        )
-        worker_id = worker_response.json()["id"]
+        worker_id = await make_worker(db, "Offline Worker", type="goose", command="goose")
 
         # Try to pause
         response = await client.post(f"/api/workers/{worker_id}/pause")
         assert response.status_code == 400
 
-    async def test_pause_all_workers(self, client: AsyncClient):
+    async def test_pause_all_workers(self, client: AsyncClient, db: Database):
         """Test pausing all active workers."""
-        # Create multiple workers
-        worker1_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Active Worker 1",
-                "type": "claude-code",
-                "command": "claude",
-            },
+        # Create two active workers
+        worker1_id = await make_worker(
+            db, "Active Worker 1", **CLAUDE_WORKER, status=WorkerStatus.IDLE
         )
-        worker1_id = worker1_response.json()["id"]
-
-        worker2_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Active Worker 2",
-                "type": "aider",
-                "command": "aider",
-            },
+        worker2_id = await make_worker(
+            db, "Active Worker 2", **AIDER_WORKER, status=WorkerStatus.IDLE
         )
-        worker2_id = worker2_response.json()["id"]
-
-        # Activate both workers
-        await client.post(f"/api/workers/{worker1_id}/activate")
-        await client.post(f"/api/workers/{worker2_id}/activate")
 
         # Pause all workers
         response = await client.post("/api/workers/pause-all")
-        assert response.status_code == 200
-
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is True
         assert data["paused_count"] == 2
         assert set(data["paused_worker_ids"]) == {worker1_id, worker2_id}
         assert data["skipped_count"] == 0
 
         # Verify workers are now offline
-        worker1_data = await client.get(f"/api/workers/{worker1_id}")
-        assert worker1_data.json()["status"] == "offline"
-
-        worker2_data = await client.get(f"/api/workers/{worker2_id}")
-        assert worker2_data.json()["status"] == "offline"
+        workers = WorkerRepository(db)
+        for worker_id in (worker1_id, worker2_id):
+            assert (await workers.get(worker_id)).status == WorkerStatus.OFFLINE
 
-    async def test_pause_all_workers_no_active(self, client: AsyncClient):
+    async def test_pause_all_workers_no_active(self, client: AsyncClient, db: Database):
         """Test pausing all workers when none are active."""
         # Create an offline worker (default state)
-        await client.post(
-            "/api/workers",
-            json={
-                "name": "Offline Worker",
-                "type": "claude-code",
-                "command": "claude",
-            },
-        )
+        await make_worker(db, "Offline Worker", **CLAUDE_WORKER)
 
         # Pause all - should return 0 paused
         response = await client.post("/api/workers/pause-all")
-        assert response.status_code == 200
-
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is True
         assert data["paused_count"] == 0
         assert data["paused_worker_ids"] == []
 
-    async def test_list_workers_with_tasks(self, client: AsyncClient):
+    async def test_list_workers_with_tasks(self, client: AsyncClient, db: Database):
         """Test listing workers with task information."""
         # Create a project and task
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Worker Task Test Project"},
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Worker Task Test Project")
 
-        task_response = await client.post(
-            "/api/tasks",
-            json={
-                "project_id": project_id,
-                "title": "Test Task for Worker",
-                "description": "Task being worked on",
-            },
+        task_id = await make_task(
+            db, project_id, "Test Task for Worker", description="Task being worked on"
         )
-        task_id = task_response.json()["id"]
 
         # Create and activate a worker
-        worker_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Task Worker",
-                "type": "claude-code",
-                "command": "claude",
-                "capabilities": ["python"],
-            },
+        worker_id = await make_worker(
+            db,
+            "Task Worker",
+            **CLAUDE_WORKER,
+            capabilities=["python"],
+            status=WorkerStatus.IDLE,
         )
-        worker_id = worker_response.json()["id"]
-
-        # Activate and assign task
-        await client.post(f"/api/workers/{worker_id}/activate")
         await client.post(
             f"/api/tasks/{task_id}/assign",
             json={"worker_id": worker_id},
@@ -1775,8 +1417,7 @@ class TestWorkersAPI:
 
         # List workers with tasks
         response = await client.get("/api/workers/with-tasks")
-        assert response.status_code == 200
-        workers = response.json()
+        workers = expect_json(response)
         assert len(workers) == 1
 
         worker = workers[0]
@@ -1786,64 +1427,38 @@ class TestWorkersAPI:
         assert worker["current_task"]["task_id"] == task_id
         assert worker["current_task"]["title"] == "Test Task for Worker"
 
-    async def test_list_workers_with_tasks_idle_worker(self, client: AsyncClient):
+    async def test_list_workers_with_tasks_idle_worker(self, client: AsyncClient, db: Database):
         """Test listing workers without tasks shows null current_task."""
         # Create idle worker
-        worker_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Idle Worker",
-                "type": "aider",
-                "command": "aider",
-            },
-        )
-        worker_id = worker_response.json()["id"]
-        await client.post(f"/api/workers/{worker_id}/activate")
+        await make_worker(db, "Idle Worker", **AIDER_WORKER, status=WorkerStatus.IDLE)
 
         # List workers with tasks
         response = await client.get("/api/workers/with-tasks")
-        assert response.status_code == 200
-        workers = response.json()
+        workers = expect_json(response)
         assert len(workers) == 1
 
         worker = workers[0]
         assert worker["current_task_id"] is None
         assert worker["current_task"] is None
 
-    async def test_list_workers_with_tasks_filter_by_status(self, client: AsyncClient):
+    async def test_list_workers_with_tasks_filter_by_status(
+        self, client: AsyncClient, db: Database
+    ):
         """Test filtering workers with tasks by status."""
         # Create two workers - one idle, one offline
-        worker1_response = await client.post(
-            "/api/workers",
-            json={
-                "name": "Idle Worker Filter",
-                "type": "claude-code",
-                "command": "claude",
-            },
-        )
-        worker1_id = worker1_response.json()["id"]
-        await client.post(f"/api/workers/{worker1_id}/activate")
+        await make_worker(db, "Idle Worker Filter", **CLAUDE_WORKER, status=WorkerStatus.IDLE)
 
-        await client.post(
-            "/api/workers",
-            json={
-                "name": "Offline Worker Filter",
-                "type": "aider",
-                "command": "aider",
-            },
-        )
+        await make_worker(db, "Offline Worker Filter", **AIDER_WORKER)
 
         # Filter by idle status
         response = await client.get("/api/workers/with-tasks?status=idle")
-        assert response.status_code == 200
-        workers = response.json()
+        workers = expect_json(response)
         assert len(workers) == 1
         assert workers[0]["status"] == "idle"
 
         # Filter by offline status
         response = await client.get("/api/workers/with-tasks?status=offline")
-        assert response.status_code == 200
-        workers = response.json()
+        workers = expect_json(response)
         assert len(workers) == 1
         assert workers[0]["status"] == "offline"
 
@@ -1851,19 +1466,14 @@ class TestWorkersAPI:
 class TestWorkerOutputAPI:
     """Tests for worker output streaming API."""
 
-    async def test_get_worker_output_empty(self, client: AsyncClient):
+    async def test_get_worker_output_empty(self, client: AsyncClient, db: Database):
         """Test getting output for a worker with no output."""
         # Create worker
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Output Test Worker", "type": "test", "command": "test"},
-        )
-        worker_id = create_response.json()["id"]
+        worker_id = await make_worker(db, "Output Test Worker", command="test")
 
         # Get output
         response = await client.get(f"/api/workers/{worker_id}/output")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["worker_id"] == worker_id
         assert data["lines"] == []
         assert data["total_lines"] == 0
@@ -1874,26 +1484,22 @@ class TestWorkerOutputAPI:
         response = await client.get(f"/api/workers/{fake_id}/output")
         assert response.status_code == 404
 
-    async def test_get_worker_output_with_buffer(self, client: AsyncClient):
+    async def test_get_worker_output_with_buffer(
+        self, client: AsyncClient, db: Database, output_buffer: WorkerOutputBuffer
+    ):
         """Test getting output after writing to buffer."""
-        from ringmaster.worker.output_buffer import output_buffer
-
         # Create worker
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Buffer Test Worker", "type": "test", "command": "test"},
-        )
-        worker_id = create_response.json()["id"]
+        worker_id = await make_worker(db, "Buffer Test Worker", command="test")
 
         # Write some output to the buffer
-        await output_buffer.write(worker_id, "Line 1: Starting task...")
-        await output_buffer.write(worker_id, "Line 2: Processing data...")
-        await output_buffer.write(worker_id, "Line 3: Task complete!")
+        await output_buffer.write_many(
+            worker_id,
+            ["Line 1: Starting task...", "Line 2: Processing data...", "Line 3: Task complete!"],
+        )
 
         # Get output
         response = await client.get(f"/api/workers/{worker_id}/output")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["worker_id"] == worker_id
         assert len(data["lines"]) == 3
         assert data["lines"][0]["line"] == "Line 1: Starting task..."
@@ -1902,202 +1508,165 @@ class TestWorkerOutputAPI:
         assert data["lines"][2]["line_number"] == 3
         assert data["total_lines"] == 3
 
-        # Cleanup
-        await output_buffer.clear(worker_id)
-
-    async def test_get_worker_output_since_line(self, client: AsyncClient):
+    async def test_stream_worker_output(
+        self, db: Database, output_buffer: WorkerOutputBuffer, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that output written after connecting arrives as SSE events."""
+        worker_id = await make_worker(db, "Stream Worker", command="test")
+
+        # Signal once the stream has subscribed, so no line is written before it listens
+        subscribed = asyncio.Event()
+        subscribe = output_buffer.subscribe
+
+        async def subscribe_and_signal(*args: str) -> asyncio.Queue:
+            queue = await subscribe(*args)
+            subscribed.set()
+            return queue
+
+        monkeypatch.setattr(output_buffer, "subscribe", subscribe_and_signal)
+
+        # ASGITransport buffers whole responses, so read the open stream directly
+        response = await workers_routes.stream_worker_output(db, output_buffer, worker_id)
+        assert response.media_type == "text/event-stream"
+        stream = response.body_iterator
+        first = asyncio.ensure_future(anext(stream))
+        await subscribed.wait()
+
+        await output_buffer.write_many(worker_id, ["Line 1", "Line 2", "Line 3"])
+        chunks = [await first] + [await anext(stream) for _ in range(2)]
+        await stream.aclose()
+
+        events = [orjson.loads(chunk.removeprefix("data: ")) for chunk in chunks]
+        assert [e["line"] for e in events] == ["Line 1", "Line 2", "Line 3"]
+        assert [e["line_number"] for e in events] == [1, 2, 3]
+        # Closing the stream drops its subscription
+        assert output_buffer.get_buffer_stats()[worker_id]["subscriber_count"] == 0
+
+    async def test_get_worker_output_since_line(
+        self, client: AsyncClient, db: Database, output_buffer: WorkerOutputBuffer
+    ):
         """Test getting output after a specific line number."""
-        from ringmaster.worker.output_buffer import output_buffer
-
         # Create worker
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Since Line Worker", "type": "test", "command": "test"},
-        )
-        worker_id = create_response.json()["id"]
+        worker_id = await make_worker(db, "Since Line Worker", command="test")
 
         # Write some output
-        await output_buffer.write(worker_id, "Line 1")
-        await output_buffer.write(worker_id, "Line 2")
-        await output_buffer.write(worker_id, "Line 3")
-        await output_buffer.write(worker_id, "Line 4")
+        await output_buffer.write_many(worker_id, ["Line 1", "Line 2", "Line 3", "Line 4"])
 
         # Get output since line 2
         response = await client.get(f"/api/workers/{worker_id}/output?since_line=2")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert len(data["lines"]) == 2
         assert data["lines"][0]["line"] == "Line 3"
         assert data["lines"][0]["line_number"] == 3
         assert data["lines"][1]["line"] == "Line 4"
         assert data["lines"][1]["line_number"] == 4
 
-        # Cleanup
-        await output_buffer.clear(worker_id)
-
-    async def test_get_worker_output_limit(self, client: AsyncClient):
+    async def test_get_worker_output_limit(
+        self, client: AsyncClient, db: Database, output_buffer: WorkerOutputBuffer
+    ):
         """Test limiting output lines."""
-        from ringmaster.worker.output_buffer import output_buffer
-
         # Create worker
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Limit Worker", "type": "test", "command": "test"},
-        )
-        worker_id = create_response.json()["id"]
+        worker_id = await make_worker(db, "Limit Worker", command="test")
 
         # Write many lines
-        for i in range(10):
-            await output_buffer.write(worker_id, f"Line {i + 1}")
+        await output_buffer.write_many(worker_id, [f"Line {i + 1}" for i in range(10)])
 
         # Get only last 3 lines
         response = await client.get(f"/api/workers/{worker_id}/output?limit=3")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert len(data["lines"]) == 3
         assert data["lines"][0]["line"] == "Line 8"
         assert data["lines"][2]["line"] == "Line 10"
         assert data["total_lines"] == 10
 
-        # Cleanup
-        await output_buffer.clear(worker_id)
-
-    async def test_get_output_stats(self, client: AsyncClient):
+    async def test_get_output_stats(
+        self, client: AsyncClient, db: Database, output_buffer: WorkerOutputBuffer
+    ):
         """Test getting output buffer statistics."""
-        from ringmaster.worker.output_buffer import output_buffer
-
         # Create worker and write some output
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Stats Worker", "type": "test", "command": "test"},
-        )
-        worker_id = create_response.json()["id"]
+        worker_id = await make_worker(db, "Stats Worker", command="test")
 
         await output_buffer.write(worker_id, "Test line")
 
         # Get stats
         response = await client.get("/api/workers/output/stats")
-        assert response.status_code == 200
-        stats = response.json()
+        stats = expect_json(response)
         assert worker_id in stats
         assert stats[worker_id]["line_count"] == 1
         assert stats[worker_id]["total_lines"] == 1
 
-        # Cleanup
-        await output_buffer.clear(worker_id)
-
 
 class TestWorkerHealthAPI:
     """Tests for worker health monitoring API."""
 
-    async def test_worker_health_no_output(self, client: AsyncClient):
+    async def test_worker_health_no_output(self, client: AsyncClient, db: Database):
         """Test health check for worker with no output history."""
         # Create worker
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Health Test Worker", "type": "test", "command": "test"},
-        )
-        worker_id = create_response.json()["id"]
+        worker_id = await make_worker(db, "Health Test Worker", command="test")
 
         # Get health status
         response = await client.get(f"/api/workers/{worker_id}/health")
-        assert response.status_code == 200
-
-        data = response.json()
+        data = expect_json(response)
         assert data["worker_id"] == worker_id
         assert data["liveness_status"] == "active"  # New monitor starts active
         assert data["degradation"]["is_degraded"] is False
         assert data["recommended_action"]["action"] == "none"
 
-    async def test_worker_health_with_output(self, client: AsyncClient):
+    async def test_worker_health_with_output(
+        self, client: AsyncClient, db: Database, output_buffer: WorkerOutputBuffer
+    ):
         """Test health check for worker with some output history."""
-        from ringmaster.worker.output_buffer import output_buffer
-
         # Create worker
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Active Health Worker", "type": "test", "command": "test"},
-        )
-        worker_id = create_response.json()["id"]
+        worker_id = await make_worker(db, "Active Health Worker", command="test")
 
         # Add some output
-        await output_buffer.write(worker_id, "Starting task...")
-        await output_buffer.write(worker_id, "Processing...")
-        await output_buffer.write(worker_id, "Done!")
+        await output_buffer.write_many(worker_id, ["Starting task...", "Processing...", "Done!"])
 
         # Get health status
         response = await client.get(f"/api/workers/{worker_id}/health")
-        assert response.status_code == 200
-
-        data = response.json()
+        data = expect_json(response)
         assert data["worker_id"] == worker_id
         assert data["liveness_status"] == "active"
         assert data["total_output_lines"] == 3
         assert data["degradation"]["is_degraded"] is False
 
-        # Cleanup
-        await output_buffer.clear(worker_id)
-
-    async def test_worker_health_with_degradation_signals(self, client: AsyncClient):
+    async def test_worker_health_with_degradation_signals(
+        self, client: AsyncClient, db: Database, output_buffer: WorkerOutputBuffer
+    ):
         """Test health check detects degradation signals."""
-        from ringmaster.worker.output_buffer import output_buffer
-
-        # Create worker
-        create_response = await client.post(
-            "/api/workers",
-            json={"name": "Degraded Worker", "type": "test", "command": "test"},
-        )
-        worker_id = create_response.json()["id"]
+        # Create worker
+        worker_id = await make_worker(db, "Degraded Worker", command="test")
 
         # Add output with many apologies (degradation signal)
         for i in range(10):
-            await output_buffer.write(worker_id, f"Line {i}: I apologize for the confusion.")
-            await output_buffer.write(worker_id, "Let me try again.")
+            await output_buffer.write_many(
+                worker_id, [f"Line {i}: I apologize for the confusion.", "Let me try again."]
+            )
 
         # Get health status
         response = await client.get(f"/api/workers/{worker_id}/health")
-        assert response.status_code == 200
-
-        data = response.json()
+        data = expect_json(response)
         assert data["worker_id"] == worker_id
         # Should detect degradation due to many apologies and retry phrases
         assert data["degradation"]["apology_count"] >= 5
         assert data["degradation"]["retry_count"] >= 1
 
-        # Cleanup
-        await output_buffer.clear(worker_id)
-
     async def test_worker_health_not_found(self, client: AsyncClient):
         """Test health check for non-existent worker returns 404."""
         response = await client.get("/api/workers/nonexistent-worker/health")
         assert response.status_code == 404
 
-    async def test_worker_health_with_task_id(self, client: AsyncClient):
+    async def test_worker_health_with_task_id(self, client: AsyncClient, db: Database):
         """Test health check includes task_id when worker is busy."""
         # Create project and task
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Health Task Project"},
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Health Task Project")
 
-        task_response = await client.post(
-            "/api/tasks",
-            json={
-                "project_id": project_id,
-                "title": "Health test task",
-            },
-        )
-        task_id = task_response.json()["id"]
+        task_id = await make_task(db, project_id, "Health test task")
 
         # Create worker and assign task
-        worker_response = await client.post(
-            "/api/workers",
-            json={"name": "Busy Health Worker", "type": "test", "command": "test"},
+        worker_id = await make_worker(
+            db, "Busy Health Worker", command="test", status=WorkerStatus.IDLE
         )
-        worker_id = worker_response.json()["id"]
-
-        await client.post(f"/api/workers/{worker_id}/activate")
         await client.post(
             f"/api/tasks/{task_id}/assign",
             json={"worker_id": worker_id},
@@ -2105,9 +1674,7 @@ class TestWorkerHealthAPI:
 
         # Get health status
         response = await client.get(f"/api/workers/{worker_id}/health")
-        assert response.status_code == 200
-
-        data = response.json()
+        data = expect_json(response)
         assert data["worker_id"] == worker_id
         assert data["task_id"] == task_id
 
@@ -2118,8 +1685,7 @@ class TestQueueAPI:
     async def test_queue_stats(self, client: AsyncClient):
         """Test queue stats endpoint."""
         response = await client.get("/api/queue/stats")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         # Should have expected fields
         assert "ready_tasks" in data
         assert "assigned_tasks" in data
@@ -2134,21 +1700,12 @@ class TestQueueAPI:
         """Test getting ready tasks."""
         response = await client.get("/api/queue/ready")
         assert response.status_code == 200
-        assert response.json() == []
+        assert read_json(response) == []
 
-    async def test_enqueue_task(self, client: AsyncClient):
+    async def test_enqueue_task(self, client: AsyncClient, project_id: str, db: Database):
         """Test enqueueing a task."""
-        # Create project and task
-        project_response = await client.post(
-            "/api/projects", json={"name": "Queue Test Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Queue Test Task"},
-        )
-        task_id = task_response.json()["id"]
+        # Create task
+        task_id = await make_task(db, project_id, "Queue Test Task")
 
         # Enqueue
         response = await client.post(
@@ -2156,25 +1713,16 @@ class TestQueueAPI:
             json={"task_id": task_id},
         )
         assert response.status_code == 200
-        assert response.json()["status"] == "enqueued"
+        assert read_json(response)["status"] == "enqueued"
 
         # Verify stats updated
         stats_response = await client.get("/api/queue/stats")
-        assert stats_response.json()["ready_tasks"] == 1
+        assert read_json(stats_response)["ready_tasks"] == 1
 
-    async def test_complete_task(self, client: AsyncClient):
+    async def test_complete_task(self, client: AsyncClient, project_id: str, db: Database):
         """Test completing a task."""
         # Create and enqueue task
-        project_response = await client.post(
-            "/api/projects", json={"name": "Complete Test Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Complete Test Task"},
-        )
-        task_id = task_response.json()["id"]
+        task_id = await make_task(db, project_id, "Complete Test Task")
 
         await client.post(
             "/api/queue/enqueue",
@@ -2187,24 +1735,14 @@ class TestQueueAPI:
             json={"task_id": task_id, "success": True},
         )
         assert response.status_code == 200
-        assert response.json()["status"] == "completed"
+        assert read_json(response)["status"] == "completed"
 
-    async def test_recalculate_priorities(self, client: AsyncClient):
+    async def test_recalculate_priorities(self, client: AsyncClient, project_id: str, db: Database):
         """Test recalculating priorities."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Priority Test Project"}
-        )
-        project_id = project_response.json()["id"]
-
         # Create tasks
-        await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task 1"},
-        )
-        await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task 2"},
+        await asyncio.gather(
+            make_task(db, project_id, "Task 1"),
+            make_task(db, project_id, "Task 2"),
         )
 
         # Recalculate
@@ -2213,241 +1751,149 @@ class TestQueueAPI:
             json={"project_id": project_id},
         )
         assert response.status_code == 200
-        assert "tasks_updated" in response.json()
+        assert "tasks_updated" in read_json(response)
 
 
 class TestChatAPI:
     """Tests for chat API - testing routes/chat.py."""
 
-    async def test_list_messages_empty(self, client: AsyncClient):
+    async def test_list_messages_empty(self, client: AsyncClient, shared_project_id: str):
         """Test listing messages when none exist."""
-        # Create project first
-        project_response = await client.post(
-            "/api/projects", json={"name": "Chat Test Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        response = await client.get(f"/api/chat/projects/{project_id}/messages")
+        response = await client.get(f"/api/chat/projects/{shared_project_id}/messages")
         assert response.status_code == 200
-        assert response.json() == []
+        assert read_json(response) == []
 
-    async def test_create_message(self, client: AsyncClient):
+    async def test_create_message(self, client: AsyncClient, shared_project_id: str):
         """Test creating a chat message."""
-        # Create project first
-        project_response = await client.post(
-            "/api/projects", json={"name": "Message Create Project"}
-        )
-        project_id = project_response.json()["id"]
-
         response = await client.post(
-            f"/api/chat/projects/{project_id}/messages",
-            json={
-                "project_id": project_id,
+            f"/api/chat/projects/{shared_project_id}/messages",
+            content=dump_json({
+                "project_id": shared_project_id,
                 "role": "user",
                 "content": "Hello, this is a test message",
-            },
+            }),
+            headers=JSON_HEADERS,
         )
-        assert response.status_code == 201
-        data = response.json()
+        data = expect_json(response, 201)
         assert data["role"] == "user"
         assert data["content"] == "Hello, this is a test message"
-        assert data["project_id"] == project_id
+        assert data["project_id"] == shared_project_id
 
-    async def test_create_message_with_task(self, client: AsyncClient):
+    async def test_create_message_with_task(
+        self, client: AsyncClient, shared_project_id: str, db: Database
+    ):
         """Test creating a chat message associated with a task."""
-        # Create project and task
-        project_response = await client.post(
-            "/api/projects", json={"name": "Message Task Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Chat Task"},
-        )
-        task_id = task_response.json()["id"]
+        task_id = await make_task(db, shared_project_id, "Chat Task")
 
         response = await client.post(
-            f"/api/chat/projects/{project_id}/messages",
-            json={
-                "project_id": project_id,
+            f"/api/chat/projects/{shared_project_id}/messages",
+            content=dump_json({
+                "project_id": shared_project_id,
                 "task_id": task_id,
                 "role": "assistant",
                 "content": "I will help with this task",
-            },
+            }),
+            headers=JSON_HEADERS,
         )
-        assert response.status_code == 201
-        data = response.json()
+        data = expect_json(response, 201)
         assert data["task_id"] == task_id
 
-    async def test_create_message_project_mismatch(self, client: AsyncClient):
+    async def test_create_message_project_mismatch(
+        self, client: AsyncClient, shared_project_id: str, project_id_2: str
+    ):
         """Test that project_id in body must match URL."""
-        # Create two projects
-        project1_response = await client.post(
-            "/api/projects", json={"name": "Project 1"}
-        )
-        project1_id = project1_response.json()["id"]
-
-        project2_response = await client.post(
-            "/api/projects", json={"name": "Project 2"}
-        )
-        project2_id = project2_response.json()["id"]
-
         # Try to create message with mismatched project IDs
         response = await client.post(
-            f"/api/chat/projects/{project1_id}/messages",
-            json={
-                "project_id": project2_id,  # Different from URL
+            f"/api/chat/projects/{shared_project_id}/messages",
+            content=dump_json({
+                "project_id": project_id_2,  # Different from URL
                 "role": "user",
                 "content": "This should fail",
-            },
+            }),
+            headers=JSON_HEADERS,
         )
         assert response.status_code == 400
 
-    async def test_list_messages_with_filter(self, client: AsyncClient):
+    async def test_list_messages_with_filter(
+        self, client: AsyncClient, shared_project_id: str, db: Database
+    ):
         """Test listing messages with task filter."""
-        # Create project and task
-        project_response = await client.post(
-            "/api/projects", json={"name": "Filter Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Filter Task"},
-        )
-        task_id = task_response.json()["id"]
+        task_id = await make_task(db, shared_project_id, "Filter Task")
 
         # Create messages
-        await client.post(
-            f"/api/chat/projects/{project_id}/messages",
-            json={
-                "project_id": project_id,
-                "role": "user",
-                "content": "Message without task",
-            },
-        )
-        await client.post(
-            f"/api/chat/projects/{project_id}/messages",
-            json={
-                "project_id": project_id,
-                "task_id": task_id,
-                "role": "user",
-                "content": "Message with task",
-            },
+        await asyncio.gather(
+            make_message(db, shared_project_id, "Message without task"),
+            make_message(db, shared_project_id, "Message with task", task_id=task_id),
         )
 
         # Filter by task
         response = await client.get(
-            f"/api/chat/projects/{project_id}/messages?task_id={task_id}"
+            f"/api/chat/projects/{shared_project_id}/messages?task_id={task_id}"
         )
-        assert response.status_code == 200
-        messages = response.json()
+        messages = expect_json(response)
         assert len(messages) == 1
         assert messages[0]["content"] == "Message with task"
 
-    async def test_get_recent_messages(self, client: AsyncClient):
+    async def test_get_recent_messages(
+        self, client: AsyncClient, shared_project_id: str, db: Database
+    ):
         """Test getting recent messages."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Recent Messages Project"}
+        # Create multiple messages concurrently
+        created = await asyncio.gather(
+            *[make_message(db, shared_project_id, f"Message {i}") for i in range(5)]
         )
-        project_id = project_response.json()["id"]
-
-        # Create multiple messages
-        for i in range(5):
-            await client.post(
-                f"/api/chat/projects/{project_id}/messages",
-                json={
-                    "project_id": project_id,
-                    "role": "user",
-                    "content": f"Message {i}",
-                },
-            )
+        # Insertion order is not guaranteed under gather, so derive it from the results
+        by_time = sorted(created, key=lambda m: m.created_at)
 
         # Get last 3
         response = await client.get(
-            f"/api/chat/projects/{project_id}/messages/recent?count=3"
+            f"/api/chat/projects/{shared_project_id}/messages/recent?count=3"
         )
-        assert response.status_code == 200
-        messages = response.json()
+        messages = expect_json(response)
         assert len(messages) == 3
         # Should be in chronological order (oldest first of the recent)
-        assert messages[0]["content"] == "Message 2"
-        assert messages[2]["content"] == "Message 4"
+        assert [m["id"] for m in messages] == [m.id for m in by_time[-3:]]
 
-    async def test_get_message_count(self, client: AsyncClient):
+    async def test_get_message_count(
+        self, client: AsyncClient, shared_project_id: str, db: Database
+    ):
         """Test getting message count."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Count Project"}
-        )
-        project_id = project_response.json()["id"]
-
         # Create messages
-        for i in range(3):
-            await client.post(
-                f"/api/chat/projects/{project_id}/messages",
-                json={
-                    "project_id": project_id,
-                    "role": "user",
-                    "content": f"Message {i}",
-                },
-            )
+        await asyncio.gather(
+            *[make_message(db, shared_project_id, f"Message {i}") for i in range(3)]
+        )
 
         response = await client.get(
-            f"/api/chat/projects/{project_id}/messages/count"
+            f"/api/chat/projects/{shared_project_id}/messages/count"
         )
         assert response.status_code == 200
-        assert response.json()["count"] == 3
+        assert read_json(response)["count"] == 3
 
-    async def test_list_summaries_empty(self, client: AsyncClient):
+    async def test_list_summaries_empty(self, client: AsyncClient, shared_project_id: str):
         """Test listing summaries when none exist."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Summary Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        response = await client.get(f"/api/chat/projects/{project_id}/summaries")
+        response = await client.get(f"/api/chat/projects/{shared_project_id}/summaries")
         assert response.status_code == 200
-        assert response.json() == []
+        assert read_json(response) == []
 
-    async def test_get_latest_summary_not_found(self, client: AsyncClient):
+    async def test_get_latest_summary_not_found(self, client: AsyncClient, shared_project_id: str):
         """Test getting latest summary when none exist returns 404."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "No Summary Project"}
-        )
-        project_id = project_response.json()["id"]
-
         response = await client.get(
-            f"/api/chat/projects/{project_id}/summaries/latest"
+            f"/api/chat/projects/{shared_project_id}/summaries/latest"
         )
         assert response.status_code == 404
 
-    async def test_get_history_context(self, client: AsyncClient):
+    async def test_get_history_context(
+        self, client: AsyncClient, shared_project_id: str, db: Database
+    ):
         """Test getting history context."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Context Project"}
-        )
-        project_id = project_response.json()["id"]
-
         # Create some messages
         for i in range(5):
-            await client.post(
-                f"/api/chat/projects/{project_id}/messages",
-                json={
-                    "project_id": project_id,
-                    "role": "user" if i % 2 == 0 else "assistant",
-                    "content": f"Message {i}",
-                },
+            await make_message(
+                db, shared_project_id, f"Message {i}", role="user" if i % 2 == 0 else "assistant"
             )
 
-        response = await client.post(f"/api/chat/projects/{project_id}/context")
-        assert response.status_code == 200
-        data = response.json()
+        response = await client.post(f"/api/chat/projects/{shared_project_id}/context")
+        data = expect_json(response)
         assert data["total_messages"] == 5
         assert "recent_messages" in data
         assert "summaries" in data
@@ -2455,185 +1901,160 @@ class TestChatAPI:
         assert "formatted_prompt" in data
         assert "estimated_tokens" in data
 
-    async def test_get_history_context_with_config(self, client: AsyncClient):
+    async def test_get_history_context_with_config(
+        self, client: AsyncClient, shared_project_id: str, db: Database
+    ):
         """Test getting history context with custom config."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Config Context Project"}
-        )
-        project_id = project_response.json()["id"]
-
         # Create messages
         for i in range(3):
-            await client.post(
-                f"/api/chat/projects/{project_id}/messages",
-                json={
-                    "project_id": project_id,
-                    "role": "user",
-                    "content": f"Message {i}",
-                },
-            )
+            await make_message(db, shared_project_id, f"Message {i}")
 
         response = await client.post(
-            f"/api/chat/projects/{project_id}/context",
-            json={"recent_verbatim": 2},
+            f"/api/chat/projects/{shared_project_id}/context",
+            content=dump_json({"recent_verbatim": 2}),
+            headers=JSON_HEADERS,
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         # Should only return 2 recent messages
         assert len(data["recent_messages"]) == 2
 
-    async def test_clear_summaries(self, client: AsyncClient):
+    async def test_clear_summaries(self, client: AsyncClient, shared_project_id: str):
         """Test clearing summaries."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Clear Summary Project"}
-        )
-        project_id = project_response.json()["id"]
-
         response = await client.delete(
-            f"/api/chat/projects/{project_id}/summaries?after_id=0"
+            f"/api/chat/projects/{shared_project_id}/summaries?after_id=0"
         )
         assert response.status_code == 200
-        assert "deleted" in response.json()
+        assert "deleted" in read_json(response)
+
+
+@pytest.fixture
+def oversize_file() -> RepeatedByteStream:
+    """An 11MB upload, just over the 10MB limit, streamed in chunks by httpx."""
+    return RepeatedByteStream(11 * 1024 * 1024)
 
 
+@pytest.fixture(scope="session")
+def upload_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """Point chat uploads at a temporary directory that pytest removes in one go."""
+    path = tmp_path_factory.mktemp("uploads")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(chat_routes, "UPLOAD_DIR", path)
+        yield path
+
+
+@pytest.mark.usefixtures("upload_dir")
 class TestFileUploadAPI:
     """Tests for file upload API."""
 
-    async def test_upload_text_file(self, client: AsyncClient):
-        """Test uploading a text file."""
-        import contextlib
-        import io
-        from pathlib import Path
-
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Upload Test Project"}
-        )
-        project_id = project_response.json()["id"]
+    @pytest.mark.parametrize(
+        ("filename", "content", "mime_type", "status_code", "media_type"),
+        [
+            pytest.param(
+                "test.py", b"print('Hello, World!')", "text/x-python", 201, "code", id="code"
+            ),
+            pytest.param("test.png", PNG_BYTES, "image/png", 201, "image", id="image"),
+            pytest.param("empty.txt", b"", "text/plain", 400, None, id="empty-rejected"),
+        ],
+    )
+    async def test_upload_file(
+        self,
+        client: AsyncClient,
+        db: Database,
+        filename: str,
+        content: bytes,
+        mime_type: str,
+        status_code: int,
+        media_type: str | None,
+    ):
+        """Test uploading files of different types, and rejecting empty ones."""
+        project_id = await make_project(db, "Upload Test Project")
 
-        # Create file content
-        content = b"print('Hello, World!')"
-        files = {"file": ("test.py", io.BytesIO(content), "text/x-python")}
+        body, headers = multipart_upload(filename, content, mime_type)
 
         response = await client.post(
             f"/api/chat/projects/{project_id}/upload",
-            files=files,
-        )
-        assert response.status_code == 201
-        data = response.json()
-        assert data["filename"] == "test.py"
+            content=body,
+            headers=headers,
+        )
+        if status_code != 201:
+            assert response.status_code == status_code
+            assert b"empty" in response.content.lower()
+            return
+        data = expect_json(response, 201)
+        assert data["filename"] == filename
         assert data["size"] == len(content)
-        assert data["media_type"] == "code"
+        assert data["mime_type"] == mime_type
+        assert data["media_type"] == media_type
         assert "path" in data
 
-        # Clean up uploaded file
-        with contextlib.suppress(FileNotFoundError):
-            Path(data["path"]).unlink()
-
-    async def test_upload_image_file(self, client: AsyncClient):
-        """Test uploading an image file."""
-        import contextlib
-        import io
-        from pathlib import Path
+    async def test_upload_file_too_large_rejected(
+        self, client: AsyncClient, db: Database, oversize_file: RepeatedByteStream
+    ):
+        """Test that files exceeding size limit are rejected."""
+        project_id = await make_project(db, "Large File Project")
 
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Image Upload Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        # Minimal PNG (1x1 transparent pixel)
-        png_data = bytes([
-            0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
-            0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
-            0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,
-            0x08, 0x06, 0x00, 0x00, 0x00, 0x1F, 0x15, 0xC4,
-            0x89, 0x00, 0x00, 0x00, 0x0A, 0x49, 0x44, 0x41,  # IDAT chunk
-            0x54, 0x78, 0x9C, 0x63, 0x00, 0x01, 0x00, 0x00,
-            0x05, 0x00, 0x01, 0x0D, 0x0A, 0x2D, 0xB4, 0x00,
-            0x00, 0x00, 0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE,  # IEND chunk
-            0x42, 0x60, 0x82,
-        ])
-        files = {"file": ("test.png", io.BytesIO(png_data), "image/png")}
+        files = {"file": ("large.bin", oversize_file, "application/octet-stream")}
 
         response = await client.post(
             f"/api/chat/projects/{project_id}/upload",
             files=files,
+            headers={"origin": "http://frontend.test"},
         )
-        assert response.status_code == 201
-        data = response.json()
-        assert data["filename"] == "test.png"
-        assert data["media_type"] == "image"
-        assert data["mime_type"] == "image/png"
-
-        # Clean up
-        with contextlib.suppress(FileNotFoundError):
-            Path(data["path"]).unlink()
-
-    async def test_upload_empty_file_rejected(self, client: AsyncClient):
-        """Test that empty files are rejected."""
-        import io
-
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Empty File Project"}
-        )
-        project_id = project_response.json()["id"]
+        assert response.status_code == 413
+        assert b"too large" in response.content.lower()
+        # Rejected from Content-Length alone, without reading the body
+        assert oversize_file.tell() == 0
+        # CORS wraps the size check, so cross-origin clients can read the 413
+        assert response.headers["access-control-allow-origin"] == "http://frontend.test"
+
+    async def test_upload_size_limit_only_applies_to_upload_route(
+        self, client: AsyncClient, oversize_file: RepeatedByteStream, project_id: str
+    ):
+        """Test that an oversized body to a neighbouring chat route reaches the handler."""
+        files = {"file": ("large.bin", oversize_file, "application/octet-stream")}
 
-        files = {"file": ("empty.txt", io.BytesIO(b""), "text/plain")}
+        response = await client.post(f"/api/chat/projects/{project_id}/messages", files=files)
+        assert response.status_code == 422
 
-        response = await client.post(
-            f"/api/chat/projects/{project_id}/upload",
-            files=files,
-        )
-        assert response.status_code == 400
-        assert "empty" in response.json()["detail"].lower()
+    async def test_upload_size_limit_ignores_other_upload_paths(
+        self, client: AsyncClient, oversize_file: RepeatedByteStream
+    ):
+        """Test that POST paths ending in /upload outside chat skip the size check."""
+        files = {"file": ("large.bin", oversize_file, "application/octet-stream")}
 
-    async def test_upload_file_too_large_rejected(self, client: AsyncClient):
-        """Test that files exceeding size limit are rejected."""
-        import io
+        response = await client.post("/api/projects/some-project/upload", files=files)
+        assert response.status_code == 404
 
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Large File Project"}
-        )
-        project_id = project_response.json()["id"]
+    async def test_upload_file_too_large_without_length_rejected(
+        self, client: AsyncClient, db: Database
+    ):
+        """Test that oversized uploads without a Content-Length are still rejected."""
+        project_id = await make_project(db, "Unsized Large File Project")
 
-        # Create 11MB file (limit is 10MB)
-        large_content = b"x" * (11 * 1024 * 1024)
-        files = {"file": ("large.bin", io.BytesIO(large_content), "application/octet-stream")}
+        stream = RepeatedByteStream(11 * 1024 * 1024, sized=False)
+        files = {"file": ("large.bin", stream, "application/octet-stream")}
 
         response = await client.post(
             f"/api/chat/projects/{project_id}/upload",
             files=files,
         )
         assert response.status_code == 413
-        assert "too large" in response.json()["detail"].lower()
+        assert b"too large" in response.content.lower()
 
-    async def test_upload_creates_message_with_attachment(self, client: AsyncClient):
+    async def test_upload_creates_message_with_attachment(self, client: AsyncClient, db: Database):
         """Test creating a message with an uploaded file attachment."""
-        import contextlib
-        import io
-        from pathlib import Path
-
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Attachment Message Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Attachment Message Project")
 
         # Upload a file
         content = b"Configuration data"
-        files = {"file": ("config.json", io.BytesIO(content), "application/json")}
+        body, headers = multipart_upload("config.json", content, "application/json")
 
         upload_response = await client.post(
             f"/api/chat/projects/{project_id}/upload",
-            files=files,
+            content=body,
+            headers=headers,
         )
-        assert upload_response.status_code == 201
-        upload_data = upload_response.json()
+        upload_data = expect_json(upload_response, 201)
 
         # Create message with attachment
         message_response = await client.post(
@@ -2646,37 +2067,24 @@ class TestFileUploadAPI:
                 "media_path": upload_data["path"],
             },
         )
-        assert message_response.status_code == 201
-        message_data = message_response.json()
+        message_data = expect_json(message_response, 201)
         assert message_data["media_type"] == "code"
         assert message_data["media_path"] == upload_data["path"]
 
-        # Clean up
-        with contextlib.suppress(FileNotFoundError):
-            Path(upload_data["path"]).unlink()
-
-    async def test_get_uploaded_file_metadata(self, client: AsyncClient):
+    async def test_get_uploaded_file_metadata(self, client: AsyncClient, db: Database):
         """Test getting metadata for an uploaded file."""
-        import contextlib
-        import io
-        from pathlib import Path
-
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "File Metadata Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "File Metadata Project")
 
         # Upload a file
         content = b"Test document content"
-        files = {"file": ("doc.txt", io.BytesIO(content), "text/plain")}
+        body, headers = multipart_upload("doc.txt", content, "text/plain")
 
         upload_response = await client.post(
             f"/api/chat/projects/{project_id}/upload",
-            files=files,
+            content=body,
+            headers=headers,
         )
-        assert upload_response.status_code == 201
-        upload_data = upload_response.json()
+        upload_data = expect_json(upload_response, 201)
 
         # Extract filename from path
         filename = Path(upload_data["path"]).name
@@ -2685,49 +2093,32 @@ class TestFileUploadAPI:
         metadata_response = await client.get(
             f"/api/chat/projects/{project_id}/uploads/{filename}"
         )
-        assert metadata_response.status_code == 200
-        metadata = metadata_response.json()
+        metadata = expect_json(metadata_response)
         assert metadata["size"] == len(content)
 
-        # Clean up
-        with contextlib.suppress(FileNotFoundError):
-            Path(upload_data["path"]).unlink()
-
-    async def test_get_uploaded_file_not_found(self, client: AsyncClient):
+    async def test_get_uploaded_file_not_found(self, client: AsyncClient, db: Database):
         """Test getting metadata for non-existent file."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Not Found Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Not Found Project")
 
         response = await client.get(
             f"/api/chat/projects/{project_id}/uploads/nonexistent.txt"
         )
         assert response.status_code == 404
 
-    async def test_download_uploaded_file(self, client: AsyncClient):
+    async def test_download_uploaded_file(self, client: AsyncClient, db: Database):
         """Test downloading an uploaded file."""
-        import contextlib
-        import io
-        from pathlib import Path
-
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Download Test Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Download Test Project")
 
         # Upload a file
         content = b"Hello, World! This is a test file."
-        files = {"file": ("hello.txt", io.BytesIO(content), "text/plain")}
+        body, headers = multipart_upload("hello.txt", content, "text/plain")
 
         upload_response = await client.post(
             f"/api/chat/projects/{project_id}/upload",
-            files=files,
+            content=body,
+            headers=headers,
         )
-        assert upload_response.status_code == 201
-        upload_data = upload_response.json()
+        upload_data = expect_json(upload_response, 201)
 
         # Extract filename from path
         filename = Path(upload_data["path"]).name
@@ -2742,55 +2133,27 @@ class TestFileUploadAPI:
         # Check Content-Disposition header for original filename
         assert "hello.txt" in download_response.headers.get("content-disposition", "")
 
-        # Clean up
-        with contextlib.suppress(FileNotFoundError):
-            Path(upload_data["path"]).unlink()
-
-    async def test_download_uploaded_file_not_found(self, client: AsyncClient):
+    async def test_download_uploaded_file_not_found(self, client: AsyncClient, db: Database):
         """Test downloading a non-existent file returns 404."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Download Not Found Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Download Not Found Project")
 
         response = await client.get(
             f"/api/chat/projects/{project_id}/uploads/nonexistent.txt/download"
         )
         assert response.status_code == 404
 
-    async def test_download_uploaded_binary_file(self, client: AsyncClient):
+    async def test_download_uploaded_binary_file(self, client: AsyncClient, db: Database):
         """Test downloading a binary file (image)."""
-        import contextlib
-        import io
-        from pathlib import Path
+        project_id = await make_project(db, "Binary Download Project")
 
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Binary Download Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        # Minimal PNG (1x1 transparent pixel)
-        png_data = bytes([
-            0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
-            0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
-            0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,
-            0x08, 0x06, 0x00, 0x00, 0x00, 0x1F, 0x15, 0xC4,
-            0x89, 0x00, 0x00, 0x00, 0x0A, 0x49, 0x44, 0x41,  # IDAT chunk
-            0x54, 0x78, 0x9C, 0x63, 0x00, 0x01, 0x00, 0x00,
-            0x05, 0x00, 0x01, 0x0D, 0x0A, 0x2D, 0xB4, 0x00,
-            0x00, 0x00, 0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE,  # IEND chunk
-            0x42, 0x60, 0x82,
-        ])
-        files = {"file": ("image.png", io.BytesIO(png_data), "image/png")}
+        body, headers = multipart_upload("image.png", PNG_BYTES, "image/png")
 
         upload_response = await client.post(
             f"/api/chat/projects/{project_id}/upload",
-            files=files,
+            content=body,
+            headers=headers,
         )
-        assert upload_response.status_code == 201
-        upload_data = upload_response.json()
+        upload_data = expect_json(upload_response, 201)
 
         # Extract filename from path
         filename = Path(upload_data["path"]).name
@@ -2800,149 +2163,97 @@ class TestFileUploadAPI:
             f"/api/chat/projects/{project_id}/uploads/{filename}/download"
         )
         assert download_response.status_code == 200
-        assert download_response.content == png_data
+        assert download_response.content == PNG_BYTES
         assert download_response.headers["content-type"] == "image/png"
         # Check original filename in content-disposition
         assert "image.png" in download_response.headers.get("content-disposition", "")
 
-        # Clean up
-        with contextlib.suppress(FileNotFoundError):
-            Path(upload_data["path"]).unlink()
-
 
 class TestFileBrowserAPI:
     """Tests for file browser API."""
 
-    async def test_list_directory_no_working_dir(self, client: AsyncClient):
+    async def test_list_directory_no_working_dir(self, client: AsyncClient, db: Database):
         """Test listing files when project has no working directory configured."""
         # Create project without working_dir
-        project_response = await client.post(
-            "/api/projects", json={"name": "No WorkDir Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "No WorkDir Project")
 
         response = await client.get(f"/api/projects/{project_id}/files")
         assert response.status_code == 400
-        assert "working directory" in response.json()["detail"].lower()
+        assert "working directory" in read_json(response)["detail"].lower()
 
-    async def test_list_directory_with_working_dir(self, client: AsyncClient, app_with_db):
+    async def test_list_directory_with_working_dir(
+        self, client: AsyncClient, db: Database, tmp_path: Path
+    ):
         """Test listing files with a valid working directory."""
-        import tempfile
-        from pathlib import Path
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create some test files
-            test_dir = Path(tmpdir)
-            (test_dir / "file1.py").write_text("# Python file")
-            (test_dir / "file2.txt").write_text("Text file")
-            (test_dir / "subdir").mkdir()
-            (test_dir / "subdir" / "nested.js").write_text("// JS file")
-
-            # Create project with working_dir in settings
-            project_response = await client.post(
-                "/api/projects",
-                json={
-                    "name": "File Browser Project",
-                    "repo_url": str(test_dir),  # Use local path
-                },
-            )
-            project_id = project_response.json()["id"]
-
-            # List root directory
-            response = await client.get(f"/api/projects/{project_id}/files")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["path"] == ""
-            assert data["parent_path"] is None
-            entries = {e["name"]: e for e in data["entries"]}
-            assert "file1.py" in entries
-            assert "file2.txt" in entries
-            assert "subdir" in entries
-            assert entries["subdir"]["is_dir"] is True
-            assert entries["file1.py"]["is_dir"] is False
-
-    async def test_list_subdirectory(self, client: AsyncClient):
+        # Create some test files
+        (tmp_path / "file1.py").write_text("# Python file")
+        (tmp_path / "file2.txt").write_text("Text file")
+        (tmp_path / "subdir").mkdir()
+        (tmp_path / "subdir" / "nested.js").write_text("// JS file")
+
+        # Create project with working_dir in settings
+        project_id = await make_project(db, "File Browser Project", repo_url=str(tmp_path))
+
+        # List root directory
+        response = await client.get(f"/api/projects/{project_id}/files")
+        data = expect_json(response)
+        assert data["path"] == ""
+        assert data["parent_path"] is None
+        assert {e["name"]: e["is_dir"] for e in data["entries"]} == {
+            "file1.py": False,
+            "file2.txt": False,
+            "subdir": True,
+        }
+
+    async def test_list_subdirectory(self, client: AsyncClient, db: Database, tmp_path: Path):
         """Test listing files in a subdirectory."""
-        import tempfile
-        from pathlib import Path
+        (tmp_path / "subdir").mkdir()
+        (tmp_path / "subdir" / "nested.py").write_text("# Nested")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-            (test_dir / "subdir").mkdir()
-            (test_dir / "subdir" / "nested.py").write_text("# Nested")
+        project_id = await make_project(db, "Subdir Project", repo_url=str(tmp_path))
 
-            project_response = await client.post(
-                "/api/projects",
-                json={"name": "Subdir Project", "repo_url": str(test_dir)},
-            )
-            project_id = project_response.json()["id"]
+        response = await client.get(
+            f"/api/projects/{project_id}/files", params={"path": "subdir"}
+        )
+        data = expect_json(response)
+        assert data["path"] == "subdir"
+        assert data["parent_path"] == ""
+        assert [e["name"] for e in data["entries"]] == ["nested.py"]
 
-            response = await client.get(
-                f"/api/projects/{project_id}/files", params={"path": "subdir"}
-            )
-            assert response.status_code == 200
-            data = response.json()
-            assert data["path"] == "subdir"
-            assert data["parent_path"] == ""
-            entries = {e["name"]: e for e in data["entries"]}
-            assert "nested.py" in entries
-
-    async def test_get_file_content(self, client: AsyncClient):
+    async def test_get_file_content(self, client: AsyncClient, db: Database, tmp_path: Path):
         """Test getting file content."""
-        import tempfile
-        from pathlib import Path
+        (tmp_path / "test.py").write_text("print('hello')")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = Path(tmpdir)
-            (test_dir / "test.py").write_text("print('hello')")
+        project_id = await make_project(db, "Content Project", repo_url=str(tmp_path))
 
-            project_response = await client.post(
-                "/api/projects",
-                json={"name": "Content Project", "repo_url": str(test_dir)},
-            )
-            project_id = project_response.json()["id"]
-
-            response = await client.get(
-                f"/api/projects/{project_id}/files/content", params={"path": "test.py"}
-            )
-            assert response.status_code == 200
-            data = response.json()
-            assert data["path"] == "test.py"
-            assert data["content"] == "print('hello')"
-            assert data["is_binary"] is False
+        response = await client.get(
+            f"/api/projects/{project_id}/files/content", params={"path": "test.py"}
+        )
+        data = expect_json(response)
+        assert data["path"] == "test.py"
+        assert data["content"] == "print('hello')"
+        assert data["is_binary"] is False
 
-    async def test_get_file_content_not_found(self, client: AsyncClient):
+    async def test_get_file_content_not_found(
+        self, client: AsyncClient, db: Database, tmp_path: Path
+    ):
         """Test getting content of non-existent file."""
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_response = await client.post(
-                "/api/projects",
-                json={"name": "NotFound Project", "repo_url": tmpdir},
-            )
-            project_id = project_response.json()["id"]
+        project_id = await make_project(db, "NotFound Project", repo_url=str(tmp_path))
 
-            response = await client.get(
-                f"/api/projects/{project_id}/files/content",
-                params={"path": "nonexistent.py"},
-            )
-            assert response.status_code == 404
+        response = await client.get(
+            f"/api/projects/{project_id}/files/content",
+            params={"path": "nonexistent.py"},
+        )
+        assert response.status_code == 404
 
-    async def test_path_traversal_blocked(self, client: AsyncClient):
+    async def test_path_traversal_blocked(self, client: AsyncClient, db: Database, tmp_path: Path):
         """Test that path traversal attempts are blocked."""
-        import tempfile
+        project_id = await make_project(db, "Traversal Project", repo_url=str(tmp_path))
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_response = await client.post(
-                "/api/projects",
-                json={"name": "Traversal Project", "repo_url": tmpdir},
-            )
-            project_id = project_response.json()["id"]
-
-            response = await client.get(
-                f"/api/projects/{project_id}/files", params={"path": "../../../etc"}
-            )
-            assert response.status_code == 403
+        response = await client.get(
+            f"/api/projects/{project_id}/files", params={"path": "../../../etc"}
+        )
+        assert response.status_code == 403
 
 
 class TestMetricsAPI:
@@ -2951,8 +2262,7 @@ class TestMetricsAPI:
     async def test_get_metrics(self, client: AsyncClient):
         """Test getting complete metrics."""
         response = await client.get("/api/metrics")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         # Check structure
         assert "timestamp" in data
@@ -2984,35 +2294,19 @@ class TestMetricsAPI:
         assert "tasks_failed" in data["activity_24h"]
         assert "tasks_created" in data["activity_24h"]
 
-    async def test_get_metrics_with_data(self, client: AsyncClient):
+    async def test_get_metrics_with_data(
+        self, client: AsyncClient, shared_project_id: str, db: Database
+    ):
         """Test metrics after creating tasks and workers."""
-        # Create a project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Metrics Test Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        # Create some tasks
-        for i in range(3):
-            await client.post(
-                "/api/tasks",
-                json={"project_id": project_id, "title": f"Task {i}"},
-            )
-
-        # Create a worker
-        await client.post(
-            "/api/workers",
-            json={
-                "name": "Test Worker",
-                "type": "test",
-                "command": "echo",
-            },
+        # Create some tasks and a worker
+        await asyncio.gather(
+            *[make_task(db, shared_project_id, f"Task {i}") for i in range(3)],
+            make_worker(db),
         )
 
         # Get metrics
         response = await client.get("/api/metrics")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         # Verify counts reflect our data
         assert data["task_stats"]["total"] >= 3
@@ -3021,8 +2315,7 @@ class TestMetricsAPI:
     async def test_get_task_stats(self, client: AsyncClient):
         """Test getting task stats endpoint."""
         response = await client.get("/api/metrics/tasks")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert "total" in data
         assert "ready" in data
         assert "done" in data
@@ -3030,8 +2323,7 @@ class TestMetricsAPI:
     async def test_get_worker_metrics(self, client: AsyncClient):
         """Test getting worker metrics endpoint."""
         response = await client.get("/api/metrics/workers")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert "total" in data
         assert "idle" in data
         assert "busy" in data
@@ -3040,23 +2332,16 @@ class TestMetricsAPI:
     async def test_get_events(self, client: AsyncClient):
         """Test getting recent events."""
         response = await client.get("/api/metrics/events")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
+        assert_json_list(response)
 
-    async def test_get_events_with_filter(self, client: AsyncClient):
+    async def test_get_events_with_filter(self, client: AsyncClient, shared_project_id: str):
         """Test getting events with filters."""
-        # Create a project and task to generate events
-        project_response = await client.post(
-            "/api/projects", json={"name": "Event Test Project"}
-        )
-        project_id = project_response.json()["id"]
-
+        # Create a task to generate events
         task_response = await client.post(
             "/api/tasks",
-            json={"project_id": project_id, "title": "Event Task"},
+            json={"project_id": shared_project_id, "title": "Event Task"},
         )
-        task_id = task_response.json()["id"]
+        task_id = read_json(task_response)["id"]
 
         # Mark task as ready
         await client.post("/api/queue/enqueue", json={"task_id": task_id})
@@ -3065,15 +2350,12 @@ class TestMetricsAPI:
         response = await client.get(
             "/api/metrics/events", params={"entity_type": "task"}
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
+        assert_json_list(response)
 
     async def test_get_activity(self, client: AsyncClient):
         """Test getting activity summary."""
         response = await client.get("/api/metrics/activity")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert "tasks_completed" in data
         assert "tasks_failed" in data
         assert "tasks_created" in data
@@ -3081,15 +2363,13 @@ class TestMetricsAPI:
     async def test_get_activity_custom_hours(self, client: AsyncClient):
         """Test getting activity with custom hours parameter."""
         response = await client.get("/api/metrics/activity", params={"hours": 48})
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert "tasks_completed" in data
 
     async def test_get_metrics_event_limit(self, client: AsyncClient):
         """Test metrics with custom event limit."""
         response = await client.get("/api/metrics", params={"event_limit": 5})
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         # Recent events should be capped at the limit
         assert len(data["recent_events"]) <= 5
 
@@ -3097,79 +2377,53 @@ class TestMetricsAPI:
 class TestInputAPI:
     """Tests for input API - testing routes/input.py."""
 
-    async def test_submit_simple_input(self, client: AsyncClient):
+    async def test_submit_simple_input(self, client: AsyncClient, shared_project_id: str):
         """Test submitting simple input creates a task."""
-        # Create project first
-        project_response = await client.post(
-            "/api/projects", json={"name": "Input Test Project"}
-        )
-        project_id = project_response.json()["id"]
-
         response = await client.post(
             "/api/input",
             json={
-                "project_id": project_id,
+                "project_id": shared_project_id,
                 "text": "Add a logout button to the navigation bar",
             },
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is True
         assert len(data["created_tasks"]) >= 1
-        assert any("logout" in t["title"].lower() or "button" in t["title"].lower()
-                   for t in data["created_tasks"])
+        titles = [t["title"].lower() for t in data["created_tasks"]]
+        assert any("logout" in title or "button" in title for title in titles), titles
 
-    async def test_submit_multiple_tasks_input(self, client: AsyncClient):
+    async def test_submit_multiple_tasks_input(self, client: AsyncClient, shared_project_id: str):
         """Test submitting input with multiple tasks."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Multi Input Project"}
-        )
-        project_id = project_response.json()["id"]
-
         response = await client.post(
             "/api/input",
             json={
-                "project_id": project_id,
+                "project_id": shared_project_id,
                 "text": "Fix the login bug. Then add password reset. Finally, test the authentication flow.",
             },
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is True
         assert len(data["created_tasks"]) >= 2
 
-    async def test_submit_empty_input(self, client: AsyncClient):
+    async def test_submit_empty_input(self, client: AsyncClient, shared_project_id: str):
         """Test submitting empty input."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Empty Input Project"}
-        )
-        project_id = project_response.json()["id"]
-
         response = await client.post(
             "/api/input",
             json={
-                "project_id": project_id,
+                "project_id": shared_project_id,
                 "text": "",
             },
         )
         # Should fail validation
-        assert response.status_code == 422
-
-    async def test_suggest_related(self, client: AsyncClient):
-        """Test suggesting related tasks."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Suggest Related Project"}
-        )
-        project_id = project_response.json()["id"]
+        assert response.status_code == 422
 
+    async def test_suggest_related(self, client: AsyncClient, shared_project_id: str):
+        """Test suggesting related tasks."""
         # Create initial task
         await client.post(
             "/api/input",
             json={
-                "project_id": project_id,
+                "project_id": shared_project_id,
                 "text": "Implement user authentication system",
             },
         )
@@ -3178,60 +2432,45 @@ class TestInputAPI:
         response = await client.post(
             "/api/input/suggest-related",
             json={
-                "project_id": project_id,
+                "project_id": shared_project_id,
                 "text": "user authentication",
             },
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert "related_tasks" in data
 
-    async def test_submit_with_priority(self, client: AsyncClient):
+    async def test_submit_with_priority(self, client: AsyncClient, shared_project_id: str):
         """Test submitting input with custom priority."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Priority Input Project"}
-        )
-        project_id = project_response.json()["id"]
-
         response = await client.post(
             "/api/input",
             json={
-                "project_id": project_id,
+                "project_id": shared_project_id,
                 "text": "Fix critical security vulnerability",
                 "priority": "P0",
             },
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is True
 
         # Verify task was created with P0 priority
         tasks_response = await client.get(
-            f"/api/tasks?project_id={project_id}"
+            f"/api/tasks?project_id={shared_project_id}"
         )
-        tasks = tasks_response.json()
+        tasks = read_json(tasks_response)
         assert len(tasks) > 0
         assert tasks[0]["priority"] == "P0"
 
-    async def test_submit_without_decompose(self, client: AsyncClient):
+    async def test_submit_without_decompose(self, client: AsyncClient, shared_project_id: str):
         """Test submitting input with decomposition disabled."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "No Decompose Project"}
-        )
-        project_id = project_response.json()["id"]
-
         response = await client.post(
             "/api/input",
             json={
-                "project_id": project_id,
+                "project_id": shared_project_id,
                 "text": "Build a complete API with multiple endpoints",
                 "auto_decompose": False,
             },
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is True
 
 
@@ -3248,33 +2487,21 @@ class TestLogsAPI:
                 "message": "Test log message",
             },
         )
-        assert response.status_code == 201
-        data = response.json()
+        data = expect_json(response, 201)
         assert data["level"] == "info"
         assert data["component"] == "api"
         assert data["message"] == "Test log message"
         assert "id" in data
         assert "timestamp" in data
 
-    async def test_create_log_with_context(self, client: AsyncClient):
+    async def test_create_log_with_context(
+        self, client: AsyncClient, shared_project_id: str, db: Database
+    ):
         """Test creating a log entry with task and worker context."""
-        # Create project, task, and worker
-        project_response = await client.post(
-            "/api/projects", json={"name": "Log Context Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Log Test Task"},
-        )
-        task_id = task_response.json()["id"]
+        # Create task and worker
+        task_id = await make_task(db, shared_project_id, "Log Test Task")
 
-        worker_response = await client.post(
-            "/api/workers",
-            json={"name": "Log Test Worker", "type": "test", "command": "echo"},
-        )
-        worker_id = worker_response.json()["id"]
+        worker_id = await make_worker(db, "Log Test Worker")
 
         response = await client.post(
             "/api/logs",
@@ -3284,22 +2511,46 @@ class TestLogsAPI:
                 "message": "Task taking longer than expected",
                 "task_id": task_id,
                 "worker_id": worker_id,
-                "project_id": project_id,
+                "project_id": shared_project_id,
                 "data": {"elapsed_seconds": 120},
             },
         )
-        assert response.status_code == 201
-        data = response.json()
+        data = expect_json(response, 201)
         assert data["task_id"] == task_id
         assert data["worker_id"] == worker_id
-        assert data["project_id"] == project_id
+        assert data["project_id"] == shared_project_id
         assert data["data"]["elapsed_seconds"] == 120
 
+    async def test_create_logs_bulk_is_atomic(self, client: AsyncClient, db: Database):
+        """Test that a bulk batch with one bad entry stores none of its entries."""
+        response = await client.post(
+            "/api/logs/bulk",
+            json=[
+                {"component": "api", "message": "Orphan A"},
+                {"component": "api", "message": "Orphan B", "task_id": "missing-task"},
+                {"component": "api", "message": "Orphan C"},
+            ],
+        )
+        assert response.status_code == 400
+
+        # A later write commits the connection; nothing from the batch may ride along
+        await seed_logs(client, {"component": "api", "message": "Unrelated"})
+        rows = await db.fetchall("SELECT message FROM logs")
+        assert [row["message"] for row in rows] == ["Unrelated"]
+
+    async def test_create_logs_bulk_too_many(self, client: AsyncClient):
+        """Test that bulk batches above the size limit are rejected."""
+        entries = [
+            {"component": "api", "message": f"Log {i}"}
+            for i in range(logs_routes.MAX_BULK_LOGS + 1)
+        ]
+        response = await client.post("/api/logs/bulk", json=entries)
+        assert response.status_code == 422
+
     async def test_list_logs_empty(self, client: AsyncClient):
         """Test listing logs when none exist."""
         response = await client.get("/api/logs")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert "logs" in data
         assert "total" in data
         assert "offset" in data
@@ -3308,98 +2559,135 @@ class TestLogsAPI:
     async def test_list_logs_with_data(self, client: AsyncClient):
         """Test listing logs with existing data."""
         # Create some logs
-        for i in range(5):
-            await client.post(
-                "/api/logs",
-                json={
-                    "level": "info",
-                    "component": "api",
-                    "message": f"Test log {i}",
-                },
-            )
+        created = await seed_logs(
+            client,
+            *[
+                {"level": "info", "component": "api", "message": f"Test log {i}"}
+                for i in range(5)
+            ],
+        )
+        assert [log["message"] for log in created] == [f"Test log {i}" for i in range(5)]
 
         response = await client.get("/api/logs")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["total"] >= 5
         assert len(data["logs"]) >= 5
 
     async def test_list_logs_filter_by_component(self, client: AsyncClient):
         """Test filtering logs by component."""
         # Create logs for different components
-        await client.post(
-            "/api/logs",
-            json={"level": "info", "component": "api", "message": "API log"},
-        )
-        await client.post(
-            "/api/logs",
-            json={"level": "info", "component": "scheduler", "message": "Scheduler log"},
+        await seed_logs(
+            client,
+            {"level": "info", "component": "api", "message": "API log"},
+            {"level": "info", "component": "scheduler", "message": "Scheduler log"},
         )
 
         response = await client.get("/api/logs", params={"component": "api"})
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         for log in data["logs"]:
             assert log["component"] == "api"
 
     async def test_list_logs_filter_by_level(self, client: AsyncClient):
         """Test filtering logs by level."""
         # Create logs with different levels
-        await client.post(
-            "/api/logs",
-            json={"level": "info", "component": "api", "message": "Info log"},
-        )
-        await client.post(
-            "/api/logs",
-            json={"level": "error", "component": "api", "message": "Error log"},
+        await seed_logs(
+            client,
+            {"level": "info", "component": "api", "message": "Info log"},
+            {"level": "error", "component": "api", "message": "Error log"},
         )
 
         response = await client.get("/api/logs", params={"level": "error"})
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         for log in data["logs"]:
             assert log["level"] == "error"
 
     async def test_list_logs_pagination(self, client: AsyncClient):
         """Test log pagination."""
         # Create 10 logs
-        for i in range(10):
-            await client.post(
-                "/api/logs",
-                json={"level": "info", "component": "api", "message": f"Paginated log {i}"},
-            )
+        await seed_logs(
+            client,
+            *[
+                {"level": "info", "component": "api", "message": f"Paginated log {i}"}
+                for i in range(10)
+            ],
+        )
 
         # Get first page
         response = await client.get("/api/logs", params={"limit": 5, "offset": 0})
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert len(data["logs"]) == 5
         assert data["offset"] == 0
         assert data["limit"] == 5
 
         # Get second page
         response = await client.get("/api/logs", params={"limit": 5, "offset": 5})
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["offset"] == 5
 
+    async def test_list_logs_cursor_pagination(self, client: AsyncClient):
+        """Test paging through logs with next_cursor."""
+        await seed_logs(
+            client,
+            *[
+                {"level": "info", "component": "queue", "message": f"Cursor log {i}"}
+                for i in range(5)
+            ],
+        )
+
+        messages = []
+        params = {"component": "queue", "limit": 2}
+        while True:
+            data = expect_json(await client.get("/api/logs", params=params))
+            assert data["total"] == 5
+            messages.extend(log["message"] for log in data["logs"])
+            if data["next_cursor"] is None:
+                break
+            params["cursor"] = data["next_cursor"]
+
+        # Entries share a timestamp, so the id tie-break keeps pages disjoint
+        assert messages == [f"Cursor log {i}" for i in reversed(range(5))]
+
+    async def test_list_logs_invalid_cursor(self, client: AsyncClient):
+        """Test that a malformed cursor is rejected."""
+        response = await client.get("/api/logs", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "where",
+        [
+            "",
+            "WHERE (timestamp, id) < ('2026-01-01', 10)",
+            "WHERE component = 'api'",
+            "WHERE component = 'api' AND (timestamp, id) < ('2026-01-01', 10)",
+            "WHERE level = 'info'",
+            "WHERE component = 'api' AND level = 'info'",
+            "WHERE task_id = 'task-1'",
+            "WHERE worker_id = 'worker-1'",
+        ],
+    )
+    async def test_list_logs_order_served_by_index(self, db: Database, where: str):
+        """Test that log listing reads rows presorted instead of sorting each page."""
+        rows = await db.fetchall(
+            f"EXPLAIN QUERY PLAN SELECT * FROM logs {where} "
+            "ORDER BY timestamp DESC, id DESC LIMIT 100"
+        )
+        details = [row["detail"] for row in rows]
+        assert not any("TEMP B-TREE" in detail for detail in details), details
+
     async def test_list_logs_search(self, client: AsyncClient):
         """Test full-text search in logs."""
         # Create logs with different messages
-        await client.post(
-            "/api/logs",
-            json={"level": "info", "component": "api", "message": "Database connection established"},
-        )
-        await client.post(
-            "/api/logs",
-            json={"level": "error", "component": "api", "message": "Authentication failed"},
+        await seed_logs(
+            client,
+            {"level": "info", "component": "api", "message": "Database connection established"},
+            {"level": "error", "component": "api", "message": "Authentication failed"},
         )
 
+        # Each test runs in its own savepoint, so the FTS match is exact
         response = await client.get("/api/logs", params={"search": "Database"})
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["logs"]) >= 1
-        assert any("Database" in log["message"] for log in data["logs"])
+        data = expect_json(response)
+        assert data["total"] == 1
+        assert data["logs"][0]["message"] == "Database connection established"
 
     async def test_get_recent_logs(self, client: AsyncClient):
         """Test getting recent logs."""
@@ -3410,47 +2698,26 @@ class TestLogsAPI:
         )
 
         response = await client.get("/api/logs/recent", params={"minutes": 60})
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, list)
+        assert_json_list(response)
 
-    async def test_get_logs_for_task(self, client: AsyncClient):
+    async def test_get_logs_for_task(
+        self, client: AsyncClient, shared_project_id: str, db: Database
+    ):
         """Test getting logs for a specific task."""
-        # Create project and task
-        project_response = await client.post(
-            "/api/projects", json={"name": "Task Log Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Logged Task"},
-        )
-        task_id = task_response.json()["id"]
+        # Create task
+        task_id = await make_task(db, shared_project_id, "Logged Task")
 
         # Create logs for this task
-        await client.post(
-            "/api/logs",
-            json={
-                "level": "info",
-                "component": "worker",
-                "message": "Task started",
-                "task_id": task_id,
-            },
-        )
-        await client.post(
-            "/api/logs",
-            json={
-                "level": "info",
-                "component": "worker",
-                "message": "Task completed",
-                "task_id": task_id,
-            },
+        await seed_logs(
+            client,
+            *[
+                {"level": "info", "component": "worker", "message": message, "task_id": task_id}
+                for message in ("Task started", "Task completed")
+            ],
         )
 
         response = await client.get(f"/api/logs/for-task/{task_id}")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert len(data) >= 2
         for log in data:
             assert log["task_id"] == task_id
@@ -3460,14 +2727,10 @@ class TestLogsAPI:
         response = await client.get("/api/logs/for-task/bd-nonexistent")
         assert response.status_code == 404
 
-    async def test_get_logs_for_worker(self, client: AsyncClient):
+    async def test_get_logs_for_worker(self, client: AsyncClient, db: Database):
         """Test getting logs for a specific worker."""
         # Create worker
-        worker_response = await client.post(
-            "/api/workers",
-            json={"name": "Logged Worker", "type": "test", "command": "echo"},
-        )
-        worker_id = worker_response.json()["id"]
+        worker_id = await make_worker(db, "Logged Worker")
 
         # Create logs for this worker
         await client.post(
@@ -3481,8 +2744,7 @@ class TestLogsAPI:
         )
 
         response = await client.get(f"/api/logs/for-worker/{worker_id}")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         for log in data:
             assert log["worker_id"] == worker_id
 
@@ -3494,8 +2756,7 @@ class TestLogsAPI:
     async def test_get_log_components(self, client: AsyncClient):
         """Test getting list of log components."""
         response = await client.get("/api/logs/components")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert "api" in data
         assert "scheduler" in data
         assert "worker" in data
@@ -3503,8 +2764,7 @@ class TestLogsAPI:
     async def test_get_log_levels(self, client: AsyncClient):
         """Test getting list of log levels."""
         response = await client.get("/api/logs/levels")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert "debug" in data
         assert "info" in data
         assert "warning" in data
@@ -3514,24 +2774,66 @@ class TestLogsAPI:
     async def test_get_log_stats(self, client: AsyncClient):
         """Test getting log statistics."""
         # Create logs with different levels and components
-        await client.post(
-            "/api/logs",
-            json={"level": "info", "component": "api", "message": "Info 1"},
-        )
-        await client.post(
-            "/api/logs",
-            json={"level": "error", "component": "scheduler", "message": "Error 1"},
+        await seed_logs(
+            client,
+            {"level": "info", "component": "api", "message": "Info 1"},
+            {"level": "error", "component": "scheduler", "message": "Error 1"},
         )
 
         response = await client.get("/api/logs/stats", params={"hours": 24})
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert "period_hours" in data
         assert "total" in data
         assert "errors" in data
         assert "by_level" in data
         assert "by_component" in data
 
+    async def test_get_log_stats_counts(self, client: AsyncClient, db: Database):
+        """Test that stats counts match the logs in the window."""
+        await seed_logs(
+            client,
+            {"level": "info", "component": "api", "message": "Info 1"},
+            {"level": "info", "component": "api", "message": "Info 2"},
+            {"level": "error", "component": "scheduler", "message": "Error 1"},
+            {"level": "critical", "component": "worker", "message": "Critical 1"},
+        )
+        # Outside the 24 hour window
+        await db.execute(
+            "INSERT INTO logs (timestamp, level, component, message) VALUES (?, ?, ?, ?)",
+            ("2000-01-01T00:00:00+00:00", "error", "api", "Ancient error"),
+        )
+        await db.commit()
+
+        response = await client.get("/api/logs/stats", params={"hours": 24})
+        data = expect_json(response)
+        assert data["total"] == 4
+        assert data["errors"] == 2
+        assert data["by_level"] == {"info": 2, "error": 1, "critical": 1}
+        assert data["by_component"] == {"api": 2, "scheduler": 1, "worker": 1}
+
+        # Deleting logs removes them from the hourly rollup too
+        response = await client.delete("/api/logs", params={"days": 1})
+        assert expect_json(response)["deleted"] == 1
+        row = await db.fetchone("SELECT COUNT(*) FROM log_stats_hourly WHERE hour = '2000-01-01T00'")
+        assert row[0] == 0
+
+    async def test_get_log_stats_partial_hour(self, client: AsyncClient, db: Database):
+        """Test that the window edge is exact rather than rounded to the hour."""
+        window_start = datetime.now(UTC) - timedelta(hours=2)
+        await db.executemany(
+            "INSERT INTO logs (timestamp, level, component, message) VALUES (?, ?, ?, ?)",
+            [
+                ((window_start + timedelta(minutes=5)).isoformat(), "info", "api", "Inside"),
+                ((window_start - timedelta(minutes=5)).isoformat(), "info", "api", "Outside"),
+            ],
+        )
+        await db.commit()
+
+        response = await client.get("/api/logs/stats", params={"hours": 2})
+        data = expect_json(response)
+        assert data["total"] == 1
+        assert data["by_level"] == {"info": 1}
+
     async def test_clear_old_logs(self, client: AsyncClient):
         """Test clearing old logs."""
         # Create a log
@@ -3542,25 +2844,37 @@ class TestLogsAPI:
 
         # Try to clear logs older than 7 days (should delete nothing recent)
         response = await client.delete("/api/logs", params={"days": 7})
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert "deleted" in data
         assert "cutoff" in data
 
-    async def test_create_log_emits_websocket_event(self, client: AsyncClient):
-        """Test that creating a log emits a WebSocket event."""
-        import asyncio
+    async def test_clear_old_logs_in_batches(
+        self, client: AsyncClient, db: Database, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that clearing spans several batches and keeps recent logs."""
+        monkeypatch.setattr(logs_routes, "CLEAR_LOGS_BATCH_SIZE", 2)
+        await db.executemany(
+            "INSERT INTO logs (timestamp, level, component, message) VALUES (?, ?, ?, ?)",
+            [("2000-01-01T00:00:00+00:00", "info", "api", f"Old log {i}") for i in range(5)],
+        )
+        await db.commit()
+        await seed_logs(client, {"level": "info", "component": "api", "message": "Log to keep"})
+
+        response = await client.delete("/api/logs", params={"days": 7})
+        assert expect_json(response)["deleted"] == 5
 
-        from ringmaster.events import event_bus
-        from ringmaster.events.types import EventType
+        data = expect_json(await client.get("/api/logs"))
+        assert [log["message"] for log in data["logs"]] == ["Log to keep"]
 
+    async def test_create_log_emits_websocket_event(self, client: AsyncClient):
+        """Test that creating a log emits a WebSocket event."""
         # Track events received
         received_events = []
 
         async def capture_event(event):
             received_events.append(event)
 
-        event_bus.add_callback(capture_event)
+        event_bus.add_callback(capture_event, [EventType.LOG_CREATED])
 
         try:
             # Create a log entry
@@ -3573,18 +2887,14 @@ class TestLogsAPI:
                     "project_id": None,
                 },
             )
-            assert response.status_code == 201
-            log_data = response.json()
-
-            # Allow event to be processed
-            await asyncio.sleep(0.05)
+            log_data = expect_json(response, 201)
+            await event_bus.flush()
 
             # Verify event was emitted
-            log_events = [e for e in received_events if e.type == EventType.LOG_CREATED]
-            assert len(log_events) >= 1
+            assert len(received_events) == 1
 
             # Check event data
-            last_log_event = log_events[-1]
+            last_log_event = received_events[0]
             assert last_log_event.data["id"] == log_data["id"]
             assert last_log_event.data["level"] == "info"
             assert last_log_event.data["component"] == "api"
@@ -3594,27 +2904,16 @@ class TestLogsAPI:
             event_bus.remove_callback(capture_event)
 
     async def test_create_log_with_project_emits_event_with_project_id(
-        self, client: AsyncClient
+        self, client: AsyncClient, shared_project_id: str
     ):
         """Test that log events include project_id for filtering."""
-        import asyncio
-
-        from ringmaster.events import event_bus
-        from ringmaster.events.types import EventType
-
-        # Create a project first
-        project_response = await client.post(
-            "/api/projects", json={"name": "Log Event Project"}
-        )
-        project_id = project_response.json()["id"]
-
         # Track events received
         received_events = []
 
         async def capture_event(event):
             received_events.append(event)
 
-        event_bus.add_callback(capture_event)
+        event_bus.add_callback(capture_event, [EventType.LOG_CREATED])
 
         try:
             # Create a log entry with project_id
@@ -3624,20 +2923,17 @@ class TestLogsAPI:
                     "level": "warning",
                     "component": "scheduler",
                     "message": "Project-scoped log",
-                    "project_id": project_id,
+                    "project_id": shared_project_id,
                 },
             )
             assert response.status_code == 201
+            await event_bus.flush()
 
-            # Allow event to be processed
-            await asyncio.sleep(0.05)
+            # Verify event includes shared_project_id for filtering
+            assert len(received_events) == 1
 
-            # Verify event includes project_id for filtering
-            log_events = [e for e in received_events if e.type == EventType.LOG_CREATED]
-            assert len(log_events) >= 1
-
-            last_log_event = log_events[-1]
-            assert last_log_event.project_id == project_id
+            last_log_event = received_events[0]
+            assert last_log_event.project_id == shared_project_id
 
         finally:
             event_bus.remove_callback(capture_event)
@@ -3646,42 +2942,27 @@ class TestLogsAPI:
 class TestGraphAPI:
     """Tests for graph API - task dependency visualization."""
 
-    async def test_get_graph_empty_project(self, client: AsyncClient):
+    async def test_get_graph_empty_project(self, client: AsyncClient, db: Database):
         """Test getting graph for project with no tasks."""
         # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Empty Graph Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Empty Graph Project")
 
         response = await client.get(f"/api/graph?project_id={project_id}")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["nodes"] == []
         assert data["edges"] == []
         assert data["stats"]["total_nodes"] == 0
         assert data["stats"]["total_edges"] == 0
 
-    async def test_get_graph_with_tasks(self, client: AsyncClient):
+    async def test_get_graph_with_tasks(self, client: AsyncClient, db: Database):
         """Test getting graph for project with tasks."""
         # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Graph Test Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Graph Test Project")
 
         # Create tasks
-        task1_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task 1"},
-        )
-        task1_id = task1_response.json()["id"]
+        task1_id = await make_task(db, project_id, "Task 1")
 
-        task2_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task 2"},
-        )
-        task2_id = task2_response.json()["id"]
+        task2_id = await make_task(db, project_id, "Task 2")
 
         # Add dependency: task2 depends on task1
         await client.post(
@@ -3690,8 +2971,7 @@ class TestGraphAPI:
         )
 
         response = await client.get(f"/api/graph?project_id={project_id}")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         # Check nodes
         assert len(data["nodes"]) == 2
@@ -3709,28 +2989,16 @@ class TestGraphAPI:
         assert data["stats"]["total_nodes"] == 2
         assert data["stats"]["total_edges"] == 1
 
-    async def test_get_graph_includes_node_properties(self, client: AsyncClient):
+    async def test_get_graph_includes_node_properties(self, client: AsyncClient, db: Database):
         """Test that graph nodes include necessary properties."""
         # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Node Properties Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Node Properties Project")
 
         # Create task
-        task_response = await client.post(
-            "/api/tasks",
-            json={
-                "project_id": project_id,
-                "title": "Test Task",
-                "priority": "P1",
-            },
-        )
-        task_id = task_response.json()["id"]
+        task_id = await make_task(db, project_id, "Test Task", priority=Priority.P1)
 
         response = await client.get(f"/api/graph?project_id={project_id}")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         assert len(data["nodes"]) == 1
         node = data["nodes"][0]
@@ -3742,76 +3010,40 @@ class TestGraphAPI:
         assert "pagerank_score" in node
         assert "on_critical_path" in node
 
-    async def test_get_graph_excludes_done_by_default(self, client: AsyncClient):
+    async def test_get_graph_excludes_done_by_default(self, client: AsyncClient, db: Database):
         """Test that completed tasks are excluded by default."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Done Exclude Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        # Create task and mark as done
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Done Task"},
-        )
-        task_id = task_response.json()["id"]
-
-        await client.patch(
-            f"/api/tasks/{task_id}",
-            json={"status": "done"},
-        )
-
-        # Create another task that's not done
-        await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Active Task"},
+        # Create one done task and one that's not done
+        project_id = await make_project(db, "Done Exclude Project")
+        await asyncio.gather(
+            make_task(db, project_id, "Done Task", status=TaskStatus.DONE),
+            make_task(db, project_id, "Active Task"),
         )
 
         response = await client.get(f"/api/graph?project_id={project_id}")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         # Should only have 1 node (the active task)
         assert len(data["nodes"]) == 1
         assert data["nodes"][0]["title"] == "Active Task"
 
-    async def test_get_graph_include_done(self, client: AsyncClient):
+    async def test_get_graph_include_done(self, client: AsyncClient, db: Database):
         """Test including completed tasks in the graph."""
-        # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Include Done Project"}
-        )
-        project_id = project_response.json()["id"]
-
-        # Create task and mark as done
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Done Task"},
-        )
-        task_id = task_response.json()["id"]
-
-        await client.patch(
-            f"/api/tasks/{task_id}",
-            json={"status": "done"},
-        )
+        # Create a done task
+        project_id = await make_project(db, "Include Done Project")
+        await make_task(db, project_id, "Done Task", status=TaskStatus.DONE)
 
         response = await client.get(
             f"/api/graph?project_id={project_id}&include_done=true"
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         assert len(data["nodes"]) == 1
         assert data["nodes"][0]["status"] == "done"
 
-    async def test_get_graph_with_epic(self, client: AsyncClient):
+    async def test_get_graph_with_epic(self, client: AsyncClient, db: Database):
         """Test graph includes epics with correct type."""
         # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Epic Graph Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Epic Graph Project")
 
         # Create epic
         await client.post(
@@ -3824,26 +3056,18 @@ class TestGraphAPI:
         )
 
         response = await client.get(f"/api/graph?project_id={project_id}")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         assert len(data["nodes"]) == 1
         assert data["nodes"][0]["task_type"] == "epic"
 
-    async def test_get_graph_exclude_subtasks(self, client: AsyncClient):
+    async def test_get_graph_exclude_subtasks(self, client: AsyncClient, db: Database):
         """Test excluding subtasks from the graph."""
         # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Subtask Exclude Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Subtask Exclude Project")
 
         # Create parent task
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Parent Task"},
-        )
-        task_id = task_response.json()["id"]
+        task_id = await make_task(db, project_id, "Parent Task")
 
         # Create subtask
         await client.post(
@@ -3859,39 +3083,28 @@ class TestGraphAPI:
         response = await client.get(
             f"/api/graph?project_id={project_id}&include_subtasks=false"
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         # Should only have parent task
         assert len(data["nodes"]) == 1
         assert data["nodes"][0]["title"] == "Parent Task"
 
-    async def test_get_graph_stats_by_status(self, client: AsyncClient):
+    async def test_get_graph_stats_by_status(self, client: AsyncClient, db: Database):
         """Test that graph stats include counts by status."""
         # Create project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Stats Status Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Stats Status Project")
 
         # Create tasks with different statuses
-        await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Draft Task"},
-        )
+        await make_task(db, project_id, "Draft Task")
 
-        task2_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Ready Task"},
-        )
+        task2_id = await make_task(db, project_id, "Ready Task")
         await client.post(
             "/api/queue/enqueue",
-            json={"task_id": task2_response.json()["id"]},
+            json={"task_id": task2_id},
         )
 
         response = await client.get(f"/api/graph?project_id={project_id}")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
 
         assert data["stats"]["total_nodes"] == 2
         assert data["stats"]["status_draft"] >= 1 or data["stats"]["status_ready"] >= 1
@@ -3903,8 +3116,7 @@ class TestUndoAPI:
     async def test_get_history_empty(self, client: AsyncClient):
         """Test getting history when no actions exist."""
         response = await client.get("/api/undo/history")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["actions"] == []
         assert data["can_undo"] is False
         assert data["can_redo"] is False
@@ -3913,43 +3125,31 @@ class TestUndoAPI:
         """Test getting last undoable when nothing to undo."""
         response = await client.get("/api/undo/last")
         assert response.status_code == 200
-        assert response.json() is None
+        assert read_json(response) is None
 
     async def test_undo_nothing(self, client: AsyncClient):
         """Test undo when nothing to undo."""
         response = await client.post("/api/undo")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is False
         assert data["message"] == "Nothing to undo"
 
     async def test_redo_nothing(self, client: AsyncClient):
         """Test redo when nothing to redo."""
         response = await client.post("/api/undo/redo")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is False
         assert data["message"] == "Nothing to redo"
 
     async def test_record_and_undo_task_create(self, client: AsyncClient, app_with_db):
         """Test recording a task creation action and undoing it."""
-        from ringmaster.db.repositories import ActionRepository
-        from ringmaster.domain import Action, ActionType, EntityType
-
         app, db = app_with_db
 
         # Create a project first
-        project_response = await client.post(
-            "/api/projects", json={"name": "Undo Test Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Undo Test Project")
 
         # Create a task
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task to Undo"},
-        )
-        task_id = task_response.json()["id"]
+        task_id = await make_task(db, project_id, "Task to Undo")
 
         # Manually record the action (in real usage, the task API would do this)
         action_repo = ActionRepository(db)
@@ -3972,8 +3172,7 @@ class TestUndoAPI:
 
         # Verify action is in history
         response = await client.get("/api/undo/history")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert len(data["actions"]) == 1
         assert data["can_undo"] is True
         assert data["actions"][0]["action_type"] == "task_created"
@@ -3981,8 +3180,7 @@ class TestUndoAPI:
         # Undo the task creation
         response = await client.post("/api/undo")
 
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is True
         assert data["message"] == "Undone: Task created"
 
@@ -3992,28 +3190,18 @@ class TestUndoAPI:
 
         # Verify history shows action is undone
         response = await client.get("/api/undo/history?include_undone=true")
-        data = response.json()
+        data = read_json(response)
         assert data["actions"][0]["undone"] is True
 
     async def test_undo_and_redo_task_update(self, client: AsyncClient, app_with_db):
         """Test undoing and redoing a task status update."""
-        from ringmaster.db.repositories import ActionRepository
-        from ringmaster.domain import Action, ActionType, EntityType
-
         app, db = app_with_db
 
         # Create a project
-        project_response = await client.post(
-            "/api/projects", json={"name": "Undo Update Project"}
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Undo Update Project")
 
         # Create a task
-        task_response = await client.post(
-            "/api/tasks",
-            json={"project_id": project_id, "title": "Task for Status Change"},
-        )
-        task_id = task_response.json()["id"]
+        task_id = await make_task(db, project_id, "Task for Status Change")
 
         # Change task status to ready
         await client.post("/api/queue/enqueue", json={"task_id": task_id})
@@ -4032,41 +3220,30 @@ class TestUndoAPI:
 
         # Undo the status change
         response = await client.post("/api/undo")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is True
 
         # Verify task is back to draft
         response = await client.get(f"/api/tasks/{task_id}")
-        assert response.json()["status"] == "draft"
+        assert read_json(response)["status"] == "draft"
 
         # Now redo the change
         response = await client.post("/api/undo/redo")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["success"] is True
 
         # Verify task is ready again
         response = await client.get(f"/api/tasks/{task_id}")
-        assert response.json()["status"] == "ready"
+        assert read_json(response)["status"] == "ready"
 
     async def test_history_filtered_by_project(self, client: AsyncClient, app_with_db):
         """Test that history can be filtered by project."""
-        from ringmaster.db.repositories import ActionRepository
-        from ringmaster.domain import Action, ActionType, EntityType
-
         app, db = app_with_db
 
         # Create two projects
-        project1_response = await client.post(
-            "/api/projects", json={"name": "Project 1"}
-        )
-        project1_id = project1_response.json()["id"]
-
-        project2_response = await client.post(
-            "/api/projects", json={"name": "Project 2"}
+        project1_id, project2_id = await asyncio.gather(
+            make_project(db, "Project 1"), make_project(db, "Project 2")
         )
-        project2_id = project2_response.json()["id"]
 
         # Record actions for both projects
         action_repo = ActionRepository(db)
@@ -4091,51 +3268,36 @@ class TestUndoAPI:
 
         # Get history for project 1 only
         response = await client.get(f"/api/undo/history?project_id={project1_id}")
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert len(data["actions"]) == 1
         assert data["actions"][0]["entity_id"] == "task-1"
 
         # Get history for project 2 only
         response = await client.get(f"/api/undo/history?project_id={project2_id}")
-        data = response.json()
+        data = read_json(response)
         assert len(data["actions"]) == 1
         assert data["actions"][0]["entity_id"] == "task-2"
 
         # Get all history (no project filter)
         response = await client.get("/api/undo/history")
-        data = response.json()
+        data = read_json(response)
         assert len(data["actions"]) == 2
 
 
 class TestDecisionsAPI:
     """Tests for the decisions API."""
 
-    async def _create_project_and_task(self, client: AsyncClient):
+    async def _create_project_and_task(self, db: Database):
         """Helper to create a project and task for decision tests."""
-        # Create project
-        response = await client.post(
-            "/api/projects",
-            json={"name": "Decision Test Project"},
-        )
-        project_id = response.json()["id"]
-
-        # Create task
-        response = await client.post(
-            "/api/tasks",
-            json={
-                "project_id": project_id,
-                "title": "Test Task",
-                "description": "A task that may need decisions",
-            },
+        project_id = await make_project(db, "Decision Test Project")
+        task_id = await make_task(
+            db, project_id, "Test Task", description="A task that may need decisions"
         )
-        task_id = response.json()["id"]
-
         return project_id, task_id
 
-    async def test_create_decision(self, client: AsyncClient):
+    async def test_create_decision(self, client: AsyncClient, db: Database):
         """Test creating a decision that blocks a task."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         response = await client.post(
             "/api/decisions",
@@ -4148,8 +3310,7 @@ class TestDecisionsAPI:
                 "recommendation": "PostgreSQL",
             },
         )
-        assert response.status_code == 201
-        data = response.json()
+        data = expect_json(response, 201)
         assert data["question"] == "Should we use PostgreSQL or MySQL?"
         assert data["blocks_id"] == task_id
         assert data["options"] == ["PostgreSQL", "MySQL", "SQLite"]
@@ -4158,11 +3319,11 @@ class TestDecisionsAPI:
 
         # Verify task is now blocked
         task_response = await client.get(f"/api/tasks/{task_id}")
-        assert task_response.json()["status"] == "blocked"
+        assert read_json(task_response)["status"] == "blocked"
 
-    async def test_list_decisions(self, client: AsyncClient):
+    async def test_list_decisions(self, client: AsyncClient, db: Database):
         """Test listing decisions with filters."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         # Create two decisions
         await client.post(
@@ -4186,17 +3347,16 @@ class TestDecisionsAPI:
 
         # List all pending decisions
         response = await client.get(f"/api/decisions?project_id={project_id}")
-        assert response.status_code == 200
-        decisions = response.json()
+        decisions = expect_json(response)
         assert len(decisions) == 2
 
         # List by blocks_id
         response = await client.get(f"/api/decisions?blocks_id={task_id}")
-        assert len(response.json()) == 2
+        assert len(read_json(response)) == 2
 
-    async def test_get_decision(self, client: AsyncClient):
+    async def test_get_decision(self, client: AsyncClient, db: Database):
         """Test getting a specific decision."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         create_response = await client.post(
             "/api/decisions",
@@ -4207,15 +3367,15 @@ class TestDecisionsAPI:
                 "options": ["FastAPI", "Flask"],
             },
         )
-        decision_id = create_response.json()["id"]
+        decision_id = read_json(create_response)["id"]
 
         response = await client.get(f"/api/decisions/{decision_id}")
         assert response.status_code == 200
-        assert response.json()["question"] == "Which framework?"
+        assert read_json(response)["question"] == "Which framework?"
 
-    async def test_resolve_decision(self, client: AsyncClient):
+    async def test_resolve_decision(self, client: AsyncClient, db: Database):
         """Test resolving a decision."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         create_response = await client.post(
             "/api/decisions",
@@ -4226,25 +3386,24 @@ class TestDecisionsAPI:
                 "options": ["AWS", "GCP", "Azure"],
             },
         )
-        decision_id = create_response.json()["id"]
+        decision_id = read_json(create_response)["id"]
 
         # Resolve the decision
         response = await client.post(
             f"/api/decisions/{decision_id}/resolve",
             json={"resolution": "AWS"},
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["resolution"] == "AWS"
         assert data["resolved_at"] is not None
 
         # Verify task is unblocked
         task_response = await client.get(f"/api/tasks/{task_id}")
-        assert task_response.json()["status"] == "ready"
+        assert read_json(task_response)["status"] == "ready"
 
-    async def test_resolve_already_resolved_decision(self, client: AsyncClient):
+    async def test_resolve_already_resolved_decision(self, client: AsyncClient, db: Database):
         """Test that resolving an already resolved decision fails."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         create_response = await client.post(
             "/api/decisions",
@@ -4255,7 +3414,7 @@ class TestDecisionsAPI:
                 "options": ["AWS", "GCP"],
             },
         )
-        decision_id = create_response.json()["id"]
+        decision_id = read_json(create_response)["id"]
 
         # Resolve first time
         await client.post(
@@ -4269,11 +3428,11 @@ class TestDecisionsAPI:
             json={"resolution": "GCP"},
         )
         assert response.status_code == 400
-        assert "already resolved" in response.json()["detail"]
+        assert "already resolved" in read_json(response)["detail"]
 
-    async def test_get_decisions_for_task(self, client: AsyncClient):
+    async def test_get_decisions_for_task(self, client: AsyncClient, db: Database):
         """Test getting decisions blocking a specific task."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         await client.post(
             "/api/decisions",
@@ -4286,11 +3445,11 @@ class TestDecisionsAPI:
 
         response = await client.get(f"/api/decisions/for-task/{task_id}")
         assert response.status_code == 200
-        assert len(response.json()) >= 1
+        assert len(read_json(response)) >= 1
 
-    async def test_decision_stats(self, client: AsyncClient):
+    async def test_decision_stats(self, client: AsyncClient, db: Database):
         """Test getting decision statistics."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         # Create and resolve one decision
         create_response = await client.post(
@@ -4302,7 +3461,7 @@ class TestDecisionsAPI:
             },
         )
         await client.post(
-            f"/api/decisions/{create_response.json()['id']}/resolve",
+            f"/api/decisions/{read_json(create_response)['id']}/resolve",
             json={"resolution": "Yes"},
         )
 
@@ -4317,8 +3476,7 @@ class TestDecisionsAPI:
         )
 
         response = await client.get(f"/api/projects/{project_id}/decisions/stats")
-        assert response.status_code == 200
-        stats = response.json()
+        stats = expect_json(response)
         assert stats["total"] == 2
         assert stats["resolved"] == 1
         assert stats["pending"] == 1
@@ -4327,31 +3485,15 @@ class TestDecisionsAPI:
 class TestQuestionsAPI:
     """Tests for the questions API."""
 
-    async def _create_project_and_task(self, client: AsyncClient):
+    async def _create_project_and_task(self, db: Database):
         """Helper to create a project and task for question tests."""
-        # Create project
-        response = await client.post(
-            "/api/projects",
-            json={"name": "Question Test Project"},
-        )
-        project_id = response.json()["id"]
-
-        # Create task
-        response = await client.post(
-            "/api/tasks",
-            json={
-                "project_id": project_id,
-                "title": "Test Task",
-                "description": "A task with questions",
-            },
-        )
-        task_id = response.json()["id"]
-
+        project_id = await make_project(db, "Question Test Project")
+        task_id = await make_task(db, project_id, "Test Task", description="A task with questions")
         return project_id, task_id
 
-    async def test_create_question(self, client: AsyncClient):
+    async def test_create_question(self, client: AsyncClient, db: Database):
         """Test creating a question."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         response = await client.post(
             "/api/questions",
@@ -4363,17 +3505,16 @@ class TestQuestionsAPI:
                 "default_answer": "ISO 8601",
             },
         )
-        assert response.status_code == 201
-        data = response.json()
+        data = expect_json(response, 201)
         assert data["question"] == "What is the expected date format?"
         assert data["related_id"] == task_id
         assert data["urgency"] == "high"
         assert data["default_answer"] == "ISO 8601"
         assert data["answer"] is None
 
-    async def test_list_questions(self, client: AsyncClient):
+    async def test_list_questions(self, client: AsyncClient, db: Database):
         """Test listing questions with filters."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         # Create questions with different urgency
         await client.post(
@@ -4396,15 +3537,14 @@ class TestQuestionsAPI:
         )
 
         response = await client.get(f"/api/questions?project_id={project_id}")
-        assert response.status_code == 200
-        questions = response.json()
+        questions = expect_json(response)
         assert len(questions) == 2
         # High urgency should come first
         assert questions[0]["urgency"] == "high"
 
-    async def test_get_question(self, client: AsyncClient):
+    async def test_get_question(self, client: AsyncClient, db: Database):
         """Test getting a specific question."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         create_response = await client.post(
             "/api/questions",
@@ -4414,15 +3554,15 @@ class TestQuestionsAPI:
                 "question": "What encoding to use?",
             },
         )
-        question_id = create_response.json()["id"]
+        question_id = read_json(create_response)["id"]
 
         response = await client.get(f"/api/questions/{question_id}")
         assert response.status_code == 200
-        assert response.json()["question"] == "What encoding to use?"
+        assert read_json(response)["question"] == "What encoding to use?"
 
-    async def test_answer_question(self, client: AsyncClient):
+    async def test_answer_question(self, client: AsyncClient, db: Database):
         """Test answering a question."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         create_response = await client.post(
             "/api/questions",
@@ -4432,21 +3572,20 @@ class TestQuestionsAPI:
                 "question": "Max file size limit?",
             },
         )
-        question_id = create_response.json()["id"]
+        question_id = read_json(create_response)["id"]
 
         # Answer the question
         response = await client.post(
             f"/api/questions/{question_id}/answer",
             json={"answer": "10MB"},
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["answer"] == "10MB"
         assert data["answered_at"] is not None
 
-    async def test_answer_already_answered_question(self, client: AsyncClient):
+    async def test_answer_already_answered_question(self, client: AsyncClient, db: Database):
         """Test that answering an already answered question fails."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         create_response = await client.post(
             "/api/questions",
@@ -4456,7 +3595,7 @@ class TestQuestionsAPI:
                 "question": "Max connections?",
             },
         )
-        question_id = create_response.json()["id"]
+        question_id = read_json(create_response)["id"]
 
         # Answer first time
         await client.post(
@@ -4470,11 +3609,11 @@ class TestQuestionsAPI:
             json={"answer": "200"},
         )
         assert response.status_code == 400
-        assert "already answered" in response.json()["detail"]
+        assert "already answered" in read_json(response)["detail"]
 
-    async def test_get_questions_for_task(self, client: AsyncClient):
+    async def test_get_questions_for_task(self, client: AsyncClient, db: Database):
         """Test getting questions related to a specific task."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         await client.post(
             "/api/questions",
@@ -4487,11 +3626,11 @@ class TestQuestionsAPI:
 
         response = await client.get(f"/api/questions/for-task/{task_id}")
         assert response.status_code == 200
-        assert len(response.json()) >= 1
+        assert len(read_json(response)) >= 1
 
-    async def test_question_stats(self, client: AsyncClient):
+    async def test_question_stats(self, client: AsyncClient, db: Database):
         """Test getting question statistics."""
-        project_id, task_id = await self._create_project_and_task(client)
+        project_id, task_id = await self._create_project_and_task(db)
 
         # Create and answer one question
         create_response = await client.post(
@@ -4504,7 +3643,7 @@ class TestQuestionsAPI:
             },
         )
         await client.post(
-            f"/api/questions/{create_response.json()['id']}/answer",
+            f"/api/questions/{read_json(create_response)['id']}/answer",
             json={"answer": "Yes"},
         )
 
@@ -4529,8 +3668,7 @@ class TestQuestionsAPI:
         )
 
         response = await client.get(f"/api/projects/{project_id}/questions/stats")
-        assert response.status_code == 200
-        stats = response.json()
+        stats = expect_json(response)
         assert stats["total"] == 3
         assert stats["answered"] == 1
         assert stats["pending"] == 2
@@ -4542,57 +3680,32 @@ class TestTaskResubmission:
     """Test task resubmission for decomposition."""
 
     async def _create_project_and_task(
-        self, client: AsyncClient, title: str = "Test Task"
+        self, db: Database, title: str = "Test Task"
     ) -> tuple[str, str]:
         """Create a project and task."""
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Resubmit Test Project", "description": "Testing resubmission"},
-        )
-        project_id = project_response.json()["id"]
-
-        task_response = await client.post(
-            "/api/tasks",
-            json={
-                "project_id": project_id,
-                "title": title,
-                "description": "A task description",
-            },
+        project_id = await make_project(
+            db, "Resubmit Test Project", description="Testing resubmission"
         )
-        task_id = task_response.json()["id"]
+        task_id = await make_task(db, project_id, title, description="A task description")
         return project_id, task_id
 
-    async def _create_worker(self, client: AsyncClient) -> str:
-        """Create a test worker."""
-        response = await client.post(
-            "/api/workers",
-            json={
-                "name": "test-worker-resubmit",
-                "type": "claude-code",
-                "command": "claude",
-                "args": ["--print"],
-            },
-        )
-        return response.json()["id"]
-
-    async def test_resubmit_task_basic(self, client: AsyncClient):
+    async def test_resubmit_task_basic(self, client: AsyncClient, db: Database):
         """Test basic task resubmission."""
-        _project_id, task_id = await self._create_project_and_task(client)
+        _project_id, task_id = await self._create_project_and_task(db)
 
         response = await client.post(
             f"/api/tasks/{task_id}/resubmit",
             json={"reason": "Task too complex, multiple components involved"},
         )
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json(response)
         assert data["task_id"] == task_id
         assert "reason" in data
         assert "decomposed" in data
         assert "subtasks_created" in data
 
-    async def test_resubmit_updates_status(self, client: AsyncClient):
+    async def test_resubmit_updates_status(self, client: AsyncClient, db: Database):
         """Test that resubmitting sets status appropriately."""
-        _project_id, task_id = await self._create_project_and_task(client)
+        _project_id, task_id = await self._create_project_and_task(db)
 
         await client.post(
             f"/api/tasks/{task_id}/resubmit",
@@ -4601,17 +3714,22 @@ class TestTaskResubmission:
 
         # Get the task and check status
         task_response = await client.get(f"/api/tasks/{task_id}")
-        task = task_response.json()
+        task = read_json(task_response)
         # Status should be either needs_decomposition or ready (if decomposed)
         assert task["status"] in ["needs_decomposition", "ready"]
 
-    async def test_resubmit_unassigns_worker(self, client: AsyncClient):
+    async def test_resubmit_unassigns_worker(self, client: AsyncClient, db: Database):
         """Test that resubmitting unassigns the worker."""
-        _project_id, task_id = await self._create_project_and_task(client)
-        worker_id = await self._create_worker(client)
+        _project_id, task_id = await self._create_project_and_task(db)
+        worker_id = await make_worker(
+            db,
+            "test-worker-resubmit",
+            **CLAUDE_WORKER,
+            args=["--print"],
+            status=WorkerStatus.IDLE,
+        )
 
-        # Activate and assign worker
-        await client.post(f"/api/workers/{worker_id}/activate")
+        # Assign worker
         await client.post(
             f"/api/tasks/{task_id}/assign",
             json={"worker_id": worker_id},
@@ -4625,13 +3743,13 @@ class TestTaskResubmission:
 
         # Check worker is now idle
         worker_response = await client.get(f"/api/workers/{worker_id}")
-        assert worker_response.json()["status"] == "idle"
+        assert read_json(worker_response)["status"] == "idle"
 
         # Check task is unassigned
         task_response = await client.get(f"/api/tasks/{task_id}")
-        assert task_response.json().get("worker_id") is None
+        assert read_json(task_response).get("worker_id") is None
 
-    async def test_resubmit_large_task_creates_subtasks(self, client: AsyncClient):
+    async def test_resubmit_large_task_creates_subtasks(self, client: AsyncClient, db: Database):
         """Test that a large task gets decomposed into subtasks."""
         # Create a deliberately large task that should trigger decomposition
         large_description = """
@@ -4648,21 +3766,11 @@ class TestTaskResubmission:
         repository, service layer, and various handlers.
         """
 
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Large Task Project", "description": "Testing decomposition"},
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Large Task Project", description="Testing decomposition")
 
-        task_response = await client.post(
-            "/api/tasks",
-            json={
-                "project_id": project_id,
-                "title": "Implement authentication system",
-                "description": large_description,
-            },
+        task_id = await make_task(
+            db, project_id, "Implement authentication system", description=large_description
         )
-        task_id = task_response.json()["id"]
 
         # Resubmit for decomposition
         response = await client.post(
@@ -4670,7 +3778,7 @@ class TestTaskResubmission:
             json={"reason": "Task contains multiple components and concerns"},
         )
 
-        data = response.json()
+        data = read_json(response)
         # The task should either be decomposed or ready
         assert data["status"] in ["needs_decomposition", "ready"]
         # Check if subtasks were created (depends on decomposer heuristics)
@@ -4678,13 +3786,9 @@ class TestTaskResubmission:
         if data["decomposed"]:
             assert data["subtasks_created"] > 0
 
-    async def test_resubmit_epic_fails(self, client: AsyncClient):
+    async def test_resubmit_epic_fails(self, client: AsyncClient, db: Database):
         """Test that epics cannot be resubmitted."""
-        project_response = await client.post(
-            "/api/projects",
-            json={"name": "Epic Test", "description": "Testing epic resubmit"},
-        )
-        project_id = project_response.json()["id"]
+        project_id = await make_project(db, "Epic Test", description="Testing epic resubmit")
 
         epic_response = await client.post(
             "/api/tasks/epics",
@@ -4694,22 +3798,22 @@ class TestTaskResubmission:
                 "description": "An epic",
             },
         )
-        epic_id = epic_response.json()["id"]
+        epic_id = read_json(epic_response)["id"]
 
         response = await client.post(
             f"/api/tasks/{epic_id}/resubmit",
             json={"reason": "Trying to resubmit an epic"},
         )
         assert response.status_code == 400
-        assert "Epics cannot be resubmitted" in response.json()["detail"]
+        assert "Epics cannot be resubmitted" in read_json(response)["detail"]
 
-    async def test_resubmit_subtask_fails(self, client: AsyncClient):
+    async def test_resubmit_subtask_fails(self, client: AsyncClient, db: Database):
         """Test that subtasks cannot be resubmitted."""
-        _project_id, task_id = await self._create_project_and_task(client)
+        _project_id, task_id = await self._create_project_and_task(db)
 
         # Get task to get project_id
         task_response = await client.get(f"/api/tasks/{task_id}")
-        project_id = task_response.json()["project_id"]
+        project_id = read_json(task_response)["project_id"]
 
         # Create a subtask
         subtask_response = await client.post(
@@ -4722,14 +3826,14 @@ class TestTaskResubmission:
                 "task_type": "subtask",
             },
         )
-        subtask_id = subtask_response.json()["id"]
+        subtask_id = read_json(subtask_response)["id"]
 
         response = await client.post(
             f"/api/tasks/{subtask_id}/resubmit",
             json={"reason": "Trying to resubmit a subtask"},
         )
         assert response.status_code == 400
-        assert "Subtasks cannot be resubmitted" in response.json()["detail"]
+        assert "Subtasks cannot be resubmitted" in read_json(response)["detail"]
 
     async def test_resubmit_nonexistent_task_fails(self, client: AsyncClient):
         """Test that resubmitting a nonexistent task fails."""
@@ -4738,4 +3842,4 @@ class TestTaskResubmission:
             json={"reason": "This task does not exist"},
         )
         assert response.status_code == 404
-        assert "Task not found" in response.json()["detail"]
+        assert "Task not found" in read_json(response)["detail"]
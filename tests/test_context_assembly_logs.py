@@ -1,14 +1,14 @@
 """Tests for context assembly logging observability."""
 
-import tempfile
 from collections.abc import AsyncGenerator
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
-from ringmaster.api.app import create_app
 from ringmaster.db import Database
 from ringmaster.db.repositories import (
     ContextAssemblyLogRepository,
@@ -19,18 +19,7 @@ from ringmaster.domain import ContextAssemblyLog, Priority, Project, Task
 from ringmaster.enricher.pipeline import EnrichmentPipeline
 
 
-@pytest.fixture
-async def db():
-    """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        database = Database(db_path)
-        await database.connect()
-        yield database
-        await database.disconnect()
-
-
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="module")
 async def project(db):
     """Create a test project."""
     repo = ProjectRepository(db)
@@ -44,7 +33,7 @@ async def project(db):
     return project
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="module")
 async def task(db, project):
     """Create a test task."""
     repo = TaskRepository(db)
@@ -79,35 +68,36 @@ def context_log(project, task):
 
 
 @pytest.fixture
-def temp_project_dir():
+def temp_project_dir(tmp_path: Path) -> Path:
     """Create a temporary project directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
-@pytest.fixture
-async def app_with_db() -> AsyncGenerator[tuple, None]:
-    """Create an app with a temporary database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        database = Database(db_path)
-        await database.connect()
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def http_client(api_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    """Create one async client for the module's API tests.
 
-        app = create_app()
-        app.state.db = database
+    Async tests and fixtures here run on the module's event loop so the
+    client can outlive a single test.
+    """
+    transport = ASGITransport(app=api_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
-        yield app, database
 
-        await database.disconnect()
+@pytest_asyncio.fixture(loop_scope="module")
+async def app_with_db(api_app: FastAPI, db: Database) -> AsyncGenerator[tuple, None]:
+    """Attach the test database to the shared app, restoring the previous one after."""
+    previous = getattr(api_app.state, "db", None)
+    api_app.state.db = db
+    yield api_app, db
+    api_app.state.db = previous
 
 
 @pytest.fixture
-async def client(app_with_db) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client."""
-    app, _ = app_with_db
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+def client(http_client: AsyncClient, app_with_db) -> AsyncClient:
+    """Return the shared client once the test database is attached."""
+    return http_client
 
 
 class TestContextAssemblyLogModel:
@@ -150,6 +140,7 @@ class TestContextAssemblyLogModel:
         assert log.assembly_time_ms == 0
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestContextAssemblyLogRepository:
     """Tests for ContextAssemblyLogRepository."""
 
@@ -316,6 +307,7 @@ class TestContextAssemblyLogRepository:
         assert deleted >= 0
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestEnrichmentPipelineLogging:
     """Tests for enrichment pipeline context assembly logging."""
 
@@ -374,13 +366,12 @@ class TestEnrichmentPipelineLogging:
         assert logs[0].context_hash == result.context_hash
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestEnricherAPIRoutes:
     """Tests for enricher API endpoints."""
 
-    async def test_get_logs_for_task(self, app_with_db):
+    async def test_get_logs_for_task(self, client: AsyncClient, db):
         """Test getting context logs for a task."""
-        app, db = app_with_db
-
         # Create a project and task
         project_repo = ProjectRepository(db)
         project = Project(id=uuid4(), name="Test Project")
@@ -401,19 +392,15 @@ class TestEnricherAPIRoutes:
             )
             await repo.create(log)
 
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(f"/api/enricher/for-task/{task.id}")
-            assert response.status_code == 200
+        response = await client.get(f"/api/enricher/for-task/{task.id}")
+        assert response.status_code == 200
 
-            data = response.json()
-            assert len(data) == 3
-            assert data[0]["task_id"] == task.id
+        data = response.json()
+        assert len(data) == 3
+        assert data[0]["task_id"] == task.id
 
-    async def test_get_logs_for_project(self, app_with_db):
+    async def test_get_logs_for_project(self, client: AsyncClient, db):
         """Test getting context logs for a project."""
-        app, db = app_with_db
-
         project_repo = ProjectRepository(db)
         project = Project(id=uuid4(), name="Test Project")
         await project_repo.create(project)
@@ -428,18 +415,14 @@ class TestEnricherAPIRoutes:
             )
             await repo.create(log)
 
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(f"/api/enricher/for-project/{project.id}")
-            assert response.status_code == 200
+        response = await client.get(f"/api/enricher/for-project/{project.id}")
+        assert response.status_code == 200
 
-            data = response.json()
-            assert len(data) == 5
+        data = response.json()
+        assert len(data) == 5
 
-    async def test_get_stats(self, app_with_db):
+    async def test_get_stats(self, client: AsyncClient, db):
         """Test getting context assembly stats."""
-        app, db = app_with_db
-
         project_repo = ProjectRepository(db)
         project = Project(id=uuid4(), name="Test Project")
         await project_repo.create(project)
@@ -456,19 +439,15 @@ class TestEnricherAPIRoutes:
             )
             await repo.create(log)
 
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(f"/api/enricher/stats/{project.id}")
-            assert response.status_code == 200
+        response = await client.get(f"/api/enricher/stats/{project.id}")
+        assert response.status_code == 200
 
-            data = response.json()
-            assert data["total_assemblies"] == 3
-            assert data["avg_tokens_used"] == 2000.0
+        data = response.json()
+        assert data["total_assemblies"] == 3
+        assert data["avg_tokens_used"] == 2000.0
 
-    async def test_get_budget_alerts(self, app_with_db):
+    async def test_get_budget_alerts(self, client: AsyncClient, db):
         """Test getting budget utilization alerts."""
-        app, db = app_with_db
-
         project_repo = ProjectRepository(db)
         project = Project(id=uuid4(), name="Test Project")
         await project_repo.create(project)
@@ -484,22 +463,18 @@ class TestEnricherAPIRoutes:
         )
         await repo.create(log)
 
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(
-                f"/api/enricher/budget-alerts/{project.id}",
-                params={"threshold": 0.95},
-            )
-            assert response.status_code == 200
+        response = await client.get(
+            f"/api/enricher/budget-alerts/{project.id}",
+            params={"threshold": 0.95},
+        )
+        assert response.status_code == 200
 
-            data = response.json()
-            assert len(data) == 1
-            assert data[0]["tokens_used"] == 9900
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["tokens_used"] == 9900
 
-    async def test_get_single_log(self, app_with_db):
+    async def test_get_single_log(self, client: AsyncClient, db):
         """Test getting a single log by ID."""
-        app, db = app_with_db
-
         project_repo = ProjectRepository(db)
         project = Project(id=uuid4(), name="Test Project")
         await project_repo.create(project)
@@ -514,27 +489,20 @@ class TestEnricherAPIRoutes:
         )
         created = await repo.create(log)
 
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get(f"/api/enricher/{created.id}")
-            assert response.status_code == 200
+        response = await client.get(f"/api/enricher/{created.id}")
+        assert response.status_code == 200
 
-            data = response.json()
-            assert data["id"] == created.id
-            assert data["tokens_used"] == 5000
+        data = response.json()
+        assert data["id"] == created.id
+        assert data["tokens_used"] == 5000
 
-    async def test_get_nonexistent_log(self, app_with_db):
+    async def test_get_nonexistent_log(self, client: AsyncClient):
         """Test getting a nonexistent log returns 404."""
-        app, _ = app_with_db
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/api/enricher/99999")
-            assert response.status_code == 404
+        response = await client.get("/api/enricher/99999")
+        assert response.status_code == 404
 
-    async def test_cleanup_old_logs(self, app_with_db):
+    async def test_cleanup_old_logs(self, client: AsyncClient, db):
         """Test cleanup endpoint."""
-        app, db = app_with_db
-
         project_repo = ProjectRepository(db)
         project = Project(id=uuid4(), name="Test Project")
         await project_repo.create(project)
@@ -548,10 +516,8 @@ class TestEnricherAPIRoutes:
         )
         await repo.create(log)
 
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.delete("/api/enricher/cleanup", params={"days": 30})
-            assert response.status_code == 200
+        response = await client.delete("/api/enricher/cleanup", params={"days": 30})
+        assert response.status_code == 200
 
-            data = response.json()
-            assert "deleted" in data
+        data = response.json()
+        assert "deleted" in data
@@ -1,7 +1,5 @@
 """Tests for the bead creator service."""
 
-import tempfile
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
@@ -17,7 +15,6 @@ from ringmaster.creator import (
 )
 from ringmaster.creator.parser import ActionType
 from ringmaster.db import ProjectRepository
-from ringmaster.db.connection import Database
 from ringmaster.domain import Priority, Project, Task
 
 
@@ -268,16 +265,6 @@ class TestMatcher:
 class TestBeadCreatorService:
     """Integration tests for the bead creator service."""
 
-    @pytest.fixture
-    async def db(self):
-        """Create a test database."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            db = Database(db_path)
-            await db.connect()
-            yield db
-            await db.disconnect()
-
     @pytest.fixture
     async def project(self, db) -> Project:
         """Create a test project."""
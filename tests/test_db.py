@@ -10,17 +10,42 @@ from ringmaster.db.repositories import ProjectRepository, TaskRepository, Worker
 from ringmaster.domain import Priority, Project, Task, Worker
 
 
-@pytest.fixture
-async def db():
-    """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        database = Database(db_path)
-        await database.connect()
-        yield database
+@pytest.mark.asyncio
+async def test_non_durable_pragmas(tmp_path: Path):
+    """Test that non-durable databases skip the on-disk journal and fsyncs."""
+    database = Database(tmp_path / "test.db", durable=False)
+    await database.connect()
+    try:
+        row = await database.fetchone("PRAGMA journal_mode")
+        assert row[0] == "memory"
+        row = await database.fetchone("PRAGMA synchronous")
+        assert row[0] == 0
+    finally:
         await database.disconnect()
 
 
+@pytest.mark.asyncio
+async def test_template_copies_migrated_schema(schema_template):
+    """Test that a templated database starts from, but does not write to, the template."""
+    database = Database(":memory:", durable=False, template=schema_template)
+    await database.connect()
+    try:
+        rows = await database.fetchall("SELECT version FROM _migrations")
+        copied_versions = [row[0] for row in rows]
+        await ProjectRepository(database).create(Project(name="Only in the copy"))
+    finally:
+        await database.disconnect()
+
+    template = Database(schema_template)
+    await template.connect()
+    try:
+        rows = await template.fetchall("SELECT version FROM _migrations")
+        assert copied_versions == [row[0] for row in rows]
+        assert await ProjectRepository(template).list() == []
+    finally:
+        await template.disconnect()
+
+
 @pytest.mark.asyncio
 async def test_project_crud(db):
     """Test project CRUD operations."""
@@ -8,7 +8,6 @@ Per PROGRESS.md functional gap #2: "Enrichment Pipeline Real-World Testing"
 """
 
 import tempfile
-from collections.abc import AsyncGenerator
 from pathlib import Path
 from uuid import uuid4
 
@@ -19,17 +18,6 @@ from ringmaster.domain import Priority, Project, Task, TaskStatus, TaskType
 from ringmaster.enricher.pipeline import AssembledPrompt, EnrichmentPipeline
 
 
-@pytest.fixture
-async def db() -> AsyncGenerator[Database, None]:
-    """Create an in-memory database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        db = Database(str(db_path))
-        await db.connect()
-        yield db
-        await db.disconnect()
-
-
 @pytest.fixture
 def realistic_project():
     """Create a realistic project structure with multiple file types.
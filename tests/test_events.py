@@ -81,6 +81,19 @@ async def test_multiple_subscribers(event_bus_fixture: EventBus) -> None:
         assert received.data["count"] == 5
 
 
+async def test_publish_many_preserves_order(event_bus_fixture: EventBus) -> None:
+    """Test that a batch reaches subscribers and callbacks in order."""
+    queue = await event_bus_fixture.subscribe("batch-sub")
+    received_events: list[Event] = []
+    event_bus_fixture.add_callback(received_events.append)
+
+    events = [Event(type=EventType.LOG_CREATED, data={"id": i}) for i in range(3)]
+    await event_bus_fixture.publish_many(events)
+
+    assert [queue.get_nowait().data["id"] for _ in events] == [0, 1, 2]
+    assert [event.data["id"] for event in received_events] == [0, 1, 2]
+
+
 async def test_callback_execution(event_bus_fixture: EventBus) -> None:
     """Test that callbacks are called for events."""
     received_events: list[Event] = []
@@ -107,6 +120,22 @@ async def test_callback_execution(event_bus_fixture: EventBus) -> None:
     assert len(received_events) == 1
 
 
+async def test_typed_callback(event_bus_fixture: EventBus) -> None:
+    """Test that a callback registered for event types only sees those types."""
+    received_events: list[Event] = []
+    event_bus_fixture.add_callback(received_events.append, [EventType.LOG_CREATED])
+
+    await event_bus_fixture.emit(EventType.TASK_CREATED)
+    await event_bus_fixture.emit(EventType.LOG_CREATED, data={"id": 1})
+
+    assert [event.type for event in received_events] == [EventType.LOG_CREATED]
+
+    event_bus_fixture.remove_callback(received_events.append)
+    await event_bus_fixture.emit(EventType.LOG_CREATED, data={"id": 2})
+
+    assert len(received_events) == 1
+
+
 async def test_async_callback(event_bus_fixture: EventBus) -> None:
     """Test that async callbacks work correctly."""
     received: list[Event] = []
@@ -118,11 +147,31 @@ async def test_async_callback(event_bus_fixture: EventBus) -> None:
     event_bus_fixture.add_callback(async_callback)
 
     await event_bus_fixture.emit(EventType.TASK_COMPLETED, data={"success": True})
+    await event_bus_fixture.flush()
 
     assert len(received) == 1
     assert received[0].data["success"] is True
 
 
+async def test_async_callback_does_not_block_publish(event_bus_fixture: EventBus) -> None:
+    """Test that publish returns before a slow async callback finishes."""
+    release = asyncio.Event()
+    received: list[Event] = []
+
+    async def slow_callback(event: Event) -> None:
+        await release.wait()
+        received.append(event)
+
+    event_bus_fixture.add_callback(slow_callback)
+
+    await asyncio.wait_for(event_bus_fixture.emit(EventType.TASK_CREATED), timeout=1)
+    assert received == []
+
+    release.set()
+    await event_bus_fixture.flush()
+    assert [event.type for event in received] == [EventType.TASK_CREATED]
+
+
 def test_event_to_json() -> None:
     """Test Event serialization to JSON."""
     event = Event(
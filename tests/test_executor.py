@@ -8,24 +8,12 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from ringmaster.db.connection import Database
 from ringmaster.db.repositories import ProjectRepository, TaskRepository, WorkerRepository
 from ringmaster.domain import Priority, Project, Task, TaskStatus, Worker, WorkerStatus
 from ringmaster.enricher import EnrichmentPipeline
 from ringmaster.worker.executor import WorkerExecutor
 
 
-@pytest.fixture
-async def db():
-    """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        database = Database(db_path)
-        await database.connect()
-        yield database
-        await database.disconnect()
-
-
 @pytest.fixture
 async def project(db):
     """Create a test project."""
@@ -14,7 +14,7 @@ from uuid import uuid4
 
 import pytest
 
-from ringmaster.db import Database, ProjectRepository, TaskRepository, WorkerRepository
+from ringmaster.db import ProjectRepository, TaskRepository, WorkerRepository
 from ringmaster.domain import Project, Task, TaskStatus, Worker, WorkerStatus
 from ringmaster.events import EventBus, EventType
 from ringmaster.reload import FileChangeWatcher, HotReloader
@@ -168,16 +168,6 @@ testpaths = ["tests"]
     }
 
 
-@pytest.fixture
-async def flywheel_db(tmp_path: Path):
-    """Create and initialize a database for flywheel testing."""
-    db = Database(tmp_path / "flywheel_test.db")
-    await db.connect()  # This automatically runs migrations
-
-    yield db
-    await db.disconnect()
-
-
 class TestFlywheelIntegration:
     """Integration tests for the self-improvement flywheel."""
 
@@ -292,10 +282,9 @@ def test_will_fail():
         assert "failed" in output.lower() or "FAILED" in output
 
     @pytest.mark.asyncio
-    async def test_event_emission_on_reload(self, flywheel_project, flywheel_db):
+    async def test_event_emission_on_reload(self, flywheel_project, db):
         """Scheduler emits SCHEDULER_RELOAD events."""
         project = flywheel_project
-        db = flywheel_db
 
         # Set up event bus to capture events
         event_bus = EventBus()
@@ -365,10 +354,9 @@ class TestFlywheelWithMockWorker:
     """Tests using mock worker to simulate the full flywheel cycle."""
 
     @pytest.mark.asyncio
-    async def test_full_flywheel_cycle(self, flywheel_project, flywheel_db):
+    async def test_full_flywheel_cycle(self, flywheel_project, db):
         """Complete flywheel: task -> worker -> change detection -> test -> reload."""
         project = flywheel_project
-        db = flywheel_db
 
         # Create project in database
         project_repo = ProjectRepository(db)
@@ -473,12 +461,9 @@ def test_new_value():
             f"Expected SUCCESS but got {result.status}: {result.error_message}"
 
     @pytest.mark.asyncio
-    async def test_scheduler_status_includes_reload_history(
-        self, flywheel_project, flywheel_db
-    ):
+    async def test_scheduler_status_includes_reload_history(self, flywheel_project, db):
         """Scheduler status includes hot-reload history after processing."""
         project = flywheel_project
-        db = flywheel_db
 
         scheduler = Scheduler(
             db=db,
@@ -5,9 +5,9 @@ from collections.abc import AsyncGenerator
 from pathlib import Path
 
 import pytest
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
-from ringmaster.api.app import create_app
 from ringmaster.db.connection import Database
 from ringmaster.domain import Project
 from ringmaster.git import (
@@ -179,8 +179,8 @@ class TestGitOperations:
 
 
 @pytest.fixture
-async def app_with_git_project() -> AsyncGenerator[tuple, None]:
-    """Create an app with a temporary database and git repository."""
+async def app_with_git_project(api_app: FastAPI) -> AsyncGenerator[tuple, None]:
+    """Attach a temporary database and git repository to the shared app."""
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpdir_path = Path(tmpdir)
         db_path = tmpdir_path / "test.db"
@@ -219,12 +219,13 @@ async def app_with_git_project() -> AsyncGenerator[tuple, None]:
         db = Database(db_path)
         await db.connect()
 
-        # Create app
-        app = create_app()
-        app.state.db = db
+        # Attach it to the shared app
+        previous = getattr(api_app.state, "db", None)
+        api_app.state.db = db
 
-        yield app, db, repo_path
+        yield api_app, db, repo_path
 
+        api_app.state.db = previous
         await db.disconnect()
 
 
@@ -7,30 +7,16 @@ Based on docs/04-context-enrichment.md section 6:
 """
 
 import json
-import tempfile
 from datetime import UTC, datetime
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
 
-from ringmaster.db import Database
 from ringmaster.db.repositories import ProjectRepository, TaskRepository
 from ringmaster.domain import Priority, Project, Task, TaskStatus, TaskType
 from ringmaster.enricher.stages import LogsContextStage
 
 
-@pytest.fixture
-async def db():
-    """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        database = Database(db_path)
-        await database.connect()
-        yield database
-        await database.disconnect()
-
-
 @pytest.fixture
 async def project(db):
     """Create a test project in the database."""
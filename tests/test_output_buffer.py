@@ -25,6 +25,22 @@ class TestWorkerOutputBuffer:
         assert lines[0].line == "Hello world"
         assert lines[0].line_number == 1
 
+    async def test_write_many_numbers_lines_in_order(self):
+        """Test that a batch write numbers lines in order and reaches subscribers."""
+        buffer = WorkerOutputBuffer(max_lines=10)
+        await buffer.write("worker-1", "First")
+        queue = await buffer.subscribe("worker-1", "sub-1")
+
+        await buffer.write_many("worker-1", ["Second", "Third"])
+
+        lines = await buffer.get_recent("worker-1")
+        assert [(ln.line, ln.line_number) for ln in lines] == [
+            ("First", 1),
+            ("Second", 2),
+            ("Third", 3),
+        ]
+        assert [queue.get_nowait().line for _ in range(queue.qsize())] == ["Second", "Third"]
+
     async def test_subscriber_overflow_logging(self):
         """Test that overflow warnings are logged when subscriber queue is full."""
         buffer = WorkerOutputBuffer(max_lines=10)
@@ -1,11 +1,7 @@
 """Tests for priority calculation and inheritance."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
-from ringmaster.db.connection import Database
 from ringmaster.db.repositories import ProjectRepository, TaskRepository
 from ringmaster.domain import Dependency, Priority, Project, Task, TaskStatus
 from ringmaster.queue.priority import PriorityCalculator
@@ -16,17 +12,6 @@ def make_dependency(child_id: str, parent_id: str) -> Dependency:
     return Dependency(child_id=child_id, parent_id=parent_id)
 
 
-@pytest.fixture
-async def db():
-    """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        database = Database(db_path)
-        await database.connect()
-        yield database
-        await database.disconnect()
-
-
 @pytest.fixture
 async def project(db):
     """Create a test project."""
@@ -1,7 +1,5 @@
 """Tests for the Reasoning Bank (task outcomes for reflexion-based learning)."""
 
-import tempfile
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
@@ -11,17 +9,6 @@ from ringmaster.db.repositories import ReasoningBankRepository
 from ringmaster.domain import TaskOutcome
 
 
-@pytest.fixture
-async def db():
-    """Create a test database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        database = Database(db_path)
-        await database.connect()
-        yield database
-        await database.disconnect()
-
-
 @pytest.fixture
 async def repo(db: Database):
     """Create a reasoning bank repository."""
@@ -1,12 +1,10 @@
 """Tests for RLM summarization."""
 
-import tempfile
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
 
-from ringmaster.db import ChatRepository, Database, ProjectRepository
+from ringmaster.db import ChatRepository, ProjectRepository
 from ringmaster.domain import ChatMessage, Project, Summary
 from ringmaster.enricher.rlm import (
     CompressionConfig,
@@ -14,17 +12,6 @@ from ringmaster.enricher.rlm import (
 )
 
 
-@pytest.fixture
-async def db():
-    """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        database = Database(db_path)
-        await database.connect()
-        yield database
-        await database.disconnect()
-
-
 @pytest.fixture
 async def chat_repo(db):
     """Create a chat repository."""
@@ -377,20 +377,6 @@ class TestGenerateSuccessReflection:
         assert "2 iterations" in reflection
 
 
-@pytest.fixture
-async def db():
-    """Create a test database."""
-    import tempfile
-    from pathlib import Path as PathLib
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = PathLib(tmpdir) / "test.db"
-        database = Database(db_path)
-        await database.connect()
-        yield database
-        await database.disconnect()
-
-
 @pytest.fixture
 async def reasoning_bank(db: Database):
     """Create a reasoning bank repository."""
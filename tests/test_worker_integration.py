@@ -12,7 +12,6 @@ from unittest.mock import patch
 
 import pytest
 
-from ringmaster.db.connection import Database
 from ringmaster.db.repositories import ProjectRepository, TaskRepository, WorkerRepository
 from ringmaster.domain import Priority, Project, Task, TaskStatus, Worker, WorkerStatus
 from ringmaster.scheduler.manager import Scheduler
@@ -118,17 +117,6 @@ class MockSessionHandle:
         )
 
 
-@pytest.fixture
-async def db():
-    """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        database = Database(db_path)
-        await database.connect()
-        yield database
-        await database.disconnect()
-
-
 @pytest.fixture
 async def project(db):
     """Create a test project."""